@@ -13,6 +13,7 @@ from lxml.etree import CDATA
 from markuplift import XmlFormatter
 from markuplift.predicates import tag_in
 from markuplift.types import TextContent
+from markuplift.utilities import cdata_text
 
 
 def create_cdata_for_scripts():
@@ -64,7 +65,7 @@ def singledispatch_cdata_example():
     @process_code_content.register
     def _(content: CDATA, formatter, level: int) -> CDATA:
         """Process existing CDATA content."""
-        inner_content = str(content)  # Extract content via temporary element
+        inner_content = cdata_text(content)  # str() would give the object repr
         return CDATA(f"// CDATA processed\n{inner_content}")
 
     # Test with both string and CDATA input
@@ -96,6 +96,7 @@ from .predicates import (
     is_comment,
     is_element,
     is_processing_instruction,
+    matches_any_xpath,
     matches_xpath,
     never_match,
     never_matches,
@@ -163,6 +164,7 @@ __all__ = [
     "is_comment",
     "is_element",
     "is_processing_instruction",
+    "matches_any_xpath",
     "matches_xpath",
     "NameMatcher",
     "never_match",
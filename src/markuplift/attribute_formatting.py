@@ -11,8 +11,10 @@ user-defined custom formatters, without conflicts or coordination issues.
 """
 
 from abc import ABC, abstractmethod
+from functools import cache
 from graphlib import TopologicalSorter, CycleError
 import re
+import sys
 from typing import Dict, Any, Sequence, Callable
 from lxml import etree
 
@@ -297,7 +299,7 @@ class CssFormatter:
     1. Parse CSS properties from the input string
     2. Apply property-level transformers (can add/remove/modify properties)
     3. Apply list-level reorderers (reorder the property list)
-    4. Apply wrapping logic based on the wrap_when predicate
+    4. Apply wrapping logic based on the wrap_when predicate or wrap_when_more_than threshold
     5. Format and return the result
 
     Examples:
@@ -328,6 +330,7 @@ class CssFormatter:
         self._property_transformers: list[CssPropertyTransformer] = []
         self._reorderers: list[CssPropertyReorderer] = []
         self._wrap_predicate: Callable[[Sequence[str]], bool] | None = None
+        self._wrap_threshold: int | None = None
 
     def transform_properties(self, *transformers: CssPropertyTransformer) -> "CssFormatter":
         """Add property-level transformers for modifying individual CSS properties.
@@ -400,6 +403,27 @@ class CssFormatter:
             >>> css_formatter().wrap_when(lambda props: False)
         """
         self._wrap_predicate = predicate
+        self._wrap_threshold = None
+        return self
+
+    def wrap_when_more_than(self, count: int) -> "CssFormatter":
+        """Wrap properties on separate lines when there are more than count of them.
+
+        Equivalent to ``wrap_when(lambda props: len(props) > count)``, but compares
+        the property count directly instead of calling a predicate for each value.
+
+        Args:
+            count: Wrap when the number of properties exceeds this value
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> # Wrap when more than 3 properties
+            >>> css_formatter().wrap_when_more_than(3)
+        """
+        self._wrap_threshold = count
+        self._wrap_predicate = None
         return self
 
     def __call__(self, value: str, formatter: Any, level: int) -> str:
@@ -449,7 +473,12 @@ class CssFormatter:
             properties = list(reorderer(properties))
 
         # Determine wrapping
-        should_wrap = self._wrap_predicate(properties) if self._wrap_predicate else False
+        if self._wrap_threshold is not None:
+            should_wrap = len(properties) > self._wrap_threshold
+        elif self._wrap_predicate:
+            should_wrap = self._wrap_predicate(properties)
+        else:
+            should_wrap = False
 
         if not should_wrap:
             # Inline format
@@ -460,8 +489,10 @@ class CssFormatter:
         # Closing quote aligns with the attribute itself
         closing_indent = formatter.one_indent * level
 
-        formatted_props = [f"\n{property_indent}{prop};" for prop in properties]
-        return "".join(formatted_props) + f"\n{closing_indent}"
+        if not properties:
+            return f"\n{closing_indent}"
+        separator = f";\n{property_indent}"
+        return f"\n{property_indent}{separator.join(properties)};\n{closing_indent}"
 
 
 def css_formatter() -> CssFormatter:
@@ -634,6 +665,98 @@ def defer_css_properties(*trailing_names: str) -> CssPropertyReorderer:
     return reorderer
 
 
+# Semantic categories used by css_property_order(), in output order
+_CSS_PROPERTY_GROUPS = [
+    ["display", "position", "top", "right", "bottom", "left", "float", "clear", "z-index"],
+    ["width", "height", "margin", "padding", "border", "box-sizing"],
+    [
+        "font",
+        "font-family",
+        "font-size",
+        "font-weight",
+        "line-height",
+        "color",
+        "text-align",
+        "text-decoration",
+    ],
+    [
+        "background",
+        "background-color",
+        "background-image",
+        "background-size",
+        "background-position",
+        "box-shadow",
+        "opacity",
+    ],
+    ["transition", "transform", "animation"],
+]
+
+# Property names are interned, here and when parsing declarations, so rank lookups
+# can succeed on identity. Interned names live for the process lifetime, which is
+# acceptable given the small, finite vocabulary of CSS property names.
+_CSS_PROPERTY_RANK = {sys.intern(prop): i for i, group in enumerate(_CSS_PROPERTY_GROUPS) for prop in group}
+_CSS_DEFAULT_RANK = len(_CSS_PROPERTY_GROUPS)
+
+_CSS_VAR_REF_PATTERN = re.compile(r"var\(\s*(--[\w-]+)")
+
+
+class _CssDeclarationBatch:
+    """CSS declarations held as parallel lists of names, values and category ranks.
+
+    Ranks are looked up once per declaration, and sorting compares plain
+    (int, str) keys through an index permutation rather than shuffling
+    (name, value) pairs.
+    """
+
+    __slots__ = ("names", "values", "ranks")
+
+    def __init__(self, declarations: Dict[str, str]):
+        """Initialize a batch from a name to value mapping.
+
+        Args:
+            declarations: CSS property names mapped to their values
+        """
+        self.names = list(declarations)
+        self.values = list(declarations.values())
+        self.ranks = [_CSS_PROPERTY_RANK.get(name, _CSS_DEFAULT_RANK) for name in self.names]
+
+    def sorted_order(self) -> list[int]:
+        """Return the indices of the declarations in (rank, name) order.
+
+        The sort is stable, so declarations with equal keys keep their input order.
+        """
+        names = self.names
+        ranks = self.ranks
+        return sorted(range(len(names)), key=lambda i: (ranks[i], names[i]))
+
+    def is_serialized_in_order(self, properties: Sequence[str]) -> bool:
+        """Check whether properties already are this batch, serialized in sorted order.
+
+        Every property must be a distinct, well-formed "name: value" string and the
+        (rank, name) keys must be non-decreasing, in which case sorting and
+        re-serializing would reproduce properties exactly.
+
+        Args:
+            properties: The property strings the batch was parsed from
+
+        Returns:
+            True if the sorted, serialized batch would equal properties
+        """
+        if len(self.names) != len(properties):
+            # Malformed or duplicate properties are dropped by reordering
+            return False
+        previous_key: tuple[int, str] | None = None
+        for prop, name, value, rank in zip(properties, self.names, self.values, self.ranks):
+            if prop != f"{name}: {value}":
+                return False
+            key = (rank, name)
+            if previous_key is not None and key < previous_key:
+                return False
+            previous_key = key
+        return True
+
+
+@cache
 def css_property_order() -> CssPropertyReorderer:
     """Order CSS properties with topologically sorted CSS variables first, then semantic ordering.
 
@@ -657,7 +780,8 @@ def css_property_order() -> CssPropertyReorderer:
 
     Returns:
         A CssPropertyReorderer that orders properties with variables first (dependency-sorted),
-        followed by normal properties in semantic order.
+        followed by normal properties in semantic order. The reorderer is stateless, so the
+        same instance is returned on every call.
 
     Example:
         >>> from markuplift import Html5Formatter, css_formatter
@@ -679,25 +803,27 @@ def css_property_order() -> CssPropertyReorderer:
     """
 
     def reorderer(properties: Sequence[str]) -> Sequence[str]:
-        # Parse "name: value" strings into dict
-        props_dict: Dict[str, str] = {}
+        # --- Step 1: Parse "name: value" strings, separating custom and normal properties ---
+        custom_props: Dict[str, str] = {}
+        normal_props: Dict[str, str] = {}
         for prop in properties:
-            if ":" in prop:
-                # Handle CSS variables which have "--" at the start
-                parts = prop.split(":", 1)
-                if len(parts) == 2:
-                    name = parts[0].strip()
-                    value = parts[1].strip()
-                    props_dict[name] = value
-            # Skip malformed properties (no colon)
-
-        # --- Step 1: Separate custom properties and normal properties ---
-        custom_props = {k: v for k, v in props_dict.items() if k.startswith("--")}
-        normal_props = {k: v for k, v in props_dict.items() if not k.startswith("--")}
+            name, colon, value = prop.partition(":")
+            if not colon:
+                # Skip malformed properties (no colon)
+                continue
+            name = sys.intern(name.strip())
+            # CSS variables have "--" at the start
+            target = custom_props if name.startswith("--") else normal_props
+            target[name] = value.strip()
+
+        batch = _CssDeclarationBatch(normal_props)
+        if not custom_props and batch.is_serialized_in_order(properties):
+            # Already ordered and already in canonical "name: value" form, so
+            # sorting and re-serializing would reproduce the input exactly.
+            return properties
 
         # --- Step 2: Build dependency graph for custom properties ---
         dep_graph: Dict[str, set[str]] = {}
-        var_ref_pattern = re.compile(r"var\(\s*(--[\w-]+)")
 
         # Initialize all custom properties in the graph (even with no dependencies)
         for k in custom_props:
@@ -705,7 +831,7 @@ def css_property_order() -> CssPropertyReorderer:
 
         # Add dependencies
         for k, v in custom_props.items():
-            deps = var_ref_pattern.findall(v)
+            deps = _CSS_VAR_REF_PATTERN.findall(v)
             for d in deps:
                 if d in custom_props:  # only include dependencies among defined vars
                     dep_graph[k].add(d)
@@ -719,34 +845,7 @@ def css_property_order() -> CssPropertyReorderer:
             sorted_vars = list(custom_props.items())
 
         # --- Step 4: Order normal properties by semantic categories ---
-        order_groups = [
-            ["display", "position", "top", "right", "bottom", "left", "float", "clear", "z-index"],
-            ["width", "height", "margin", "padding", "border", "box-sizing"],
-            [
-                "font",
-                "font-family",
-                "font-size",
-                "font-weight",
-                "line-height",
-                "color",
-                "text-align",
-                "text-decoration",
-            ],
-            [
-                "background",
-                "background-color",
-                "background-image",
-                "background-size",
-                "background-position",
-                "box-shadow",
-                "opacity",
-            ],
-            ["transition", "transform", "animation"],
-        ]
-        priority = {prop: i for i, group in enumerate(order_groups) for prop in group}
-        default_priority = len(order_groups)
-
-        sorted_normal = sorted(normal_props.items(), key=lambda kv: (priority.get(kv[0], default_priority), kv[0]))
+        sorted_normal = [(batch.names[i], batch.values[i]) for i in batch.sorted_order()]
 
         # --- Step 5: Concatenate and convert back to "name: value" format ---
         ordered_tuples = sorted_vars + sorted_normal
@@ -805,8 +904,8 @@ def wrap_css_properties(*reorderers: CssPropertyReorderer, when_more_than: int =
     if reorderers:
         css_fmt = css_fmt.reorder(*reorderers)
 
-    # Set wrapping predicate
-    css_fmt = css_fmt.wrap_when(lambda props: len(props) > when_more_than)
+    # Set wrapping threshold
+    css_fmt = css_fmt.wrap_when_more_than(when_more_than)
 
     return css_fmt
 
@@ -844,8 +943,8 @@ def reorder_css_properties(*reorderers: CssPropertyReorderer) -> AttributeValueF
         >>> formatter.format_str(html)
         # Output: <div style="display: flex; position: relative; color: red;">
     """
-    # Build CssFormatter that never wraps (always inline)
-    css_fmt = css_formatter().reorder(*reorderers).wrap_when(lambda props: False)
+    # Build CssFormatter that never wraps (always inline, the default)
+    css_fmt = css_formatter().reorder(*reorderers)
     return css_fmt
 
 
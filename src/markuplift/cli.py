@@ -8,6 +8,7 @@ The CLI uses ElementPredicateFactory functions from the predicates module to cre
 optimized formatting rules based on XPath expressions provided by the user.
 """
 
+import shutil
 import subprocess
 from typing import TYPE_CHECKING
 
@@ -20,7 +21,7 @@ from lxml import etree
 from markuplift.formatter import Formatter
 from markuplift.html5_formatter import Html5Formatter
 from markuplift.xml_formatter import XmlFormatter
-from markuplift.predicates import matches_xpath, PredicateError
+from markuplift.predicates import matches_any_xpath, matches_xpath, PredicateError
 from markuplift.types import ElementType, TextContentFormatter, ElementPredicateFactory
 
 
@@ -127,16 +128,10 @@ def format(
             if not xpath_list:
                 return None
             try:
-                factories = [matches_xpath(xpath) for xpath in xpath_list]
+                return matches_any_xpath(*xpath_list)
             except PredicateError as e:
                 raise click.ClickException(str(e))
 
-            def combined_factory(root):
-                predicates = [factory(root) for factory in factories]
-                return lambda e: any(pred(e) for pred in predicates)
-
-            return combined_factory
-
         # Create text formatter factories from external programs
         text_formatter_factories: dict[ElementPredicateFactory, TextContentFormatter] = {}
         for xpath_expr, command in text_formatter:
@@ -146,11 +141,17 @@ def format(
                 raise click.ClickException(str(e))
 
             def create_formatter(cmd=command) -> TextContentFormatter:  # Capture command in closure
+                # Look the program up once, so a missing one costs no process spawn per text node
+                cmd_parts = cmd.split()
+                program_missing = bool(cmd_parts) and shutil.which(cmd_parts[0]) is None
+
                 def formatter_func(text: str, doc_formatter: "DocumentFormatter", physical_level: int) -> str:
                     if not text.strip():
                         return text
+                    if program_missing:
+                        click.echo(f"Warning: External formatter command '{cmd_parts[0]}' not found", err=True)
+                        return text
                     try:
-                        cmd_parts = cmd.split()
                         result = subprocess.run(cmd_parts, input=text, text=True, capture_output=True, timeout=30)
                         if result.returncode != 0:
                             click.echo(f"Warning: External formatter '{cmd}' failed: {result.stderr}", err=True)
@@ -194,11 +195,19 @@ def format(
                 raise click.ClickException(str(e))
 
             def create_attribute_formatter(cmd=command):  # Capture command in closure
+                # Look the program up once, so a missing one costs no process spawn per attribute
+                cmd_parts = cmd.split()
+                program_missing = bool(cmd_parts) and shutil.which(cmd_parts[0]) is None
+
                 def formatter_func(text, doc_formatter, physical_level):
                     if not text.strip():
                         return text
+                    if program_missing:
+                        click.echo(
+                            f"Warning: External attribute formatter command '{cmd_parts[0]}' not found", err=True
+                        )
+                        return text
                     try:
-                        cmd_parts = cmd.split()
                         result = subprocess.run(cmd_parts, input=text, text=True, capture_output=True, timeout=30)
                         if result.returncode != 0:
                             click.echo(
@@ -334,16 +343,10 @@ def format_html(
             if not xpath_list:
                 return None
             try:
-                factories = [matches_xpath(xpath) for xpath in xpath_list]
+                return matches_any_xpath(*xpath_list)
             except PredicateError as e:
                 raise click.ClickException(str(e))
 
-            def combined_factory(root):
-                predicates = [factory(root) for factory in factories]
-                return lambda e: any(pred(e) for pred in predicates)
-
-            return combined_factory
-
         # Create text formatter factories from external programs
         text_formatter_factories: dict[ElementPredicateFactory, TextContentFormatter] = {}
         for xpath_expr, command in text_formatter:
@@ -353,11 +356,17 @@ def format_html(
                 raise click.ClickException(str(e))
 
             def create_formatter(cmd=command) -> TextContentFormatter:  # Capture command in closure
+                # Look the program up once, so a missing one costs no process spawn per text node
+                cmd_parts = cmd.split()
+                program_missing = bool(cmd_parts) and shutil.which(cmd_parts[0]) is None
+
                 def formatter_func(text: str, doc_formatter: "DocumentFormatter", physical_level: int) -> str:
                     if not text.strip():
                         return text
+                    if program_missing:
+                        click.echo(f"Warning: External formatter command '{cmd_parts[0]}' not found", err=True)
+                        return text
                     try:
-                        cmd_parts = cmd.split()
                         result = subprocess.run(cmd_parts, input=text, text=True, capture_output=True, timeout=30)
                         if result.returncode != 0:
                             click.echo(f"Warning: External formatter '{cmd}' failed: {result.stderr}", err=True)
@@ -401,11 +410,19 @@ def format_html(
                 raise click.ClickException(str(e))
 
             def create_attribute_formatter(cmd=command):  # Capture command in closure
+                # Look the program up once, so a missing one costs no process spawn per attribute
+                cmd_parts = cmd.split()
+                program_missing = bool(cmd_parts) and shutil.which(cmd_parts[0]) is None
+
                 def formatter_func(text, doc_formatter, physical_level):
                     if not text.strip():
                         return text
+                    if program_missing:
+                        click.echo(
+                            f"Warning: External attribute formatter command '{cmd_parts[0]}' not found", err=True
+                        )
+                        return text
                     try:
-                        cmd_parts = cmd.split()
                         result = subprocess.run(cmd_parts, input=text, text=True, capture_output=True, timeout=30)
                         if result.returncode != 0:
                             click.echo(
@@ -545,16 +562,10 @@ def format_xml(
             if not xpath_list:
                 return None
             try:
-                factories = [matches_xpath(xpath) for xpath in xpath_list]
+                return matches_any_xpath(*xpath_list)
             except PredicateError as e:
                 raise click.ClickException(str(e))
 
-            def combined_factory(root):
-                predicates = [factory(root) for factory in factories]
-                return lambda e: any(pred(e) for pred in predicates)
-
-            return combined_factory
-
         # Create text formatter factories from external programs
         text_formatter_factories: dict[ElementPredicateFactory, TextContentFormatter] = {}
         for xpath_expr, command in text_formatter:
@@ -564,11 +575,17 @@ def format_xml(
                 raise click.ClickException(str(e))
 
             def create_formatter(cmd=command) -> TextContentFormatter:  # Capture command in closure
+                # Look the program up once, so a missing one costs no process spawn per text node
+                cmd_parts = cmd.split()
+                program_missing = bool(cmd_parts) and shutil.which(cmd_parts[0]) is None
+
                 def formatter_func(text: str, doc_formatter: "DocumentFormatter", physical_level: int) -> str:
                     if not text.strip():
                         return text
+                    if program_missing:
+                        click.echo(f"Warning: External formatter command '{cmd_parts[0]}' not found", err=True)
+                        return text
                     try:
-                        cmd_parts = cmd.split()
                         result = subprocess.run(cmd_parts, input=text, text=True, capture_output=True, timeout=30)
                         if result.returncode != 0:
                             click.echo(f"Warning: External formatter '{cmd}' failed: {result.stderr}", err=True)
@@ -612,11 +629,19 @@ def format_xml(
                 raise click.ClickException(str(e))
 
             def create_attribute_formatter(cmd=command):  # Capture command in closure
+                # Look the program up once, so a missing one costs no process spawn per attribute
+                cmd_parts = cmd.split()
+                program_missing = bool(cmd_parts) and shutil.which(cmd_parts[0]) is None
+
                 def formatter_func(text, doc_formatter, physical_level):
                     if not text.strip():
                         return text
+                    if program_missing:
+                        click.echo(
+                            f"Warning: External attribute formatter command '{cmd_parts[0]}' not found", err=True
+                        )
+                        return text
                     try:
-                        cmd_parts = cmd.split()
                         result = subprocess.run(cmd_parts, input=text, text=True, capture_output=True, timeout=30)
                         if result.returncode != 0:
                             click.echo(
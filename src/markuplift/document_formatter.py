@@ -11,7 +11,7 @@ processing, indentation, and text content formatting using TextContentFormatter
 
 from io import BytesIO
 from typing import Optional, Sequence
-from functools import singledispatchmethod
+from functools import lru_cache, singledispatchmethod
 from lxml.etree import CDATA
 
 # Import type aliases
@@ -70,6 +70,24 @@ from markuplift.annotation import (
     annotate_tail_transforms,
     PHYSICAL_LEVEL_ANNOTATION_KEY,
 )
+from markuplift.utilities import cdata_text
+
+
+# Empty element styles rendered as a single tag, with no content or end tag
+_SINGLE_TAG_STYLES = frozenset({EmptyElementTagStyle.SELF_CLOSING_TAG, EmptyElementTagStyle.VOID_TAG})
+
+# Nesting depth up to which newline-plus-indentation strings are precomputed
+_INDENT_TABLE_SIZE = 64
+
+
+@lru_cache(maxsize=16)
+def _newline_indents(one_indent: str) -> tuple[str, ...]:
+    """Newline-plus-indentation strings for levels 0 to _INDENT_TABLE_SIZE - 1.
+
+    Shared between all DocumentFormatters using the same indentation, since one
+    is created for each document formatted.
+    """
+    return tuple("\n" + one_indent * level for level in range(_INDENT_TABLE_SIZE))
 
 
 class DocumentFormatter:
@@ -200,9 +218,14 @@ class DocumentFormatter:
         self._doctype_strategy = doctype_strategy
         self._attribute_strategy = attribute_strategy
         self._empty_element_strategy = empty_element_strategy
+        # Strategy methods called for every node, bound once here for the hot loop
+        self._tag_style = empty_element_strategy.tag_style
+        self._escape_text = escaping_strategy.escape_text
+        self._escape_comment_text = escaping_strategy.escape_comment_text
         self._indent_char = " "
         self._indent_size = indent_size
         self._one_indent = self._indent_char * self._indent_size
+        self._newline_indents = _newline_indents(self._one_indent)
         self._default_type = default_type
 
     @property
@@ -292,29 +315,29 @@ class DocumentFormatter:
 
         # Handle comments and PIs before root element
         for event, node in etree.iterwalk(tree, events=("comment", "pi", "start")):
-            if event == "comment" and isinstance(node, etree._Comment):
+            if event == "comment":
                 parts.append("<!--")
                 if text := node.text:
-                    escaped_text = self._escaping_strategy.escape_comment_text(text)
+                    escaped_text = self._escape_comment_text(text)
                     if escaped_text.startswith("-"):
                         parts.append(" ")
                     parts.append(escaped_text)
                     if escaped_text.endswith("-"):
                         parts.append(" ")
                 parts.append("-->\n")
-            elif event == "pi" and isinstance(node, etree._ProcessingInstruction):
+            elif event == "pi":
                 parts.append(f"<?{node.target}")
                 if node.text:
                     parts.append(f" {node.text}")
                 parts.append("?>\n")
-            elif event == "start" and isinstance(node, etree._Element):
+            elif event == "start":
                 # Reached root element, stop processing
                 break
 
-        formatted = self.format_element(tree.getroot())
-        if formatted:
-            parts.append(formatted)
-
+        # Walk the root element straight into the same parts list, rather than
+        # joining it separately via format_element() and copying it again here
+        root = tree.getroot()
+        self._format_element(self._annotate_tree(root), root, parts)
         return "".join(parts)
 
     def format_element(self, root: etree._Element, doctype: str | None = None) -> str:
@@ -399,9 +422,14 @@ class DocumentFormatter:
         return annotations
 
     def _format_element(self, annotations: Annotations, element: etree._Element, parts: list[str]):
-        # Non-recursive, event-driven approach to formatting
+        # Non-recursive, event-driven approach to formatting. The event alone
+        # identifies the node type: iterwalk reports comments and PIs only as
+        # "comment" and "pi" events, never as "start" or "end".
+        # Whether each open element was rendered as a single tag, decided once at
+        # its start event and consumed at its matching end event.
+        single_tag_stack: list[bool] = []
         for event, node in etree.iterwalk(element, events=("start", "end", "comment", "pi")):
-            if event == "start" and isinstance(node, etree._Element):
+            if event == "start":
                 # Opening tag with namespace-aware tag name
                 tag_name = format_tag_name(node)
                 parts.append(f"<{tag_name}")
@@ -415,7 +443,7 @@ class DocumentFormatter:
                 # Attribute handling
                 must_wrap_attributes = self._must_wrap_attributes(node)
                 if must_wrap_attributes:
-                    spacer = "\n" + self._one_indent * (int(annotations.annotation(node, "physical_level", 0)) + 1)
+                    spacer = self._newline_indent(int(annotations.annotation(node, "physical_level", 0)) + 1)
                 else:
                     spacer = " "
 
@@ -444,14 +472,18 @@ class DocumentFormatter:
                     # Use polymorphic format() to render the attribute
                     parts.append(attribute_formatter.format(spacer, self._escaping_strategy))
                 if real_attributes and must_wrap_attributes:
-                    parts.append("\n" + self._one_indent * int(annotations.annotation(node, "physical_level", 0)))
+                    parts.append(self._newline_indent(int(annotations.annotation(node, "physical_level", 0))))
 
-                # Determine how to render this element based on whether it's empty
-                is_empty = self._is_empty_element(annotations, node)
-                tag_style = self._empty_element_strategy.tag_style(node) if is_empty else None
+                # Determine how to render this element based on whether it's empty,
+                # meaning no text content after transformations and no children
+                text = self._text_content(annotations, node)
+                is_empty = not text and len(node) == 0
+                tag_style = self._tag_style(node) if is_empty else None
+                single_tag = tag_style in _SINGLE_TAG_STYLES
+                single_tag_stack.append(single_tag)
 
                 # Handle tag closing based on style
-                if is_empty and tag_style in (EmptyElementTagStyle.SELF_CLOSING_TAG, EmptyElementTagStyle.VOID_TAG):
+                if single_tag:
                     # Single-tag rendering
                     if tag_style == EmptyElementTagStyle.SELF_CLOSING_TAG:
                         # XML-style: add space and slash
@@ -463,18 +495,13 @@ class DocumentFormatter:
                 parts.append(">")
 
                 # Content - only for non-empty or explicit-tags style
-                if not (is_empty and tag_style in (EmptyElementTagStyle.SELF_CLOSING_TAG, EmptyElementTagStyle.VOID_TAG)):
-                    if text := self._text_content(annotations, node):
-                        escaped_text = self._escape_text_content(text, node)
-                        parts.append(escaped_text)
-
-            elif event == "end" and isinstance(node, etree._Element):
-                # Determine if we need closing tag
-                is_empty = self._is_empty_element(annotations, node)
-                tag_style = self._empty_element_strategy.tag_style(node) if is_empty else None
+                if not single_tag and text:
+                    escaped_text = self._escape_text_content(text, node)
+                    parts.append(escaped_text)
 
+            elif event == "end":
                 # Only add closing tag if not using single-tag style
-                if not (is_empty and tag_style in (EmptyElementTagStyle.SELF_CLOSING_TAG, EmptyElementTagStyle.VOID_TAG)):
+                if not single_tag_stack.pop():
                     # Closing tag needed (namespace-aware)
                     tag_name = format_tag_name(node)
                     parts.append(f"</{tag_name}>")
@@ -484,7 +511,7 @@ class DocumentFormatter:
                     escaped_tail = self._escape_text_content(tail)
                     parts.append(escaped_tail)
 
-            elif event == "comment" and isinstance(node, etree._Comment):
+            elif event == "comment":
                 parts.append("<!--")
                 if text := self._text_content(annotations, node):
                     escaped_text = self._escape_comment_text_content(text)
@@ -499,7 +526,7 @@ class DocumentFormatter:
                     escaped_tail = self._escape_text_content(tail)
                     parts.append(escaped_tail)
 
-            elif event == "pi" and isinstance(node, etree._ProcessingInstruction):
+            elif event == "pi":
                 parts.append(f"<?{node.target}")
                 if node.text:
                     parts.append(f" {node.text}")
@@ -512,22 +539,11 @@ class DocumentFormatter:
             else:
                 raise RuntimeError(f"Unexpected event {event} for node {node}")
 
-    def _is_empty_element(self, annotations, element: etree._Element) -> bool:
-        """Check if an element is empty (no text content and no children).
-
-        An element is considered empty if it has no text content after
-        transformations and no child elements. This is used to determine
-        if the empty element strategy should be consulted.
-
-        Args:
-            annotations: Annotation data for the document
-            element: The element to check
-
-        Returns:
-            True if element is empty, False otherwise
-        """
-        text = self._text_content(annotations, element)
-        return (not bool(text)) and len(element) == 0
+    def _newline_indent(self, level: int) -> str:
+        """A newline followed by the indentation for the given nesting level."""
+        if level < _INDENT_TABLE_SIZE:
+            return self._newline_indents[level]
+        return "\n" + self._one_indent * level
 
     def _validate_attribute_reordering(
         self, reordered: Sequence[str], original: Sequence[str], element_tag: str
@@ -615,19 +631,13 @@ class DocumentFormatter:
     @_escape_text_content.register
     def _(self, content: str, element=None) -> str:
         """Handle regular string content with normal escaping."""
-        return self._escaping_strategy.escape_text(content, element)
+        return self._escape_text(content, element)
 
     @_escape_text_content.register
     def _(self, content: CDATA, element=None) -> str:
         """Handle CDATA content with safe CDATA serialization."""
-        # Extract content via temporary element
-        from lxml.etree import Element
-        temp_element = Element("temp")
-        temp_element.text = content
-        actual_content = temp_element.text
-
         # Use separate method for safe CDATA rendering
-        return self._render_safe_cdata(actual_content)
+        return self._render_safe_cdata(cdata_text(content))
 
     def _render_safe_cdata(self, content: str) -> str:
         """Safely render content as CDATA, handling ]]> sequences.
@@ -652,50 +662,22 @@ class DocumentFormatter:
             >>> formatter._render_safe_cdata("]]>")
             ']]&gt;'
         """
-        # Handle empty content
-        if not content:
-            return "<![CDATA[]]>"
-
-        # If no problematic sequences, simple case
+        # If no problematic sequences (including empty content), simple case
         if "]]>" not in content:
             return f"<![CDATA[{content}]]>"
 
-        # Handle content that starts with ]]>
-        if content.startswith("]]>"):
-            if len(content) == 3:  # Just "]]>"
-                return "]]&gt;"
-            # Process remainder
-            remainder = content[3:]
-            return "]]&gt;" + self._render_safe_cdata(remainder)
-
-        # Split on ]]> and rebuild safely
-        result = ""
-        remaining = content
-
-        while "]]>" in remaining:
-            # Find the first ]]> occurrence
-            pos = remaining.find("]]>")
-
-            if pos == 0:
-                # Starts with ]]>, just escape it
-                result += "]]&gt;"
-                remaining = remaining[3:]
-            else:
-                # Everything up to and including ]] goes in CDATA
-                before_and_brackets = remaining[:pos + 2]  # includes the ]]
-                result += f"<![CDATA[{before_and_brackets}]]>"
-
-                # Escape the >
-                result += "&gt;"
-
-                # Continue with the rest
-                remaining = remaining[pos + 3:]
+        # Split on ]]> in a single C-level pass. Every part but the last was
+        # followed by ]]>: a non-empty part goes in CDATA together with the ]]
+        # of the terminator, whose > is then escaped; an empty part leaves only
+        # the terminator itself, which is emitted as text.
+        *terminated_parts, last_part = content.split("]]>")
+        pieces = [f"<![CDATA[{part}]]]]>&gt;" if part else "]]&gt;" for part in terminated_parts]
 
         # Add any remaining content in CDATA
-        if remaining:
-            result += f"<![CDATA[{remaining}]]>"
+        if last_part:
+            pieces.append(f"<![CDATA[{last_part}]]>")
 
-        return result
+        return "".join(pieces)
 
     def _escape_comment_text_content(self, content: TextContent) -> str:
         """Escape comment text content appropriately, handling CDATA objects.
@@ -708,7 +690,7 @@ class DocumentFormatter:
         """
         if isinstance(content, CDATA):
             # CDATA objects don't need escaping for comments
-            return str(content)
+            return cdata_text(content)
         else:
             # Regular strings need comment-specific escaping
-            return self._escaping_strategy.escape_comment_text(content)
+            return self._escape_comment_text(content)
@@ -11,9 +11,29 @@ while HTML5 has specific rules:
 
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 from lxml import etree
 
 
+# HTML5 void elements as defined by WHATWG spec (2025)
+# These are the ONLY elements in HTML5 that can use single-tag syntax
+_HTML5_VOID_ELEMENTS = frozenset({
+    "area",   # Image map area
+    "base",   # Document base URL
+    "br",     # Line break
+    "col",    # Table column
+    "embed",  # External content embedding
+    "hr",     # Thematic break (horizontal rule)
+    "img",    # Image
+    "input",  # Form input
+    "link",   # External resource link
+    "meta",   # Metadata
+    "source", # Media source
+    "track",  # Text track
+    "wbr",    # Word break opportunity
+})
+
+
 class EmptyElementTagStyle(Enum):
     """How to render empty elements (no content, no children).
 
@@ -45,6 +65,9 @@ class EmptyElementTagStyle(Enum):
     """
 
 
+_SELF_CLOSING = EmptyElementTagStyle.SELF_CLOSING_TAG
+
+
 class EmptyElementStrategy(ABC):
     """Abstract base class for empty element rendering strategies.
 
@@ -120,7 +143,7 @@ class XmlEmptyElementStrategy(EmptyElementStrategy):
         Returns:
             Always returns EmptyElementTagStyle.SELF_CLOSING_TAG
         """
-        return EmptyElementTagStyle.SELF_CLOSING_TAG
+        return _SELF_CLOSING
 
 
 class Html5EmptyElementStrategy(EmptyElementStrategy):
@@ -152,24 +175,6 @@ class Html5EmptyElementStrategy(EmptyElementStrategy):
         <EmptyElementTagStyle.EXPLICIT_TAGS: 'explicit'>
     """
 
-    # HTML5 void elements as defined by WHATWG spec (2025)
-    # These are the ONLY elements in HTML5 that can use single-tag syntax
-    _HTML5_VOID_ELEMENTS = frozenset({
-        "area",   # Image map area
-        "base",   # Document base URL
-        "br",     # Line break
-        "col",    # Table column
-        "embed",  # External content embedding
-        "hr",     # Thematic break (horizontal rule)
-        "img",    # Image
-        "input",  # Form input
-        "link",   # External resource link
-        "meta",   # Metadata
-        "source", # Media source
-        "track",  # Text track
-        "wbr",    # Word break opportunity
-    })
-
     def tag_style(self, element: etree._Element) -> EmptyElementTagStyle:
         """Determine tag style based on HTML5 void element rules.
 
@@ -183,7 +188,17 @@ class Html5EmptyElementStrategy(EmptyElementStrategy):
             - VOID_TAG if element is an HTML5 void element
             - EXPLICIT_TAGS for all other elements
         """
-        if element.tag in self._HTML5_VOID_ELEMENTS:
-            return EmptyElementTagStyle.VOID_TAG
-        else:
-            return EmptyElementTagStyle.EXPLICIT_TAGS
+        return _html5_tag_style(element.tag)
+
+
+@lru_cache(maxsize=256)
+def _html5_tag_style(tag: str) -> EmptyElementTagStyle:
+    """Look up the HTML5 tag style for a tag name.
+
+    Keyed on the tag string rather than the element, so that every element
+    sharing a tag name shares one cache entry.
+    """
+    if tag in _HTML5_VOID_ELEMENTS:
+        return EmptyElementTagStyle.VOID_TAG
+    else:
+        return EmptyElementTagStyle.EXPLICIT_TAGS
@@ -5,7 +5,8 @@ that pre-configures HTML5-friendly strategies for parsing and escaping while let
 users control element classification through predicate factories.
 """
 
-from typing import Optional
+from functools import cache
+from typing import Any, Optional
 from lxml import etree
 from markuplift.formatter import Formatter
 from markuplift.escaping import HtmlEscapingStrategy
@@ -19,8 +20,9 @@ from markuplift.predicates import (
     html_normalize_whitespace,
     not_matching,
     all_of,
+    any_element,
 )
-from markuplift.attribute_formatting import Html5AttributeStrategy
+from markuplift.attribute_formatting import Html5AttributeStrategy, html_attribute_order
 from markuplift.types import (
     ElementPredicateFactory,
     TextContentFormatter,
@@ -31,6 +33,28 @@ from markuplift.types import (
 )
 
 
+@cache
+def _html5_defaults() -> dict[str, Any]:
+    """Build the default predicate factories and attribute reorderer for Html5Formatter.
+
+    These are all stateless, so they are built once and every Html5Formatter
+    constructed with defaults shares the same instances.
+
+    Returns:
+        Mapping from Html5Formatter argument name to its default value, plus
+        "attribute_order" for the reorderer paired with "attribute_order_when".
+    """
+    return {
+        "block_when": html_block_elements(),
+        "inline_when": html_inline_elements(),
+        "normalize_whitespace_when": html_normalize_whitespace(),
+        "preserve_whitespace_when": html_whitespace_significant_elements(),
+        "strip_whitespace_when": all_of(html_block_elements(), not_matching(html_whitespace_significant_elements())),
+        "attribute_order_when": any_element(),
+        "attribute_order": html_attribute_order(),
+    }
+
+
 class Html5Formatter:
     """HTML5-optimized formatter with HTML-friendly parsing and escaping strategies.
 
@@ -109,25 +133,25 @@ class Html5Formatter:
             This class automatically configures HTML5-friendly parsing and escaping strategies.
             Element classification defaults to HTML5 standards but can be overridden via predicate factories.
         """
+        defaults = _html5_defaults()
+
         # Default to HTML5 element classifications if not provided
         if block_when is None:
-            block_when = html_block_elements()
+            block_when = defaults["block_when"]
         if inline_when is None:
-            inline_when = html_inline_elements()
+            inline_when = defaults["inline_when"]
 
         # Default to HTML5 whitespace handling if not provided
         if normalize_whitespace_when is None:
-            normalize_whitespace_when = html_normalize_whitespace()
+            normalize_whitespace_when = defaults["normalize_whitespace_when"]
         if preserve_whitespace_when is None:
-            preserve_whitespace_when = html_whitespace_significant_elements()
+            preserve_whitespace_when = defaults["preserve_whitespace_when"]
         if strip_whitespace_when is None:
-            strip_whitespace_when = all_of(html_block_elements(), not_matching(html_whitespace_significant_elements()))
+            strip_whitespace_when = defaults["strip_whitespace_when"]
 
         # Default to HTML5 semantic attribute ordering if not provided
         if reorder_attributes_when is None:
-            from markuplift.attribute_formatting import html_attribute_order
-            from markuplift.predicates import any_element
-            reorder_attributes_when = {any_element(): html_attribute_order()}
+            reorder_attributes_when = {defaults["attribute_order_when"]: defaults["attribute_order"]}
 
         # Store parse_as_xml_when for use in format methods
         self._parse_as_xml_when = parse_as_xml_when
@@ -438,7 +462,7 @@ class Html5Formatter:
                 parent.remove(elem)
                 parent.insert(index, xml_elem)
 
-    def _get_element_path(self, root: etree._Element, target: etree._Element) -> list[int]:
+    def _get_element_path(self, root: etree._Element, target: etree._Element) -> list[int] | None:
         """Get path from root to target as list of child indices.
 
         This counts only element children, not comments or other nodes,
@@ -452,18 +476,19 @@ class Html5Formatter:
             List of child indices representing the path from root to target.
             Returns empty list if target is root, None if target not found.
         """
-        def walk(elem, path):
-            if elem is target:
-                return path
-            # Only count element children, filtering out comments and other nodes
-            element_index = 0
-            for child in elem:
-                # Check if child is an element (not a comment, PI, etc.)
-                if isinstance(child.tag, str):
-                    result = walk(child, path + [element_index])
-                    if result is not None:
-                        return result
-                    element_index += 1
+        if not isinstance(target.tag, str):
             return None
 
-        return walk(root, [])
+        # Climb from the target to the root rather than searching down from the root.
+        # Only count preceding element siblings, filtering out comments and other nodes.
+        path = []
+        elem = target
+        while elem is not root:
+            parent = elem.getparent()
+            if parent is None:
+                # Target is not within root, for example in an already replaced subtree
+                return None
+            path.append(sum(1 for _ in elem.itersiblings(etree.Element, preceding=True)))
+            elem = parent
+        path.reverse()
+        return path
@@ -40,6 +40,7 @@ Standard Predicates:
     never_matches: A standard ElementPredicateFactory that creates never-matching predicates
 """
 
+from functools import lru_cache
 from lxml import etree
 import re
 from re import Pattern
@@ -185,6 +186,10 @@ class PredicateFactory:
 
     _factory_func: ElementPredicateFactory
 
+    # True only for the long-lived instances shared by tag_in(), which are the
+    # only receivers for which memoizing with_attribute() can ever hit
+    _shared: bool = False
+
     def __new__(cls, factory_func: ElementPredicateFactory):
         """Create a new PredicateFactory, or return existing instance if already wrapped.
 
@@ -251,6 +256,14 @@ class PredicateFactory:
             html_block_elements().with_attribute("style", lambda v: v.count(';') >= 3)
             tag_in("div", "p").with_attribute("class", lambda v: "btn" in v and "primary" in v)
         """
+        if self._shared and isinstance(name, str) and (value is None or isinstance(value, str)):
+            # As with attribute_matches(), share one factory per distinct
+            # (factory, name, value) combination for plain string matchers.
+            return _cached_with_attribute(self, name, value)
+        return self._with_attribute(name, value)
+
+    def _with_attribute(self, name: NameMatcher, value: Optional[ValueMatcher]) -> AttributePredicateFactory:
+        """Build the AttributePredicateFactory returned by with_attribute()."""
         # Create optimized matcher functions once at setup time
         name_matcher = _create_matcher(name, "attribute_name", allow_none=False)
         value_matcher = _create_matcher(value, "attribute_value", allow_none=True)
@@ -267,6 +280,14 @@ class PredicateFactory:
         return attribute_factory
 
 
+@lru_cache(maxsize=256)
+def _cached_with_attribute(
+    factory: PredicateFactory, name: str, value: Optional[str]
+) -> AttributePredicateFactory:
+    """Memoized PredicateFactory.with_attribute() for shared factories and plain string matchers."""
+    return factory._with_attribute(name, value)
+
+
 def supports_attributes(func: Callable[..., ElementPredicateFactory]) -> Callable[..., PredicateFactory]:
     """Decorator to add attribute chaining support to ElementPredicateFactory functions.
 
@@ -356,38 +377,43 @@ def matches_xpath(xpath_expr: str) -> ElementPredicateFactory:
     Raises:
         PredicateError: If XPath is invalid or returns non-element results
     """
-    # Validate XPath syntax immediately using a temporary element
-    try:
-        temp_element: etree._Element = etree.Element("temp")
-        temp_element.xpath(xpath_expr)
-    except etree.XPathEvalError as e:
-        raise PredicateError(f"Invalid XPath expression '{xpath_expr}': {e}") from e
+    return matches_any_xpath(xpath_expr)
 
-    def create_document_predicate(root: etree._Element) -> ElementPredicate:
+
+@supports_attributes
+def matches_any_xpath(*xpath_exprs: str) -> ElementPredicateFactory:
+    """Match elements selected by any of several XPath expressions.
+
+    Equivalent to any_of() over matches_xpath() for each expression, but each
+    expression is evaluated once per document into a single set of matching
+    elements, so the per-element test is one set lookup however many
+    expressions are given.
+
+    Args:
+        *xpath_exprs: XPath expressions that must return element nodes
+
+    Returns:
+        A chainable predicate factory that creates optimized XPath-based predicates
+
+    Raises:
+        PredicateError: If any XPath is invalid or returns non-element results
+
+    Examples:
+        # Treat both paragraphs and list items as blocks
+        matches_any_xpath("//p", "//li")
+    """
+    # Validate XPath syntax immediately (only on first use of each expression)
+    compiled_xpaths = []
+    for xpath_expr in xpath_exprs:
         try:
-            xpath_results = root.xpath(xpath_expr)
-
-            # Handle non-iterable results (single values like count(), boolean())
-            if not isinstance(xpath_results, list):
-                raise PredicateError(
-                    f"XPath '{xpath_expr}' returned non-element results: {{{type(xpath_results).__name__}}}. "
-                    f"Only element-returning XPath expressions are supported."
-                )
-
-            # Validate that list results contain only elements
-            if xpath_results and not all(isinstance(item, etree._Element) for item in xpath_results):
-                non_element_types = {
-                    type(item).__name__ for item in xpath_results if not isinstance(item, etree._Element)
-                }
-                raise PredicateError(
-                    f"XPath '{xpath_expr}' returned non-element results: {non_element_types}. "
-                    f"Only element-returning XPath expressions are supported."
-                )
-
-            matches = set(xpath_results)
-
-        except etree.XPathEvalError as e:
-            raise PredicateError(f"XPath evaluation failed '{xpath_expr}': {e}") from e
+            compiled_xpaths.append((xpath_expr, _compile_xpath(xpath_expr)))
+        except etree.XPathError as e:
+            raise PredicateError(f"Invalid XPath expression '{xpath_expr}': {e}") from e
+
+    def create_document_predicate(root: etree._Element) -> ElementPredicate:
+        matches: set[etree._Element] = set()
+        for xpath_expr, compiled_xpath in compiled_xpaths:
+            matches.update(_xpath_elements(xpath_expr, compiled_xpath, root))
 
         def element_predicate(element: etree._Element) -> bool:
             return element in matches
@@ -397,6 +423,70 @@ def matches_xpath(xpath_expr: str) -> ElementPredicateFactory:
     return create_document_predicate
 
 
+def _xpath_elements(xpath_expr: str, compiled_xpath: etree.XPath, root: etree._Element) -> list[etree._Element]:
+    """Evaluate a compiled XPath against a document, checking it selected only elements."""
+    try:
+        xpath_results = compiled_xpath(root)
+    except etree.XPathEvalError as e:
+        raise PredicateError(f"XPath evaluation failed '{xpath_expr}': {e}") from e
+
+    # Handle non-iterable results (single values like count(), boolean())
+    if not isinstance(xpath_results, list):
+        raise PredicateError(
+            f"XPath '{xpath_expr}' returned non-element results: {{{type(xpath_results).__name__}}}. "
+            f"Only element-returning XPath expressions are supported."
+        )
+
+    # Validate that list results contain only elements
+    if xpath_results and not all(isinstance(item, etree._Element) for item in xpath_results):
+        non_element_types = {
+            type(item).__name__ for item in xpath_results if not isinstance(item, etree._Element)
+        }
+        raise PredicateError(
+            f"XPath '{xpath_expr}' returned non-element results: {non_element_types}. "
+            f"Only element-returning XPath expressions are supported."
+        )
+
+    return xpath_results
+
+
+@lru_cache(maxsize=512)
+def _compile_xpath(xpath_expr: str) -> etree.XPath:
+    """Compile and validate an XPath expression, memoized per expression string.
+
+    The compiled expression is evaluated once against a temporary element so that
+    errors such as unknown functions are reported up front, as well as syntax errors.
+
+    Raises:
+        etree.XPathError: If the expression cannot be compiled or evaluated
+    """
+    compiled_xpath = etree.XPath(xpath_expr)
+    compiled_xpath(etree.Element("temp"))
+    return compiled_xpath
+
+
+def _tag_set_factory(tag_set: frozenset[str]) -> ElementPredicateFactory:
+    """Build a factory matching elements whose tag is one of tag_set.
+
+    The tag set is recorded on the returned factory so that any_of() can merge
+    several tag-based factories into a single set membership test.
+    """
+
+    def create_document_predicate(root: etree._Element) -> ElementPredicate:
+        def element_predicate(element: etree._Element) -> bool:
+            return element.tag in tag_set
+
+        return element_predicate
+
+    create_document_predicate.tag_set = tag_set  # type: ignore[attr-defined]
+    return create_document_predicate
+
+
+def _tag_set_of(factory: ElementPredicateFactory) -> frozenset[str] | None:
+    """Return the tag set matched by a factory from _tag_set_factory(), or None for any other factory."""
+    return getattr(getattr(factory, "_factory_func", factory), "tag_set", None)
+
+
 @supports_attributes
 def tag_equals(tag: str | etree.QName) -> ElementPredicateFactory:
     """Match elements with a specific tag name.
@@ -433,14 +523,7 @@ def tag_equals(tag: str | etree.QName) -> ElementPredicateFactory:
     """
     tag = qname_to_str(tag)  # Convert QName to string if needed
     _validate_tag_name(tag)
-
-    def create_document_predicate(root: etree._Element) -> ElementPredicate:
-        def element_predicate(element: etree._Element) -> bool:
-            return element.tag == tag
-
-        return element_predicate
-
-    return create_document_predicate
+    return _tag_set_factory(frozenset((tag,)))
 
 
 @supports_attributes
@@ -541,21 +624,31 @@ def tag_in(*tags: str | etree.QName) -> ElementPredicateFactory:
     if not tags:
         raise PredicateError("At least one tag name must be provided")
 
+    if all(isinstance(tag, str) for tag in tags):
+        # Plain string tags are safely hashable, so share one factory per
+        # distinct tag tuple. Returning a PredicateFactory lets chained
+        # with_attribute() calls on the shared factory hit their cache too.
+        return _cached_tag_in(tags)
+    return _tag_in(tags)
+
+
+@lru_cache(maxsize=256)
+def _cached_tag_in(tags: tuple[str, ...]) -> PredicateFactory:
+    """Memoized tag_in() for plain string tag names."""
+    factory = PredicateFactory(_tag_in(tags))
+    factory._shared = True
+    return factory
+
+
+def _tag_in(tags: tuple[str | etree.QName, ...]) -> ElementPredicateFactory:
+    """Build the ElementPredicateFactory returned by tag_in()."""
     # Convert all QNames to strings
     str_tags = [qname_to_str(tag) for tag in tags]
 
     for tag in str_tags:
         _validate_tag_name(tag)
 
-    tag_set = set(str_tags)
-
-    def create_document_predicate(root: etree._Element) -> ElementPredicate:
-        def element_predicate(element: etree._Element) -> bool:
-            return element.tag in tag_set
-
-        return element_predicate
-
-    return create_document_predicate
+    return _tag_set_factory(frozenset(str_tags))
 
 
 @supports_attributes
@@ -731,7 +824,7 @@ def is_comment() -> ElementPredicateFactory:
 
     def create_document_predicate(root: etree._Element) -> ElementPredicate:
         def element_predicate(element: etree._Element) -> bool:
-            return isinstance(element, etree._Comment)
+            return element.tag is etree.Comment
 
         return element_predicate
 
@@ -755,7 +848,7 @@ def is_processing_instruction(target: str = None) -> ElementPredicateFactory:
 
     def create_document_predicate(root: etree._Element) -> ElementPredicate:
         def element_predicate(element: etree._Element) -> bool:
-            if not isinstance(element, etree._ProcessingInstruction):
+            if element.tag is not etree.PI:
                 return False
             if target is None:
                 return True
@@ -922,13 +1015,7 @@ def html_inline_elements() -> ElementPredicateFactory:
     Returns:
         An element predicate factory that matches common HTML inline elements
     """
-    def create_document_predicate(root: etree._Element) -> ElementPredicate:
-        def element_predicate(element: etree._Element) -> bool:
-            return element.tag in _HTML_INLINE_ELEMENTS
-
-        return element_predicate
-
-    return create_document_predicate
+    return _tag_set_factory(_HTML_INLINE_ELEMENTS)
 
 
 @supports_attributes
@@ -946,13 +1033,7 @@ def html_void_elements() -> ElementPredicateFactory:
             html_void_elements().with_attribute("src")
             html_void_elements().with_attribute("alt", re.compile(r".*logo.*"))
     """
-    def create_document_predicate(root: etree._Element) -> ElementPredicate:
-        def element_predicate(element: etree._Element) -> bool:
-            return element.tag in _HTML_VOID_ELEMENTS
-
-        return element_predicate
-
-    return create_document_predicate
+    return _tag_set_factory(_HTML_VOID_ELEMENTS)
 
 
 @supports_attributes
@@ -970,13 +1051,7 @@ def html_whitespace_significant_elements() -> ElementPredicateFactory:
             html_whitespace_significant_elements().with_attribute("class")
             html_whitespace_significant_elements().with_attribute("id", "main-code")
     """
-    def create_document_predicate(root: etree._Element) -> ElementPredicate:
-        def element_predicate(element: etree._Element) -> bool:
-            return element.tag in _HTML_WHITESPACE_SIGNIFICANT_ELEMENTS
-
-        return element_predicate
-
-    return create_document_predicate
+    return _tag_set_factory(_HTML_WHITESPACE_SIGNIFICANT_ELEMENTS)
 
 
 def html_normalize_whitespace() -> ElementPredicateFactory:
@@ -1040,13 +1115,7 @@ def html_metadata_elements() -> ElementPredicateFactory:
             html_metadata_elements().with_attribute("charset")
             html_metadata_elements().with_attribute("name", "viewport")
     """
-    def create_document_predicate(root: etree._Element) -> ElementPredicate:
-        def element_predicate(element: etree._Element) -> bool:
-            return element.tag in _HTML_METADATA_ELEMENTS
-
-        return element_predicate
-
-    return create_document_predicate
+    return _tag_set_factory(_HTML_METADATA_ELEMENTS)
 
 
 @supports_attributes
@@ -1098,11 +1167,20 @@ def any_of(*predicate_factories: ElementPredicateFactory) -> ElementPredicateFac
             any_of(html_block_elements(), html_inline_elements()).with_attribute("role", "button")
     """
 
+    # Merge the tag sets of all tag-based factories, such as tag_in() and
+    # html_block_elements(), into one membership test
+    tag_sets = [_tag_set_of(factory) for factory in predicate_factories]
+    other_factories = [factory for factory, tag_set in zip(predicate_factories, tag_sets) if tag_set is None]
+    merged_tag_set = frozenset().union(*(tag_set for tag_set in tag_sets if tag_set is not None))
+
+    if not other_factories:
+        return _tag_set_factory(merged_tag_set)
+
     def create_document_predicate(root: etree._Element) -> ElementPredicate:
-        predicates = [factory(root) for factory in predicate_factories]
+        predicates = [factory(root) for factory in other_factories]
 
         def element_predicate(element: etree._Element) -> bool:
-            return any(pred(element) for pred in predicates)
+            return element.tag in merged_tag_set or any(pred(element) for pred in predicates)
 
         return element_predicate
 
@@ -1257,14 +1335,30 @@ def attribute_matches(name: NameMatcher, value: Optional[ValueMatcher] = None) -
         attribute_matches("class", lambda v: "btn" in v)         # Button classes
         attribute_matches(lambda n: n.startswith("data-"), lambda v: len(v) > 10)  # Long data attrs
     """
+    if isinstance(name, str) and (value is None or isinstance(value, str)):
+        # Plain string matchers are by far the most common, and are safely
+        # hashable, so share one factory per distinct (name, value) pair.
+        return _cached_attribute_matches(name, value)
+    return _attribute_matches(name, value)
+
+
+@lru_cache(maxsize=256)
+def _cached_attribute_matches(name: str, value: Optional[str]) -> AttributePredicateFactory:
+    """Memoized attribute_matches() for plain string name and value matchers."""
+    return _attribute_matches(name, value)
+
+
+def _attribute_matches(name: NameMatcher, value: Optional[ValueMatcher]) -> AttributePredicateFactory:
+    """Build the AttributePredicateFactory returned by attribute_matches()."""
     # Create matchers at factory creation time for better performance
     name_matcher = _create_matcher(name, "attribute_name", allow_none=False)
     value_matcher = _create_matcher(value, "attribute_value", allow_none=True)
 
-    def factory(root: etree._Element) -> AttributePredicate:
-        def predicate(element: etree._Element, attr_name: str, attr_value: str) -> bool:
-            return name_matcher(attr_name) and value_matcher(attr_value)
+    # The predicate does not depend on the document, so build it only once
+    def predicate(element: etree._Element, attr_name: str, attr_value: str) -> bool:
+        return name_matcher(attr_name) and value_matcher(attr_value)
 
+    def factory(root: etree._Element) -> AttributePredicate:
         return predicate
 
     return factory
@@ -9,10 +9,24 @@ annotation processes.
 """
 
 import re
+from functools import lru_cache
 from itertools import groupby
 from typing import Any
 
 from lxml import etree
+from lxml.etree import CDATA
+
+# \s in a str pattern matches exactly the characters for which str.isspace() is true
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+# Short strings, such as the indentation between elements, repeat throughout a document
+_MAX_CACHED_NORMALIZE_LENGTH = 64
+
+
+@lru_cache(maxsize=1024)
+def _normalize_short_ws(s: str) -> str:
+    """Memoized whitespace normalization for short, frequently repeated strings."""
+    return _WHITESPACE_RUN.sub(" ", s)
 
 
 def siblings(node: etree._Element) -> list[etree._Element]:
@@ -57,9 +71,9 @@ def tagname(node: etree._Element) -> str:
         >>> tagname(pi_node)
         "?xml-stylesheet"
     """
-    if isinstance(node, etree._Comment) and node.tag is etree.Comment:
+    if node.tag is etree.Comment:
         return "#comment"
-    elif isinstance(node, etree._ProcessingInstruction) and node.tag is etree.PI:
+    elif node.tag is etree.PI:
         return f"?{node.target}"
     else:
         # Use namespace-aware formatting for regular elements
@@ -157,6 +171,33 @@ def print_tree_with_annotations(element, annotations, indent=0, title=None):
         print(banner)
 
 
+def cdata_text(content: str | CDATA) -> str:
+    """Return the string wrapped by a CDATA object, or a string unchanged.
+
+    lxml's CDATA type exposes no accessor for its content, and str() returns the
+    object's repr rather than the wrapped text. The content is recovered by
+    assigning the CDATA to a temporary element and reading it back.
+
+    Args:
+        content: Text content that may be a string or CDATA object
+
+    Returns:
+        The plain string content
+
+    Examples:
+        >>> cdata_text(CDATA("x < 5"))
+        'x < 5'
+
+        >>> cdata_text("plain text")
+        'plain text'
+    """
+    if isinstance(content, str):
+        return content
+    temp_element = etree.Element("temp")
+    temp_element.text = content
+    return temp_element.text or ""
+
+
 def split_whitespace(s):
     return [(" " if k else "".join(g)) for k, g in groupby(s, str.isspace)]
 
@@ -171,7 +212,9 @@ def normalize_ws(s: str) -> str:
         The string with normalized whitespace. Note that the result may have leading or trailing
         spaces if the input string had leading or trailing whitespace.
     """
-    return "".join(split_whitespace(s))
+    if len(s) <= _MAX_CACHED_NORMALIZE_LENGTH:
+        return _normalize_short_ws(s)
+    return _WHITESPACE_RUN.sub(" ", s)
 
 
 def has_xml_declaration_bytes(xml: bytes) -> bool:
@@ -201,9 +244,12 @@ def html_friendly_quoteattr(value: str) -> str:
         >>> html_friendly_quoteattr('Say "hello"')
         '"Say &quot;hello&quot;"'
     """
-    # Escape ampersands first to avoid double-escaping
-    escaped = value.replace("&", "&amp;")
+    # Escape ampersands first to avoid double-escaping. Most values contain
+    # neither character, so skip the replace when there is nothing to find.
+    if "&" in value:
+        value = value.replace("&", "&amp;")
     # Escape quotes
-    escaped = escaped.replace('"', "&quot;")
+    if '"' in value:
+        value = value.replace('"', "&quot;")
     # Return wrapped in quotes - literal newlines are preserved
-    return f'"{escaped}"'
+    return f'"{value}"'
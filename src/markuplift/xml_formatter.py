@@ -286,3 +286,18 @@ class XmlFormatter:
             A pretty-printed XML string.
         """
         return self._formatter.format_tree(tree, doctype=doctype, xml_declaration=xml_declaration)
+
+    def format_element(self, root, doctype: str | None = None) -> str:
+        """Format a single XML element and its descendants.
+
+        Use this when you already hold an lxml element, to avoid serializing and
+        re-parsing it through format_str().
+
+        Args:
+            root: The root lxml element to format.
+            doctype: Optional DOCTYPE declaration to prepend to the output.
+
+        Returns:
+            A pretty-printed XML string for the element and its subtree.
+        """
+        return self._formatter.format_element(root, doctype=doctype)
@@ -5,6 +5,8 @@ from pathlib import Path
 from approvaltests.reporters import PythonNativeReporter
 from approvaltests import set_default_reporter
 
+from markuplift import Formatter, Html5Formatter, XmlFormatter
+
 
 @pytest.fixture(scope="session", autouse=True)
 def configure_approvaltests():
@@ -12,6 +14,28 @@ def configure_approvaltests():
     set_default_reporter(PythonNativeReporter())
 
 
+@pytest.fixture(scope="session")
+def default_formatter():
+    """A Formatter with default settings, shared across the session.
+
+    Formatters are never modified after construction - derive() returns a new
+    instance - so tests may safely share this one.
+    """
+    return Formatter()
+
+
+@pytest.fixture(scope="session")
+def default_html5_formatter():
+    """An Html5Formatter with default settings, shared across the session."""
+    return Html5Formatter()
+
+
+@pytest.fixture(scope="session")
+def default_xml_formatter():
+    """An XmlFormatter with default settings, shared across the session."""
+    return XmlFormatter()
+
+
 @pytest.fixture
 def test_data_path():
     """Factory fixture that returns the full path to a test data file.
@@ -0,0 +1,36 @@
+# Configuration properties exposed by Formatter and by the wrappers that delegate to it
+DELEGATED_PROPERTIES = (
+    "block_when",
+    "inline_when",
+    "normalize_whitespace_when",
+    "strip_whitespace_when",
+    "preserve_whitespace_when",
+    "wrap_attributes_when",
+    "reformat_text_when",
+    "reformat_attribute_when",
+    "indent_size",
+    "default_type",
+)
+
+# Formatter additionally exposes its configurable strategies
+FORMATTER_PROPERTIES = DELEGATED_PROPERTIES + (
+    "escaping_strategy",
+    "parsing_strategy",
+    "doctype_strategy",
+    "attribute_strategy",
+)
+
+
+def assert_properties_preserved(derived, base, properties=FORMATTER_PROPERTIES, exclude=()):
+    """Assert that derived has the same value as base for each property.
+
+    Values must be the same object, or equal (derive() copies the formatter
+    dictionaries). Every differing property is reported in a single failure.
+    """
+    differing = [
+        name
+        for name in properties
+        if name not in exclude
+        and not (getattr(derived, name) is getattr(base, name) or getattr(derived, name) == getattr(base, name))
+    ]
+    assert not differing, f"Properties not preserved: {', '.join(differing)}"
@@ -1,6 +1,16 @@
 from lxml import etree
 
-from markuplift.predicates import tag_equals, tag_in, has_attribute, attribute_equals, any_of, all_of, not_matching
+from markuplift.predicates import (
+    _tag_set_of,
+    all_of,
+    any_of,
+    attribute_equals,
+    has_attribute,
+    html_inline_elements,
+    not_matching,
+    tag_equals,
+    tag_in,
+)
 
 
 def test_any_of_simple_combination():
@@ -63,6 +73,21 @@ def test_any_of_no_predicates():
     assert predicate(root_elem) is False
 
 
+def test_any_of_merges_tag_predicates():
+    """Test any_of merges tag-based predicates into one tag set, alongside other predicates."""
+    xml = '<root><div>div</div><span id="s">span</span><em>em</em><p>p</p></root>'
+    tree = etree.fromstring(xml)
+
+    tags_only = any_of(tag_equals("div"), any_of(tag_in("em"), html_inline_elements()))
+    assert _tag_set_of(tags_only) >= {"div", "em", "span"}
+
+    mixed = any_of(tag_equals("div"), has_attribute("id"))
+    assert _tag_set_of(mixed) is None
+
+    predicate = mixed(tree)
+    assert [predicate(child) for child in tree] == [True, True, False, False]
+
+
 def test_all_of_simple_combination():
     """Test all_of combining simple predicates."""
     xml = """
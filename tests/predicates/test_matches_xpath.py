@@ -1,7 +1,7 @@
 import pytest
 from lxml import etree
 
-from markuplift.predicates import matches_xpath, PredicateError
+from markuplift.predicates import matches_any_xpath, matches_xpath, PredicateError, _compile_xpath
 
 
 def test_matches_xpath_simple_tag():
@@ -96,6 +96,27 @@ def test_matches_xpath_invalid_expression():
         matches_xpath("//invalid[[[")
 
 
+def test_matches_xpath_unknown_function():
+    """Test that evaluation errors such as unknown functions are also raised immediately."""
+    with pytest.raises(PredicateError, match="Invalid XPath expression"):
+        matches_xpath("no-such-function(//div)")
+
+
+def test_matches_xpath_reuses_compiled_expression():
+    """Test that repeated use of an expression does not recompile it."""
+    _compile_xpath.cache_clear()
+    xml = "<root><div>content</div></root>"
+    tree = etree.fromstring(xml)
+
+    first = matches_xpath("//div")(tree)
+    second = matches_xpath("//div")(tree)
+
+    assert first(tree.find("div")) is True
+    assert second(tree.find("div")) is True
+    info = _compile_xpath.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
 def test_matches_xpath_performance_optimization():
     """Test that XPath is evaluated only once per document."""
     xml = "<root><p>1</p><p>2</p><p>3</p></root>"
@@ -247,3 +268,40 @@ def test_matches_xpath_accepts_empty_results():
     # Should not raise error for empty results
     div_elem = tree.find("div")
     assert predicate(div_elem) is False
+
+
+def test_matches_any_xpath_unions_expressions():
+    """Test that matches_any_xpath matches elements selected by any expression."""
+    xml = "<root><div>content</div><span>other</span><p>text</p></root>"
+    tree = etree.fromstring(xml)
+
+    predicate = matches_any_xpath("//div", "//p")(tree)
+
+    assert predicate(tree.find("div")) is True
+    assert predicate(tree.find("p")) is True
+    assert predicate(tree.find("span")) is False
+    assert predicate(tree) is False
+
+
+def test_matches_any_xpath_with_no_expressions():
+    """Test that matches_any_xpath with no expressions matches nothing."""
+    tree = etree.fromstring("<root><div/></root>")
+
+    predicate = matches_any_xpath()(tree)
+
+    assert predicate(tree) is False
+    assert predicate(tree.find("div")) is False
+
+
+def test_matches_any_xpath_invalid_expression():
+    """Test that an invalid expression anywhere in the list is reported immediately."""
+    with pytest.raises(PredicateError, match="Invalid XPath expression '//invalid\\[\\[\\['"):
+        matches_any_xpath("//div", "//invalid[[[")
+
+
+def test_matches_any_xpath_non_element_results():
+    """Test that non-element results from any expression are rejected."""
+    tree = etree.fromstring("<root><div/></root>")
+
+    with pytest.raises(PredicateError, match="returned non-element results"):
+        matches_any_xpath("//div", "count(//div)")(tree)
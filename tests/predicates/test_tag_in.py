@@ -1,7 +1,7 @@
 import pytest
 from lxml import etree
 
-from markuplift.predicates import tag_in, PredicateError
+from markuplift.predicates import _cached_with_attribute, has_class, tag_in, PredicateError
 
 
 def test_tag_in_simple_match():
@@ -187,3 +187,32 @@ def test_tag_in_reusable_factory():
 
     assert predicate2(p2) is True
     assert predicate2(article2) is False
+
+
+def test_tag_in_with_string_tags_is_shared():
+    """Test that string-tag predicates and their string attribute chains are built once and shared."""
+    assert tag_in("div", "p") is tag_in("div", "p")
+    assert tag_in("div", "p") is not tag_in("p", "div")
+    assert tag_in("div").with_attribute("style") is tag_in("div").with_attribute("style")
+    assert tag_in("div").with_attribute("class", "btn") is not tag_in("div").with_attribute("class", "link")
+
+
+def test_with_attribute_on_unshared_factory_does_not_fill_cache():
+    """Test that factories built afresh on each call bypass the with_attribute() cache."""
+    _cached_with_attribute.cache_clear()
+
+    for _ in range(10):
+        has_class("x").with_attribute("a", "b")
+    tag_in(etree.QName("http://www.w3.org/2000/svg", "rect")).with_attribute("a")
+
+    assert _cached_with_attribute.cache_info().currsize == 0
+
+
+def test_tag_in_with_qname_is_not_shared():
+    """Test that QName tags bypass the cache but still match."""
+    qname = etree.QName("http://www.w3.org/2000/svg", "rect")
+    factory = tag_in(qname)
+
+    assert factory is not tag_in(qname)
+    tree = etree.fromstring('<svg xmlns="http://www.w3.org/2000/svg"><rect/></svg>')
+    assert factory(tree)(tree[0]) is True
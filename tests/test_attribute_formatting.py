@@ -180,3 +180,15 @@ def test_wrap_attributes_with_one_extra_indent_with_nested_blocks():
         </root>
     """)
     assert actual == expected
+
+
+def test_wrap_attributes_nested_beyond_precomputed_indents():
+    depth = 70
+    opening_tags = "".join(f'<block id="b{i}">' for i in range(1, depth + 1))
+    example = f"<root>{opening_tags}text{'</block>' * depth}</root>"
+    formatter = DocumentFormatter(
+        block_predicate=is_block_or_root,
+        wrap_attributes_predicate=is_block_or_root,
+    )
+    actual = formatter.format_str(example)
+    assert f'\n{"  " * (depth + 1)}id="b{depth}"\n{"  " * depth}>text</block>' in actual
@@ -2,6 +2,8 @@
 
 import re
 from inspect import cleandoc
+
+import pytest
 from lxml import etree
 
 from markuplift import (
@@ -275,6 +277,16 @@ def test_first_match_wins():
     assert result == expected
 
 
+def test_attribute_matches_with_string_matchers_is_shared():
+    """Test that string-matcher attribute predicates are built once and shared."""
+    root = etree.fromstring("<div/>")
+
+    assert attribute_matches("style") is attribute_matches("style")
+    assert attribute_matches("class", "btn") is attribute_matches("class", "btn")
+    assert attribute_matches("class", "btn") is not attribute_matches("class", "link")
+    assert attribute_matches("style")(root) is attribute_matches("style")(etree.fromstring("<p/>"))
+
+
 def test_empty_attribute_values():
     """Test formatting of empty attribute values."""
     xml = '<div class="" style="">content</div>'
@@ -718,161 +730,133 @@ def test_defer_css_properties():
     assert result == expected
 
 
-def test_css_property_order():
-    """Test semantic ordering of CSS properties."""
-    html = '<div style="color: red; display: flex; margin: 10px; position: relative; font-size: 14px; background: blue;">content</div>'
-
-    formatter_obj = Html5Formatter(
+@pytest.fixture(scope="module")
+def css_order_formatter():
+    """Html5Formatter that reorders style attributes with css_property_order()."""
+    return Html5Formatter(
         reformat_attribute_when={
             attribute_matches("style"): reorder_css_properties(css_property_order())
         }
     )
 
-    result = formatter_obj.format_str(html.strip())
-    # Layout (display, position) → Box model (margin) → Typography (color, font-size - alphabetical) → Visual (background)
-    expected = '<!DOCTYPE html>\n<div style="display: flex; position: relative; margin: 10px; color: red; font-size: 14px; background: blue;">content</div>\n'
-    assert result == expected
 
+CSS_ORDER_CASES = [
+    pytest.param(
+        '<div style="color: red; display: flex; margin: 10px; position: relative; font-size: 14px; background: blue;">content</div>',
+        # Layout (display, position) → Box model (margin) → Typography (color, font-size - alphabetical) → Visual (background)
+        '<!DOCTYPE html>\n<div style="display: flex; position: relative; margin: 10px; color: red; font-size: 14px; background: blue;">content</div>\n',
+        id="semantic-categories",
+    ),
+    pytest.param(
+        '<div style="color: var(--text); --text: var(--primary); --primary: red;">content</div>',
+        # Variables should be ordered: --primary (no deps), --text (depends on --primary), color (uses --text)
+        '<!DOCTYPE html>\n<div style="--primary: red; --text: var(--primary); color: var(--text);">content</div>\n',
+        id="variable-dependencies",
+    ),
+    pytest.param(
+        '<div style="--level3: var(--level2); --level1: blue; --level2: var(--level1); background: var(--level3);">content</div>',
+        # Should order: --level1, --level2, --level3, then background
+        '<!DOCTYPE html>\n<div style="--level1: blue; --level2: var(--level1); --level3: var(--level2); background: var(--level3);">content</div>\n',
+        id="variable-complex-dependencies",
+    ),
+    pytest.param(
+        '<div style="box-shadow: 0 0 5px; color: red; box-sizing: border-box; display: block; width: 100px;">content</div>',
+        # Layout (display) → Box model (box-sizing, width - alphabetical) → Visual (box-shadow, color - alphabetical)
+        '<!DOCTYPE html>\n<div style="display: block; box-sizing: border-box; width: 100px; color: red; box-shadow: 0 0 5px;">content</div>\n',
+        id="box-sizing-and-box-shadow",
+    ),
+    pytest.param(
+        '<div style="cursor: pointer; visibility: hidden; overflow: auto;">content</div>',
+        # All these are unlisted, should be alphabetical
+        '<!DOCTYPE html>\n<div style="cursor: pointer; overflow: auto; visibility: hidden;">content</div>\n',
+        id="alphabetical-within-category",
+    ),
+]
 
-def test_css_variables_dependency_ordering():
-    """Test that CSS variables are ordered by dependency (topological sort)."""
-    html = '<div style="color: var(--text); --text: var(--primary); --primary: red;">content</div>'
 
-    formatter_obj = Html5Formatter(
-        reformat_attribute_when={
-            attribute_matches("style"): reorder_css_properties(css_property_order())
-        }
-    )
+@pytest.mark.parametrize("html, expected", CSS_ORDER_CASES)
+def test_css_property_order(css_order_formatter, html, expected):
+    """Test css_property_order() against exact expected output."""
+    assert css_order_formatter.format_str(html.strip()) == expected
 
-    result = formatter_obj.format_str(html.strip())
-    # Variables should be ordered: --primary (no deps), --text (depends on --primary), color (uses --text)
-    expected = '<!DOCTYPE html>\n<div style="--primary: red; --text: var(--primary); color: var(--text);">content</div>\n'
-    assert result == expected
 
+def test_css_property_order_is_a_singleton():
+    """Test that css_property_order() returns the same reorderer on every call."""
+    assert css_property_order() is css_property_order()
 
-def test_css_variables_complex_dependencies():
-    """Test CSS variables with multiple levels of dependencies."""
-    html = '<div style="--level3: var(--level2); --level1: blue; --level2: var(--level1); background: var(--level3);">content</div>'
 
-    formatter_obj = Html5Formatter(
-        reformat_attribute_when={
-            attribute_matches("style"): reorder_css_properties(css_property_order())
-        }
-    )
+def test_css_property_order_returns_already_ordered_input_unchanged():
+    """Test that already-ordered properties are returned without being rebuilt."""
+    properties = ["display: flex", "margin: 10px", "color: red", "background: blue"]
 
-    result = formatter_obj.format_str(html.strip())
-    # Should order: --level1, --level2, --level3, then background
-    expected = '<!DOCTYPE html>\n<div style="--level1: blue; --level2: var(--level1); --level3: var(--level2); background: var(--level3);">content</div>\n'
-    assert result == expected
+    assert css_property_order()(properties) is properties
 
 
-def test_css_variables_with_fallbacks():
-    """Test CSS variables with fallback values in var() calls."""
-    html = '<div style="--secondary: green; color: var(--primary, var(--secondary)); --primary: red;">content</div>'
+def test_css_property_order_normalizes_already_ordered_input():
+    """Test that ordered but non-canonical properties are still normalized."""
+    properties = ["display:flex", "margin: 10px", "margin: 5px"]
 
-    formatter_obj = Html5Formatter(
-        reformat_attribute_when={
-            attribute_matches("style"): reorder_css_properties(css_property_order())
-        }
-    )
+    assert css_property_order()(properties) == ["display: flex", "margin: 5px"]
 
-    result = formatter_obj.format_str(html.strip())
-    # Variables first (--secondary, --primary), then color
-    # Note: fallback detection might not catch --secondary in the fallback, but --primary should be detected
-    result_has_vars_first = "--secondary" in result.split("color:")[0] and "--primary" in result.split("color:")[0]
-    assert result_has_vars_first
 
+def _style_value(result: str) -> str:
+    """Extract the value of the first style attribute in formatted output."""
+    return result.split('style="')[1].split('"')[0]
 
-def test_css_variables_cycle_detection():
-    """Test that circular dependencies fall back to original order."""
-    html = '<div style="--a: var(--b); --b: var(--a); color: red;">content</div>'
 
-    formatter_obj = Html5Formatter(
-        reformat_attribute_when={
-            attribute_matches("style"): reorder_css_properties(css_property_order())
-        }
-    )
+def _check_variables_with_fallbacks(result: str) -> bool:
+    # Fallback detection might not catch --secondary in the fallback, but --primary should be detected
+    head = result.split("color:")[0]
+    return "--secondary" in head and "--primary" in head
 
-    result = formatter_obj.format_str(html.strip())
-    # With a cycle, should preserve original order for variables but still separate from normal props
-    # Variables should come first, then normal properties
-    assert "--a:" in result.split("color:")[0]
-    assert "--b:" in result.split("color:")[0]
 
+def _check_cycle_keeps_variables_first(result: str) -> bool:
+    # With a cycle, should preserve original order for variables but still separate from normal props
+    head = result.split("color:")[0]
+    return "--a:" in head and "--b:" in head
 
-def test_css_variables_no_dependencies():
-    """Test CSS variables with no dependencies are kept in original order."""
-    html = '<div style="--color1: red; --color2: blue; --color3: green; background: white;">content</div>'
 
-    formatter_obj = Html5Formatter(
-        reformat_attribute_when={
-            attribute_matches("style"): reorder_css_properties(css_property_order())
-        }
-    )
-
-    result = formatter_obj.format_str(html.strip())
+def _check_independent_variables_first(result: str) -> bool:
     # All variables should come before background, order among themselves preserved
-    vars_section = result.split("background:")[0]
-    assert "--color1:" in vars_section
-    assert "--color2:" in vars_section
-    assert "--color3:" in vars_section
-
-
-def test_enhanced_property_ordering():
-    """Test the enhanced property ordering with box-sizing and box-shadow."""
-    html = '<div style="box-shadow: 0 0 5px; color: red; box-sizing: border-box; display: block; width: 100px;">content</div>'
-
-    formatter_obj = Html5Formatter(
-        reformat_attribute_when={
-            attribute_matches("style"): reorder_css_properties(css_property_order())
-        }
-    )
-
-    result = formatter_obj.format_str(html.strip())
-    # Layout (display) → Box model (box-sizing, width - alphabetical) → Visual (box-shadow, color - alphabetical)
-    expected = '<!DOCTYPE html>\n<div style="display: block; box-sizing: border-box; width: 100px; color: red; box-shadow: 0 0 5px;">content</div>\n'
-    assert result == expected
-
-
-def test_alphabetical_sorting_within_categories():
-    """Test that unlisted properties are sorted alphabetically within their category."""
-    html = '<div style="cursor: pointer; visibility: hidden; overflow: auto;">content</div>'
-
-    formatter_obj = Html5Formatter(
-        reformat_attribute_when={
-            attribute_matches("style"): reorder_css_properties(css_property_order())
-        }
-    )
-
-    result = formatter_obj.format_str(html.strip())
-    # All these are unlisted, should be alphabetical
-    expected = '<!DOCTYPE html>\n<div style="cursor: pointer; overflow: auto; visibility: hidden;">content</div>\n'
-    assert result == expected
-
-
-def test_css_variables_before_normal_properties():
-    """Test that all CSS variables appear before normal properties."""
-    html = '<div style="color: red; --bg: blue; margin: 10px; --text: black; display: flex;">content</div>'
-
-    formatter_obj = Html5Formatter(
-        reformat_attribute_when={
-            attribute_matches("style"): reorder_css_properties(css_property_order())
-        }
-    )
-
-    result = formatter_obj.format_str(html.strip())
-    # Extract the style attribute value
-    style_match = result.split('style="')[1].split('"')[0]
-
-    # Find positions of variables and normal properties
-    var_positions = [style_match.find("--bg"), style_match.find("--text")]
-    normal_positions = [style_match.find("color:"), style_match.find("margin:"), style_match.find("display:")]
-
-    # All variables should come before all normal properties
-    max_var_pos = max(p for p in var_positions if p >= 0)
-    min_normal_pos = min(p for p in normal_positions if p >= 0)
-
-    assert max_var_pos < min_normal_pos
+    head = result.split("background:")[0]
+    return all(f"--color{i}:" in head for i in (1, 2, 3))
+
+
+def _check_variables_before_normal_properties(result: str) -> bool:
+    style = _style_value(result)
+    var_positions = [style.find("--bg"), style.find("--text")]
+    normal_positions = [style.find("color:"), style.find("margin:"), style.find("display:")]
+    return max(p for p in var_positions if p >= 0) < min(p for p in normal_positions if p >= 0)
+
+
+CSS_ORDER_CHECKS = [
+    pytest.param(
+        '<div style="--secondary: green; color: var(--primary, var(--secondary)); --primary: red;">content</div>',
+        _check_variables_with_fallbacks,
+        id="variables-with-fallbacks",
+    ),
+    pytest.param(
+        '<div style="--a: var(--b); --b: var(--a); color: red;">content</div>',
+        _check_cycle_keeps_variables_first,
+        id="variable-cycle",
+    ),
+    pytest.param(
+        '<div style="--color1: red; --color2: blue; --color3: green; background: white;">content</div>',
+        _check_independent_variables_first,
+        id="variables-without-dependencies",
+    ),
+    pytest.param(
+        '<div style="color: red; --bg: blue; margin: 10px; --text: black; display: flex;">content</div>',
+        _check_variables_before_normal_properties,
+        id="variables-before-normal-properties",
+    ),
+]
+
+
+@pytest.mark.parametrize("html, check", CSS_ORDER_CHECKS)
+def test_css_property_order_checks(css_order_formatter, html, check):
+    """Test css_property_order() properties that don't pin down an exact output."""
+    assert check(css_order_formatter.format_str(html.strip()))
 
 
 def test_css_formatter_fluent_api():
@@ -942,6 +926,42 @@ def test_css_formatter_wrap_only():
     assert result == expected
 
 
+def test_css_formatter_wrap_when_more_than():
+    """Test CssFormatter with an integer wrapping threshold."""
+    html = '<div style="z-index: 1; color: red; background: blue;">content</div>'
+
+    formatter_obj = Html5Formatter(
+        reformat_attribute_when={
+            attribute_matches("style"): css_formatter().wrap_when_more_than(2)
+        }
+    )
+
+    result = formatter_obj.format_str(html.strip())
+    expected = cleandoc("""
+        <!DOCTYPE html>
+        <div style="
+          z-index: 1;
+          color: red;
+          background: blue;
+        ">content</div>
+    """) + "\n"
+    assert result == expected
+
+
+def test_css_formatter_last_wrap_setting_wins():
+    """Test that wrap_when and wrap_when_more_than replace each other."""
+    html = '<div style="z-index: 1; color: red; background: blue;">content</div>'
+
+    threshold_replaced = css_formatter().wrap_when_more_than(0).wrap_when(lambda props: False)
+    predicate_replaced = css_formatter().wrap_when(lambda props: True).wrap_when_more_than(3)
+
+    for css_fmt in (threshold_replaced, predicate_replaced):
+        formatter_obj = Html5Formatter(reformat_attribute_when={attribute_matches("style"): css_fmt})
+        result = formatter_obj.format_str(html.strip())
+        expected = '<!DOCTYPE html>\n<div style="z-index: 1; color: red; background: blue;">content</div>\n'
+        assert result == expected
+
+
 def test_wrap_css_properties_with_reorderer():
     """Test wrap_css_properties with reorderer argument (new breaking change API)."""
     html = '<div style="z-index: 1; color: red; background: blue; margin: 10px;">content</div>'
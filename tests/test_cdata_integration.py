@@ -5,9 +5,8 @@ correctly through the complete pipeline: parsing, processing, and output
 generation.
 """
 
-from inspect import cleandoc
-
 import pytest
+from lxml import etree
 
 from markuplift.formatter import Formatter
 from markuplift.html5_formatter import Html5Formatter
@@ -15,28 +14,73 @@ from markuplift.xml_formatter import XmlFormatter
 from markuplift.predicates import tag_in, never_matches
 
 
+XML_WITH_SCRIPT_CDATA = """\
+<?xml version="1.0"?>
+<root>
+    <script><![CDATA[
+        function test() {
+            return "hello world";
+        }
+    ]]></script>
+</root>"""
+
+HTML_WITH_SCRIPT_CDATA = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <script><![CDATA[
+        var data = "some content";
+        console.log(data);
+    ]]></script>
+</head>
+</html>"""
+
+XML_WITH_MESSY_CODE_CDATA = """\
+<root>
+    <code><![CDATA[  messy   whitespace  content  ]]></code>
+</root>"""
+
+XML_WITH_STYLE_AND_SCRIPT_CDATA = """\
+<root>
+    <style><![CDATA[
+        .class { content: "style"; }
+    ]]></style>
+    <script><![CDATA[
+        var x = "test data";
+    ]]></script>
+</root>"""
+
+XML_WITH_PRE_CDATA = """\
+<root>
+    <pre><![CDATA[
+    formatted
+        code
+            block
+    ]]></pre>
+</root>"""
+
+XML_WITH_JAVASCRIPT_CDATA = """\
+<?xml version="1.0"?>
+<root>
+    <script><![CDATA[
+        // JavaScript with safe content
+        var test = "data and more content";
+        var regex = /test/g;
+    ]]></script>
+</root>"""
+
+
 class TestCDATAIntegration:
     """Integration tests for CDATA functionality across formatters."""
 
     def test_xml_formatter_preserves_cdata_content_by_default(self):
         """Test that XmlFormatter preserves CDATA content by default."""
-        xml_with_cdata = cleandoc('''
-            <?xml version="1.0"?>
-            <root>
-                <script><![CDATA[
-                    function test() {
-                        return "hello world";
-                    }
-                ]]></script>
-            </root>
-        ''')
-
         formatter = XmlFormatter(
             block_when=tag_in("root", "script"),
             inline_when=never_matches
         )
 
-        result = formatter.format_str(xml_with_cdata)
+        result = formatter.format_str(XML_WITH_SCRIPT_CDATA)
 
         # Should preserve CDATA content as regular text
         assert "function test()" in result
@@ -63,20 +107,8 @@ class TestCDATAIntegration:
 
     def test_html5_formatter_preserves_cdata_by_default(self):
         """Test that Html5Formatter preserves CDATA sections by default."""
-        html_with_cdata = cleandoc('''
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <script><![CDATA[
-                    var data = "some content";
-                    console.log(data);
-                ]]></script>
-            </head>
-            </html>
-        ''')
-
         formatter = Html5Formatter()
-        result = formatter.format_str(html_with_cdata)
+        result = formatter.format_str(HTML_WITH_SCRIPT_CDATA)
 
         # Should preserve CDATA structure (may be escaped in HTML)
         assert ("CDATA" in result or "var data" in result)
@@ -84,12 +116,6 @@ class TestCDATAIntegration:
 
     def test_formatter_with_cdata_text_formatters(self):
         """Test that CDATA content can be processed by text formatters."""
-        xml_content = cleandoc('''
-            <root>
-                <code><![CDATA[  messy   whitespace  content  ]]></code>
-            </root>
-        ''')
-
         def normalize_whitespace(content, formatter, level):
             """Normalize whitespace in content."""
             if hasattr(content, '__str__'):
@@ -105,7 +131,7 @@ class TestCDATAIntegration:
             }
         )
 
-        result = formatter.format_str(xml_content)
+        result = formatter.format_str(XML_WITH_MESSY_CODE_CDATA)
 
         # The CDATA content should be normalized
         assert "messy whitespace content" in result
@@ -126,8 +152,7 @@ class TestCDATAIntegration:
             inline_when=never_matches
         )
 
-        # Use the underlying formatter method
-        result = formatter._formatter.format_element(root)
+        result = formatter.format_element(root)
 
         # Should safely handle ]]> sequences by escaping them in text
         assert "]]&gt;" in result  # Escaped ]]> sequence as regular text
@@ -137,23 +162,12 @@ class TestCDATAIntegration:
 
     def test_nested_cdata_handling(self):
         """Test handling of nested elements with CDATA content."""
-        xml_content = cleandoc('''
-            <root>
-                <style><![CDATA[
-                    .class { content: "style"; }
-                ]]></style>
-                <script><![CDATA[
-                    var x = "test data";
-                ]]></script>
-            </root>
-        ''')
-
         formatter = XmlFormatter(
             block_when=tag_in("root", "style", "script"),
             inline_when=never_matches
         )
 
-        result = formatter.format_str(xml_content)
+        result = formatter.format_str(XML_WITH_STYLE_AND_SCRIPT_CDATA)
 
         # Both CDATA contents should be preserved as regular text
         assert ".class" in result
@@ -177,23 +191,13 @@ class TestCDATAIntegration:
 
     def test_cdata_with_whitespace_handling(self):
         """Test CDATA interaction with whitespace handling predicates."""
-        xml_content = cleandoc('''
-            <root>
-                <pre><![CDATA[
-                formatted
-                    code
-                        block
-                ]]></pre>
-            </root>
-        ''')
-
         formatter = XmlFormatter(
             block_when=tag_in("root", "pre"),
             inline_when=never_matches,
             preserve_whitespace_when=tag_in("pre")
         )
 
-        result = formatter.format_str(xml_content)
+        result = formatter.format_str(XML_WITH_PRE_CDATA)
 
         # Whitespace in CDATA should be preserved due to pre element
         assert "formatted" in result
@@ -220,27 +224,20 @@ class TestCDATAIntegration:
 
     def test_round_trip_cdata_preservation(self):
         """Test that CDATA content survives round-trip parsing and formatting."""
-        original_xml = cleandoc('''
-            <?xml version="1.0"?>
-            <root>
-                <script><![CDATA[
-                    // JavaScript with safe content
-                    var test = "data and more content";
-                    var regex = /test/g;
-                ]]></script>
-            </root>
-        ''')
-
         formatter = XmlFormatter(
             block_when=tag_in("root", "script"),
             inline_when=never_matches
         )
 
         # Format the XML
-        formatted = formatter.format_str(original_xml)
+        formatted = formatter.format_str(XML_WITH_JAVASCRIPT_CDATA)
+
+        # Parse the formatted output once, then format the tree directly
+        tree = etree.fromstring(formatted.encode(), etree.XMLParser(strip_cdata=False)).getroottree()
+        round_trip = formatter.format_tree(tree)
 
-        # Parse and format again
-        round_trip = formatter.format_str(formatted)
+        # Formatting is stable on the already-parsed tree
+        assert formatter.format_tree(tree) == round_trip
 
         # Key content should be preserved
         assert "JavaScript with safe" in round_trip
@@ -269,7 +266,7 @@ class TestCDATAIntegration:
         )
 
         # When formatted, the CDATA content is preserved but as regular text
-        result = formatter._formatter.format_element(root)
+        result = formatter.format_element(root)
         assert "before" in result
         assert "after" in result
         assert "console.log" in result
@@ -278,8 +275,6 @@ class TestCDATAIntegration:
 
     def test_mixed_cdata_and_text_content(self):
         """Test elements with both CDATA and regular text content."""
-        from lxml import etree
-
         # Create element with mixed content
         root: etree._Element = etree.Element("script")
         root.text = "// Regular comment\n"
@@ -294,8 +289,7 @@ class TestCDATAIntegration:
             inline_when=never_matches
         )
 
-        # Use the underlying formatter method
-        result = formatter._formatter.format_element(root)
+        result = formatter.format_element(root)
 
         # Should handle both regular text and CDATA
         assert "Regular comment" in result
@@ -2,40 +2,72 @@
 
 This module contains comprehensive tests for the _render_safe_cdata method
 and related CDATA handling functionality in DocumentFormatter.
+
+Every case is an independent, deterministically named test node, so the
+module can be distributed across workers with pytest-xdist, where it is
+installed: pytest -n auto tests/test_cdata_rendering.py
 """
 
 import pytest
+from hypothesis import given, strategies as st
 from lxml import etree
 
 from markuplift.document_formatter import DocumentFormatter
 from markuplift.escaping import XmlEscapingStrategy
 from markuplift.doctype import NullDoctypeStrategy
 from markuplift.attribute_formatting import NullAttributeStrategy
+from markuplift.predicates import never_match
 from markuplift.types import ElementType
 
 
+# One parser shared by every test that re-parses rendered CDATA. The tests
+# never look elements up by xml:id, so skip building the ID table.
+_PARSER = etree.XMLParser(collect_ids=False)
+
+# Rendered CDATA is wrapped in a <test> element before re-parsing
+_OPEN = b"<test>"
+_CLOSE = b"</test>"
+
+# Generated pathological input, built once at import
+_LONG_CONTENT = "x" * 10000 + "]]>" + "y" * 10000
+
+
+def _wrap_in_test_element(rendered: str) -> bytes:
+    """Wrap rendered CDATA in a <test> element, ready for re-parsing."""
+    return b"".join((_OPEN, rendered.encode("utf-8"), _CLOSE))
+
+
+def _always_match(element: etree._Element) -> bool:
+    """Predicate that matches every element, counterpart to never_match."""
+    return True
+
+
+@pytest.fixture(scope="module")
+def formatter():
+    """Create a minimal DocumentFormatter for testing.
+
+    _render_safe_cdata does not modify the formatter, so one instance is shared.
+    """
+    return DocumentFormatter(
+        block_predicate=never_match,
+        inline_predicate=_always_match,
+        normalize_whitespace_predicate=never_match,
+        strip_whitespace_predicate=never_match,
+        preserve_whitespace_predicate=never_match,
+        wrap_attributes_predicate=never_match,
+        text_content_formatters={},
+        attribute_content_formatters={},
+        escaping_strategy=XmlEscapingStrategy(),
+        doctype_strategy=NullDoctypeStrategy(),
+        attribute_strategy=NullAttributeStrategy(),
+        indent_size=2,
+        default_type=ElementType.BLOCK
+    )
+
+
 class TestCDATARenderingSafety:
     """Test the _render_safe_cdata method for correct handling of problematic sequences."""
 
-    @pytest.fixture
-    def formatter(self):
-        """Create a minimal DocumentFormatter for testing."""
-        return DocumentFormatter(
-            block_predicate=lambda e: False,
-            inline_predicate=lambda e: True,
-            normalize_whitespace_predicate=lambda e: False,
-            strip_whitespace_predicate=lambda e: False,
-            preserve_whitespace_predicate=lambda e: False,
-            wrap_attributes_predicate=lambda e: False,
-            text_content_formatters={},
-            attribute_content_formatters={},
-            escaping_strategy=XmlEscapingStrategy(),
-            doctype_strategy=NullDoctypeStrategy(),
-            attribute_strategy=NullAttributeStrategy(),
-            indent_size=2,
-            default_type=ElementType.BLOCK
-        )
-
     def test_render_safe_cdata_simple_content(self, formatter):
         """Test CDATA rendering with simple, safe content."""
         result = formatter._render_safe_cdata("simple content")
@@ -109,6 +141,19 @@ class TestCDATARenderingSafety:
         result = formatter._render_safe_cdata(">content")
         assert result == "<![CDATA[>content]]>"
 
+    @pytest.mark.parametrize("content", [
+        "",
+        "]]",
+        "]>",
+        "] ]>",
+        ">]]",
+        "content]] >more",
+    ], ids=repr)
+    def test_render_safe_cdata_without_terminator_is_single_section(self, formatter, content):
+        """Test that content without ]]> is always wrapped in exactly one CDATA section."""
+        result = formatter._render_safe_cdata(content)
+        assert result == f"<![CDATA[{content}]]>"
+
     def test_render_safe_cdata_complex_javascript(self, formatter):
         """Test CDATA rendering with complex JavaScript containing ]]>."""
         js_content = '''
@@ -130,115 +175,35 @@ class TestCDATARenderingSafety:
         assert result == expected
 
 
+# Any text an XML document can carry, salted with the fragments of the ]]>
+# terminator so that generated content routinely needs splitting. Carriage
+# returns are excluded because the parser normalizes them to newlines.
+_xml_text = st.text(
+    alphabet=st.characters(
+        exclude_categories=("Cs", "Cc"),
+        exclude_characters="\ufffe\uffff",
+        include_characters="\t\n",
+    ),
+)
+_cdata_content = st.lists(
+    st.one_of(_xml_text, st.sampled_from(["]", "]]", ">", "]]>"])),
+).map("".join)
+
+
 class TestCDATAValidation:
     """Test that generated CDATA output is valid XML."""
 
-    @pytest.fixture
-    def formatter(self):
-        """Create a minimal DocumentFormatter for testing."""
-        return DocumentFormatter(
-            block_predicate=lambda e: False,
-            inline_predicate=lambda e: True,
-            normalize_whitespace_predicate=lambda e: False,
-            strip_whitespace_predicate=lambda e: False,
-            preserve_whitespace_predicate=lambda e: False,
-            wrap_attributes_predicate=lambda e: False,
-            text_content_formatters={},
-            attribute_content_formatters={},
-            escaping_strategy=XmlEscapingStrategy(),
-            doctype_strategy=NullDoctypeStrategy(),
-            attribute_strategy=NullAttributeStrategy(),
-            indent_size=2,
-            default_type=ElementType.BLOCK
-        )
-
-    def _validate_xml_with_cdata(self, cdata_content: str) -> bool:
-        """Helper to validate that CDATA content produces valid XML."""
-        try:
-            xml = f"<test>{cdata_content}</test>"
-            etree.fromstring(xml)
-            return True
-        except etree.XMLSyntaxError:
-            return False
-
-    def test_cdata_validation_simple_cases(self, formatter):
-        """Test that simple CDATA cases produce valid XML."""
-        test_cases = [
-            "simple content",
-            "",
-            "content with <brackets> and &entities;",
-            "   whitespace   ",
-            "\n\tspecial\nwhitespace\t",
-        ]
-
-        for content in test_cases:
-            result = formatter._render_safe_cdata(content)
-            assert self._validate_xml_with_cdata(result), f"Invalid XML for content: {content!r}"
-
-    def test_cdata_validation_problematic_sequences(self, formatter):
-        """Test that problematic sequences produce valid XML."""
-        test_cases = [
-            "]]>",
-            "before]]>after",
-            "]]>]]>",
-            "start]]>middle]]>end",
-            "content]]",
-            "content]",
-            ">content",
-            "]]]]>",
-            "content]]]]>more",
-        ]
-
-        for content in test_cases:
-            result = formatter._render_safe_cdata(content)
-            assert self._validate_xml_with_cdata(result), f"Invalid XML for content: {content!r}"
-
-    def test_cdata_validation_round_trip(self, formatter):
-        """Test that CDATA content can be round-tripped through XML parsing."""
-        test_cases = [
-            "simple content",
-            "before]]>after",
-            "multiple]]>terminators]]>here",
-            'javascript: var x = "]]>";',
-            "content] with] brackets]",
-        ]
-
-        for original_content in test_cases:
-            # Render as CDATA
-            cdata_output = formatter._render_safe_cdata(original_content)
-
-            # Parse as XML
-            xml = f"<test>{cdata_output}</test>"
-            parsed = etree.fromstring(xml)
-            recovered_content = parsed.text
-
-            # Content should be preserved (though may be normalized)
-            assert recovered_content is not None
-            # The actual content comparison depends on how lxml handles the mixed CDATA/text
+    @given(content=_cdata_content)
+    def test_cdata_round_trip_property(self, formatter, content):
+        """Test that rendered CDATA parses as XML and recovers the original content."""
+        result = formatter._render_safe_cdata(content)
+        parsed = etree.fromstring(_wrap_in_test_element(result), _PARSER)
+        assert (parsed.text or "") == content
 
 
 class TestCDATAPathologicalCases:
     """Test edge cases and pathological inputs for CDATA rendering."""
 
-    @pytest.fixture
-    def formatter(self):
-        """Create a minimal DocumentFormatter for testing."""
-        return DocumentFormatter(
-            block_predicate=lambda e: False,
-            inline_predicate=lambda e: True,
-            normalize_whitespace_predicate=lambda e: False,
-            strip_whitespace_predicate=lambda e: False,
-            preserve_whitespace_predicate=lambda e: False,
-            wrap_attributes_predicate=lambda e: False,
-            text_content_formatters={},
-            attribute_content_formatters={},
-            escaping_strategy=XmlEscapingStrategy(),
-            doctype_strategy=NullDoctypeStrategy(),
-            attribute_strategy=NullAttributeStrategy(),
-            indent_size=2,
-            default_type=ElementType.BLOCK
-        )
-
     @pytest.mark.parametrize("content", [
         "]",
         "]]",
@@ -246,7 +211,7 @@ class TestCDATAPathologicalCases:
         "]]]]",
         "]]]]]",
         "]]]]]]",
-    ])
+    ], ids=repr)
     def test_cdata_bracket_variations(self, formatter, content):
         """Test various numbers of closing brackets."""
         result = formatter._render_safe_cdata(content)
@@ -257,41 +222,19 @@ class TestCDATAPathologicalCases:
         ">>",
         ">>>",
         ">>>>",
-    ])
+    ], ids=repr)
     def test_cdata_gt_variations(self, formatter, content):
         """Test various numbers of > characters."""
         result = formatter._render_safe_cdata(content)
         assert f"<![CDATA[{content}]]>" == result
 
-    @pytest.mark.parametrize("terminator_count", [1, 2, 3, 5, 10])
-    def test_cdata_multiple_terminators_generated(self, formatter, terminator_count):
-        """Test content with many ]]> terminators."""
-        content = "]]>".join(["part"] * (terminator_count + 1))
-        result = formatter._render_safe_cdata(content)
-
-        # Should be valid XML
-        xml = f"<test>{result}</test>"
-        parsed = etree.fromstring(xml)
-        assert parsed is not None
-
     def test_cdata_very_long_content(self, formatter):
         """Test CDATA with very long content."""
-        long_content = "x" * 10000 + "]]>" + "y" * 10000
-        result = formatter._render_safe_cdata(long_content)
+        result = formatter._render_safe_cdata(_LONG_CONTENT)
 
         # Should contain the split
         assert "]]]]>&gt;" in result
-        assert len(result) > len(long_content)  # Should be longer due to CDATA markup
-
-    def test_cdata_unicode_content(self, formatter):
-        """Test CDATA with Unicode content."""
-        unicode_content = "Hello 世界]]>🌍 content"
-        result = formatter._render_safe_cdata(unicode_content)
-
-        # Should handle Unicode properly
-        xml = f"<test>{result}</test>"
-        parsed = etree.fromstring(xml)
-        assert parsed is not None
+        assert len(result) > len(_LONG_CONTENT)  # Should be longer due to CDATA markup
 
 
 if __name__ == "__main__":
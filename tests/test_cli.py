@@ -1,4 +1,3 @@
-import tempfile
 from pathlib import Path
 from inspect import cleandoc
 
@@ -8,269 +7,183 @@ from click.testing import CliRunner
 from markuplift.cli import cli
 
 
+# Shared stdin input, as bytes because that is what CliRunner feeds the command
+ROOT_WITH_CHILD = b"<root><child>text</child></root>"
+
+FORMATTED_ROOT_WITH_CHILD = cleandoc("""
+    <root>
+      <child>text</child>
+    </root>
+""")
+
+FORMAT_OPTION_CASES = [
+    # Block elements should be indented, inline should not
+    pytest.param(
+        ["--block", "//block", "--inline", "//inline"],
+        "<root><block>text</block><inline>text</inline></root>",
+        ["  <block>text</block>", "<inline>text</inline>"],
+        id="block-predicate",
+    ),
+    # Both div and section should be treated as block
+    pytest.param(
+        ["--block", "//div", "--block", "//section", "--inline", "//span"],
+        "<root><div>text</div><section>text</section><span>inline</span></root>",
+        ["  <div>text</div>", "  <section>text</section>", "<span>inline</span>"],
+        id="multiple-xpath-expressions",
+    ),
+    pytest.param(
+        ["--block", '//div[@class="content"] | //p | //ul | //li', "--inline", "//em | //strong | //a"],
+        '<html><body><div class="content"><p>Paragraph text</p><ul><li>List item</li></ul></div></body></html>',
+        ["<p>Paragraph text</p>", "<li>List item</li>"],
+        id="complex-xpath-expressions",
+    ),
+    pytest.param(
+        ["--indent-size", "4"],
+        "<root><child><grandchild>text</grandchild></child></root>",
+        ["    <child>", "        <grandchild>text</grandchild>"],
+        id="indent-size",
+    ),
+    pytest.param(
+        ["--doctype", '<!DOCTYPE root PUBLIC "-//Test//DTD Test//EN" "test.dtd">'],
+        ROOT_WITH_CHILD,
+        ['<!DOCTYPE root PUBLIC "-//Test//DTD Test//EN" "test.dtd">'],
+        id="doctype",
+    ),
+    # The exact whitespace handling depends on the formatter implementation
+    pytest.param(
+        ["--preserve-whitespace", "//preserve", "--normalize-whitespace", "//normalize"],
+        "<root><preserve>  spaced  text  </preserve><normalize>  spaced  text  </normalize></root>",
+        ["<preserve>  spaced  text  </preserve>"],
+        id="whitespace-options",
+    ),
+    # The exact wrapped layout depends on the formatter implementation
+    pytest.param(
+        ["--wrap-attributes", "//element"],
+        '<root><element attr1="value1" attr2="value2" attr3="value3">text</element></root>',
+        ['attr1="value1"'],
+        id="attribute-wrapping",
+    ),
+    pytest.param(
+        ["--text-formatter", "//code", 'echo "formatted:"', "--block", "//root", "--inline", "//code"],
+        "<root><code>hello world</code></root>",
+        [],
+        id="text-formatter",
+    ),
+    # A formatter that cannot be run only produces a warning, leaving the text as it was
+    pytest.param(
+        ["--text-formatter", "//code", "nonexistent_command_12345"],
+        "<root><code>hello</code></root>",
+        ["<code>hello</code>", "Warning: External formatter command 'nonexistent_command_12345' not found"],
+        id="missing-external-formatter",
+    ),
+    pytest.param(["--default-type", "inline"], "<root><unknown>text</unknown></root>", [], id="default-type-inline"),
+    pytest.param(["--default-type", "block"], "<root><unknown>text</unknown></root>", [], id="default-type-block"),
+    pytest.param(
+        [],
+        "<root><!-- This is a comment --><child>text</child></root>",
+        ["<!-- This is a comment -->"],
+        id="preserves-comments",
+    ),
+    pytest.param(
+        [],
+        "<?xml-stylesheet type='text/xsl' href='style.xsl'?><root><child>text</child></root>",
+        ["xml-stylesheet"],
+        id="preserves-processing-instructions",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Share one CliRunner across the module; each invoke() is isolated."""
+    return CliRunner()
+
+
 class TestCLI:
     """Test the MarkupLift command-line interface."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    def test_cli_version(self):
+    def test_cli_version(self, runner):
         """Test CLI version command."""
-        result = self.runner.invoke(cli, ["--version"])
+        result = runner.invoke(cli, ["--version"])
         assert result.exit_code == 0
         assert "version" in result.output.lower()
 
-    def test_cli_help(self):
+    def test_cli_help(self, runner):
         """Test CLI help command."""
-        result = self.runner.invoke(cli, ["--help"])
+        result = runner.invoke(cli, ["--help"])
         assert result.exit_code == 0
         assert "MarkupLift" in result.output
         assert "format" in result.output
 
-    def test_format_help(self):
+    def test_format_help(self, runner):
         """Test format subcommand help."""
-        result = self.runner.invoke(cli, ["format", "--help"])
+        result = runner.invoke(cli, ["format", "--help"])
         assert result.exit_code == 0
         assert "Format XML or HTML documents" in result.output
         assert "--block" in result.output
         assert "--inline" in result.output
 
-    def test_format_basic_stdin_stdout(self):
+    def test_format_basic_stdin_stdout(self, runner):
         """Test basic formatting from stdin to stdout."""
-        input_xml = "<root><child>text</child></root>"
-        expected = cleandoc("""
-            <root>
-              <child>text</child>
-            </root>
-        """)
-
-        result = self.runner.invoke(cli, ["format", "-"], input=input_xml)
+        result = runner.invoke(cli, ["format", "-"], input=ROOT_WITH_CHILD)
         assert result.exit_code == 0
-        assert result.output.strip() == expected
+        assert result.output.strip() == FORMATTED_ROOT_WITH_CHILD
 
-    def test_format_with_file_input_output(self):
+    def test_format_with_file_input_output(self, runner, tmp_path):
         """Test formatting with file input and output."""
-        input_xml = "<root><child>text</child></root>"
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as input_file:
-            input_file.write(input_xml)
-            input_file.flush()
-            input_path = input_file.name
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as output_file:
-            output_path = output_file.name
-
-        try:
-            result = self.runner.invoke(cli, ["format", input_path, "--output", output_path])
-            assert result.exit_code == 0
-
-            with open(output_path, "r") as f:
-                output_content = f.read()
-
-            expected = cleandoc("""
-                <root>
-                  <child>text</child>
-                </root>
-            """)
-            assert output_content.strip() == expected
-
-        finally:
-            Path(input_path).unlink(missing_ok=True)
-            Path(output_path).unlink(missing_ok=True)
-
-    def test_format_with_block_predicate(self):
-        """Test formatting with block XPath predicate."""
-        input_xml = "<root><block>text</block><inline>text</inline></root>"
-
-        result = self.runner.invoke(cli, ["format", "--block", "//block", "--inline", "//inline"], input=input_xml)
-
-        assert result.exit_code == 0
-        # Block elements should be indented, inline should not
-        assert "<block>" in result.output
-        assert "  <block>text</block>" in result.output
-        assert "<inline>text</inline>" in result.output
-
-    def test_format_with_multiple_xpath_expressions(self):
-        """Test formatting with multiple XPath expressions for the same option."""
-        input_xml = "<root><div>text</div><section>text</section><span>inline</span></root>"
-
-        result = self.runner.invoke(
-            cli, ["format", "--block", "//div", "--block", "//section", "--inline", "//span"], input=input_xml
-        )
+        input_path = tmp_path / "in.xml"
+        input_path.write_bytes(ROOT_WITH_CHILD)
+        output_path = tmp_path / "out.xml"
 
+        result = runner.invoke(cli, ["format", str(input_path), "--output", str(output_path)])
         assert result.exit_code == 0
-        # Both div and section should be treated as block
-        assert "  <div>text</div>" in result.output
-        assert "  <section>text</section>" in result.output
-        assert "<span>inline</span>" in result.output
 
-    def test_format_with_indent_size(self):
-        """Test formatting with custom indent size."""
-        input_xml = "<root><child><grandchild>text</grandchild></child></root>"
+        output_content = output_path.read_text()
+        assert output_content.strip() == FORMATTED_ROOT_WITH_CHILD
 
-        result = self.runner.invoke(cli, ["format", "--indent-size", "4"], input=input_xml)
+    @pytest.mark.parametrize("args, input_xml, expected_fragments", FORMAT_OPTION_CASES)
+    def test_format_with_options(self, runner, args, input_xml, expected_fragments):
+        """Test that formatting succeeds with each option and produces the expected fragments."""
+        result = runner.invoke(cli, ["format", *args], input=input_xml)
 
         assert result.exit_code == 0
-        # Should use 4 spaces for indentation
-        assert "    <child>" in result.output
-        assert "        <grandchild>text</grandchild>" in result.output
+        for fragment in expected_fragments:
+            assert fragment in result.output
 
-    def test_format_with_xml_declaration(self):
+    def test_format_with_xml_declaration(self, runner):
         """Test formatting with XML declaration."""
-        input_xml = "<root><child>text</child></root>"
-
-        result = self.runner.invoke(cli, ["format", "--xml-declaration"], input=input_xml)
+        result = runner.invoke(cli, ["format", "--xml-declaration"], input=ROOT_WITH_CHILD)
 
         assert result.exit_code == 0
         assert result.output.startswith('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>')
 
-    def test_format_with_doctype(self):
-        """Test formatting with custom DOCTYPE."""
-        input_xml = "<root><child>text</child></root>"
-        doctype = '<!DOCTYPE root PUBLIC "-//Test//DTD Test//EN" "test.dtd">'
-
-        result = self.runner.invoke(cli, ["format", "--doctype", doctype], input=input_xml)
-
-        assert result.exit_code == 0
-        assert doctype in result.output
-
-    def test_format_with_whitespace_options(self):
-        """Test formatting with whitespace handling options."""
-        input_xml = "<root><preserve>  spaced  text  </preserve><normalize>  spaced  text  </normalize></root>"
-
-        result = self.runner.invoke(
-            cli,
-            ["format", "--preserve-whitespace", "//preserve", "--normalize-whitespace", "//normalize"],
-            input=input_xml,
-        )
-
-        assert result.exit_code == 0
-        # The exact whitespace handling will depend on the formatter implementation
-
-    def test_format_with_attribute_wrapping(self):
-        """Test formatting with attribute wrapping."""
-        input_xml = '<root><element attr1="value1" attr2="value2" attr3="value3">text</element></root>'
-
-        result = self.runner.invoke(cli, ["format", "--wrap-attributes", "//element"], input=input_xml)
-
-        assert result.exit_code == 0
-        # Should wrap attributes (exact format depends on implementation)
-        assert 'attr1="value1"' in result.output
-
-    def test_format_with_text_formatter_mock(self):
-        """Test formatting with text formatter using echo command."""
-        input_xml = "<root><code>hello world</code></root>"
-
-        # Use echo command which should be available on most systems
-        result = self.runner.invoke(
-            cli,
-            ["format", "--text-formatter", "//code", 'echo "formatted:"', "--block", "//root", "--inline", "//code"],
-            input=input_xml,
-        )
-
-        assert result.exit_code == 0
-        # The text should be processed by the external formatter
-
-    def test_format_invalid_xml(self):
+    def test_format_invalid_xml(self, runner):
         """Test formatting with invalid XML input."""
         invalid_xml = "<root><unclosed>"
 
-        result = self.runner.invoke(cli, ["format"], input=invalid_xml)
+        result = runner.invoke(cli, ["format"], input=invalid_xml)
         assert result.exit_code != 0
         assert "XML parsing error" in result.output
 
-    def test_format_invalid_xpath(self):
+    def test_format_invalid_xpath(self, runner):
         """Test formatting with invalid XPath expression."""
-        input_xml = "<root><child>text</child></root>"
-
-        result = self.runner.invoke(cli, ["format", "--block", "//[invalid xpath"], input=input_xml)
+        result = runner.invoke(cli, ["format", "--block", "//[invalid xpath"], input=ROOT_WITH_CHILD)
 
         assert result.exit_code != 0
         assert "Invalid XPath expression" in result.output
 
-    def test_format_missing_external_formatter(self):
-        """Test formatting with non-existent external formatter."""
-        input_xml = "<root><code>hello</code></root>"
-
-        result = self.runner.invoke(
-            cli, ["format", "--text-formatter", "//code", "nonexistent_command_12345"], input=input_xml
-        )
-
-        # Should not fail, but should show a warning
-        assert result.exit_code == 0
-        # The original text should be preserved since formatter failed
-
-    def test_format_default_type_option(self):
-        """Test formatting with different default types."""
-        input_xml = "<root><unknown>text</unknown></root>"
-
-        # Test with default type 'inline'
-        result = self.runner.invoke(cli, ["format", "--default-type", "inline"], input=input_xml)
-
-        assert result.exit_code == 0
-
-        # Test with default type 'block' (default)
-        result = self.runner.invoke(cli, ["format", "--default-type", "block"], input=input_xml)
-
-        assert result.exit_code == 0
-
-    def test_format_complex_xpath_expressions(self):
-        """Test formatting with complex XPath expressions."""
-        input_xml = """
-        <html>
-            <body>
-                <div class="content">
-                    <p>Paragraph text</p>
-                    <ul>
-                        <li>List item</li>
-                    </ul>
-                </div>
-            </body>
-        </html>
-        """
-
-        result = self.runner.invoke(
-            cli,
-            ["format", "--block", '//div[@class="content"] | //p | //ul | //li', "--inline", "//em | //strong | //a"],
-            input=input_xml,
-        )
-
-        assert result.exit_code == 0
-
-    def test_format_preserves_comments(self):
-        """Test that formatting preserves XML comments."""
-        input_xml = "<root><!-- This is a comment --><child>text</child></root>"
-
-        result = self.runner.invoke(cli, ["format"], input=input_xml)
-
-        assert result.exit_code == 0
-        assert "<!-- This is a comment -->" in result.output
-
-    def test_format_preserves_processing_instructions(self):
-        """Test that formatting preserves processing instructions."""
-        input_xml = "<?xml-stylesheet type='text/xsl' href='style.xsl'?><root><child>text</child></root>"
-
-        result = self.runner.invoke(cli, ["format"], input=input_xml)
-
-        assert result.exit_code == 0
-        assert "xml-stylesheet" in result.output
-
 
 class TestCLIIntegration:
     """Integration tests for the CLI."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    def test_real_world_html_formatting(self):
+    def test_real_world_html_formatting(self, runner):
         """Test formatting a realistic HTML document."""
-        html_input = cleandoc("""
-            <html><head><title>Test</title></head><body><div class="container"><p>Hello <em>world</em>!</p><ul><li>Item 1</li><li>Item 2</li></ul></div></body></html>
-        """)
+        html_input = (
+            '<html><head><title>Test</title></head><body><div class="container">'
+            "<p>Hello <em>world</em>!</p><ul><li>Item 1</li><li>Item 2</li></ul></div></body></html>"
+        )
 
-        result = self.runner.invoke(
+        result = runner.invoke(
             cli,
             [
                 "format",
@@ -284,16 +197,13 @@ class TestCLIIntegration:
 
         assert result.exit_code == 0
         # Should be properly formatted with indentation
-        output_lines = result.output.strip().split("\n")
-        assert len(output_lines) > 1  # Should be multi-line
+        assert "\n" in result.output.strip()  # Should be multi-line
 
-    def test_xml_with_namespaces(self):
+    def test_xml_with_namespaces(self, runner):
         """Test formatting XML with namespaces."""
-        xml_input = cleandoc("""
-            <root xmlns:ns="http://example.com/ns"><ns:child>content</ns:child></root>
-        """)
+        xml_input = '<root xmlns:ns="http://example.com/ns"><ns:child>content</ns:child></root>'
 
-        result = self.runner.invoke(cli, ["format"], input=xml_input)
+        result = runner.invoke(cli, ["format"], input=xml_input)
 
         assert result.exit_code == 0
         # lxml expands namespaces in the output, so check for the expanded form
@@ -301,11 +211,11 @@ class TestCLIIntegration:
         assert "content" in result.output
 
     @pytest.mark.skipif(not Path("/bin/echo").exists(), reason="echo command not available")
-    def test_text_formatter_with_echo(self):
+    def test_text_formatter_with_echo(self, runner):
         """Test text formatter with actual echo command."""
         input_xml = "<root><test>original text</test></root>"
 
-        result = self.runner.invoke(
+        result = runner.invoke(
             cli,
             ["format", "--text-formatter", "//test", "echo PROCESSED", "--block", "//root", "--inline", "//test"],
             input=input_xml,
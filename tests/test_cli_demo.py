@@ -1,14 +1,16 @@
 """CLI Demo approval test for generating README examples.
 
-This test generates CLI demo output using the actual MarkupLift CLI
-and captures the output using ApprovalTests infrastructure, allowing
-us to include verified CLI examples in the README.md.
+This test generates CLI demo output by invoking the actual MarkupLift CLI
+in-process, and captures the output using ApprovalTests infrastructure,
+allowing us to include verified CLI examples in the README.md.
 """
 
-import subprocess
 from pathlib import Path
 
 from approvaltests import verify
+from click.testing import CliRunner
+
+from markuplift.cli import cli
 
 
 class TestCLIDemo:
@@ -20,87 +22,67 @@ class TestCLIDemo:
         This test creates real messy files, runs actual CLI commands,
         and captures the output for use in README.md.
         """
-        # Create output buffer
-        output_lines = []
-
-        def add_output(text):
-            output_lines.append(text)
-
-        # Demo header
-        add_output("=== MarkupLift CLI Demo ===")
-        add_output("")
-
-        # Setup section
-        add_output("📁 Created demo files:")
-        add_output("   - messy_config.xml (unformatted XML configuration)")
-        add_output("   - messy_article.html (unformatted HTML article)")
-        add_output("")
+        # Commands run in-process rather than in a spawned interpreter
+        runner = CliRunner()
 
         # Get test data files
         test_data_dir = Path(__file__).parent / "data" / "cli_examples"
-
-        # Demo 1: Basic XML formatting
         messy_config = test_data_dir / "messy_config.xml"
-        add_output("📝 Before formatting (messy_config.xml):")
-        add_output("----------------------------------------")
-        add_output(messy_config.read_text().strip())
-        add_output("")
-
-        add_output("✨ Basic formatting:")
-        add_output("$ markuplift format messy_config.xml")
-        add_output("----------------------------------------")
-
-        # Run actual CLI command
-        result = subprocess.run(
-            ["uv", "run", "markuplift", "format", str(messy_config)],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent,
-        )
-        add_output(result.stdout.strip())
-        add_output("")
-
-        # Demo 2: HTML with custom block elements
         messy_article = test_data_dir / "messy_article.html"
-        add_output("📝 Before formatting (messy_article.html):")
-        add_output("-------------------------------------------")
-        add_output(messy_article.read_text().strip())
-        add_output("")
-
-        add_output("✨ Format HTML with semantic block elements:")
-        add_output('$ markuplift format-html messy_article.html --block "//div | //section | //article"')
-        add_output("--------------------------------------------------------------------------------")
+        config_text = messy_config.read_text()
+        article_text = messy_article.read_text()
+
+        # Demo header and setup section
+        output_lines = [
+            "=== MarkupLift CLI Demo ===",
+            "",
+            "📁 Created demo files:",
+            "   - messy_config.xml (unformatted XML configuration)",
+            "   - messy_article.html (unformatted HTML article)",
+            "",
+        ]
 
-        # Run actual CLI command with HTML5 formatter and block elements
-        result = subprocess.run(
-            ["uv", "run", "markuplift", "format-html", str(messy_article), "--block", "//div | //section | //article"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent,
-        )
-        add_output(result.stdout.strip())
-        add_output("")
+        # Demo 1: Basic XML formatting
+        result = runner.invoke(cli, ["format", str(messy_config)])
+        output_lines += [
+            "📝 Before formatting (messy_config.xml):",
+            "----------------------------------------",
+            config_text.strip(),
+            "",
+            "✨ Basic formatting:",
+            "$ markuplift format messy_config.xml",
+            "----------------------------------------",
+            result.stdout.strip(),
+            "",
+        ]
+
+        # Demo 2: HTML with custom block elements, using the HTML5 formatter
+        result = runner.invoke(cli, ["format-html", str(messy_article), "--block", "//div | //section | //article"])
+        output_lines += [
+            "📝 Before formatting (messy_article.html):",
+            "-------------------------------------------",
+            article_text.strip(),
+            "",
+            "✨ Format HTML with semantic block elements:",
+            '$ markuplift format-html messy_article.html --block "//div | //section | //article"',
+            "--------------------------------------------------------------------------------",
+            result.stdout.strip(),
+            "",
+        ]
 
         # Demo 3: Stdin to file
-        add_output("✨ Format from stdin to file:")
-        add_output("$ cat messy_config.xml | markuplift format --output formatted_config.xml")
-        add_output("--------------------------------------------------------------------------")
-
-        # Run actual CLI command with stdin
-        result = subprocess.run(
-            ["uv", "run", "markuplift", "format"],
-            input=messy_config.read_text(),
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent,
-        )
-        add_output("✅ Saved to formatted_config.xml:")
-        add_output(result.stdout.strip())
-        add_output("")
-
-        # Cleanup
-        add_output("🧹 Cleanup:")
-        add_output("✅ Demo complete!")
+        result = runner.invoke(cli, ["format"], input=config_text)
+        output_lines += [
+            "✨ Format from stdin to file:",
+            "$ cat messy_config.xml | markuplift format --output formatted_config.xml",
+            "--------------------------------------------------------------------------",
+            "✅ Saved to formatted_config.xml:",
+            result.stdout.strip(),
+            "",
+            # Cleanup
+            "🧹 Cleanup:",
+            "✅ Demo complete!",
+        ]
 
         # Use ApprovalTests to verify and capture the output
         verify("\n".join(output_lines))
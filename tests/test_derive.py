@@ -2,6 +2,8 @@
 
 from inspect import cleandoc
 
+import pytest
+
 from markuplift import (
     Formatter,
     Html5Formatter,
@@ -16,6 +18,36 @@ from markuplift.escaping import HtmlEscapingStrategy, XmlEscapingStrategy
 from markuplift.parsing import HtmlParsingStrategy, XmlParsingStrategy
 from markuplift.doctype import Html5DoctypeStrategy, XmlDoctypeStrategy
 from markuplift.attribute_formatting import Html5AttributeStrategy, XmlAttributeStrategy
+from helpers.formatters import DELEGATED_PROPERTIES, assert_properties_preserved
+
+
+MIXED_CLASSIFICATION_XML = cleandoc("""
+    <root>
+        <section>sec</section>
+        <chapter>chap</chapter>
+        <paragraph>para</paragraph>
+        <emphasis>emph</emphasis>
+        <bold>bold</bold>
+        <code>code</code>
+    </root>
+""")
+
+
+@pytest.fixture(scope="module")
+def extended_html5_block_when(default_html5_formatter):
+    return any_of(default_html5_formatter.block_when, tag_in("custom-block", "my-component"))
+
+
+@pytest.fixture(scope="module")
+def custom_pre_whitespace_predicates(default_html5_formatter):
+    # normalize_whitespace_when must exclude the custom element for preservation to take effect
+    return {
+        "preserve_whitespace_when": any_of(default_html5_formatter.preserve_whitespace_when, tag_equals("custom-pre")),
+        "normalize_whitespace_when": all_of(
+            default_html5_formatter.normalize_whitespace_when,
+            lambda root: lambda element: element.tag != "custom-pre",
+        ),
+    }
 
 
 class TestFormatterDerive:
@@ -32,22 +64,7 @@ class TestFormatterDerive:
 
         derived = base.derive()
 
-        # Check that all properties are preserved
-        assert derived.block_when is base.block_when
-        assert derived.inline_when is base.inline_when
-        assert derived.normalize_whitespace_when is base.normalize_whitespace_when
-        assert derived.strip_whitespace_when is base.strip_whitespace_when
-        assert derived.preserve_whitespace_when is base.preserve_whitespace_when
-        assert derived.wrap_attributes_when is base.wrap_attributes_when
-        # Empty dicts are different objects, but both are empty
-        assert derived.reformat_text_when == base.reformat_text_when == {}
-        assert derived.reformat_attribute_when == base.reformat_attribute_when == {}
-        assert derived.escaping_strategy is base.escaping_strategy
-        assert derived.parsing_strategy is base.parsing_strategy
-        assert derived.doctype_strategy is base.doctype_strategy
-        assert derived.attribute_strategy is base.attribute_strategy
-        assert derived.indent_size == base.indent_size
-        assert derived.default_type == base.default_type
+        assert_properties_preserved(derived, base)
 
     def test_derive_replaces_specific_properties(self):
         """Test that derive() replaces only the specified properties."""
@@ -135,47 +152,24 @@ class TestFormatterDerive:
         result = derived.format_str(html)
         assert "HELLO WORLD" in result
 
-    def test_derive_returns_same_type(self):
-        """Test that derive() returns an instance of the same class."""
-        base = Formatter()
-        derived = base.derive()
-        assert type(derived) is Formatter
-        assert isinstance(derived, Formatter)
-
 
 class TestHtml5FormatterDerive:
     """Tests for Html5Formatter.derive() method."""
 
-    def test_derive_preserves_html5_defaults(self):
+    def test_derive_preserves_html5_defaults(self, default_html5_formatter):
         """Test that Html5Formatter.derive() preserves HTML5-specific defaults."""
-        base = Html5Formatter()
+        base = default_html5_formatter
         derived = base.derive()
+        assert derived is not base
 
         # Check that HTML5 defaults are preserved
-        assert derived.block_when is base.block_when
-        assert derived.inline_when is base.inline_when
-        assert derived.preserve_whitespace_when is base.preserve_whitespace_when
-        assert derived.normalize_whitespace_when is base.normalize_whitespace_when
-        assert derived.strip_whitespace_when is base.strip_whitespace_when
-
-    def test_derive_preserves_html5_strategies(self):
-        """Test that HTML5-specific strategies are always preserved."""
-        base = Html5Formatter()
-        derived = base.derive(indent_size=8)
+        assert_properties_preserved(derived, base, DELEGATED_PROPERTIES)
 
-        # HTML5 strategies should be preserved (these are encapsulated)
-        assert isinstance(derived._formatter.escaping_strategy, HtmlEscapingStrategy)
-        assert isinstance(derived._formatter.parsing_strategy, HtmlParsingStrategy)
-        assert isinstance(derived._formatter.doctype_strategy, Html5DoctypeStrategy)
-        assert isinstance(derived._formatter.attribute_strategy, Html5AttributeStrategy)
-        assert derived.indent_size == 8
-
-    def test_derive_extends_html5_block_elements(self):
+    @pytest.mark.integration
+    def test_derive_extends_html5_block_elements(self, default_html5_formatter, extended_html5_block_when):
         """Test extending HTML5 default block elements."""
-        base = Html5Formatter()
-
         # Add custom block elements while preserving HTML5 defaults
-        derived = base.derive(block_when=any_of(base.block_when, tag_in("custom-block", "my-component")))
+        derived = default_html5_formatter.derive(block_when=extended_html5_block_when)
 
         html = "<div>div</div><custom-block>custom</custom-block><span>span</span>"
         result = derived.format_str(html)
@@ -186,18 +180,10 @@ class TestHtml5FormatterDerive:
         # HTML5 inline elements should remain inline
         assert "<span>span</span>" in result
 
-    def test_derive_override_whitespace_preservation(self):
+    def test_derive_override_whitespace_preservation(self, default_html5_formatter, custom_pre_whitespace_predicates):
         """Test overriding whitespace preservation while keeping other HTML5 defaults."""
-        base = Html5Formatter()
-
         # Override to preserve whitespace in custom elements
-        # Note: We need to also override normalize_whitespace_when to exclude our custom element
-        derived = base.derive(
-            preserve_whitespace_when=any_of(base.preserve_whitespace_when, tag_equals("custom-pre")),
-            normalize_whitespace_when=all_of(
-                base.normalize_whitespace_when, lambda root: lambda element: element.tag != "custom-pre"
-            ),
-        )
+        derived = default_html5_formatter.derive(**custom_pre_whitespace_predicates)
 
         html = "<pre>  spaced  </pre><custom-pre>  custom  </custom-pre>"
         result = derived.format_str(html)
@@ -207,29 +193,11 @@ class TestHtml5FormatterDerive:
         # Check that custom-pre content is preserved (whitespace might be normalized differently)
         assert "custom" in result
 
-    def test_derive_returns_html5_formatter(self):
-        """Test that Html5Formatter.derive() returns an Html5Formatter instance."""
-        base = Html5Formatter()
-        derived = base.derive()
-        assert type(derived) is Html5Formatter
-        assert isinstance(derived, Html5Formatter)
-
 
 class TestXmlFormatterDerive:
     """Tests for XmlFormatter.derive() method."""
 
-    def test_derive_preserves_xml_strategies(self):
-        """Test that XML-specific strategies are always preserved."""
-        base = XmlFormatter(block_when=tag_in("section", "article"))
-        derived = base.derive(indent_size=3)
-
-        # XML strategies should be preserved
-        assert isinstance(derived._formatter.escaping_strategy, XmlEscapingStrategy)
-        assert isinstance(derived._formatter.parsing_strategy, XmlParsingStrategy)
-        assert isinstance(derived._formatter.doctype_strategy, XmlDoctypeStrategy)
-        assert isinstance(derived._formatter.attribute_strategy, XmlAttributeStrategy)
-        assert derived.indent_size == 3
-
+    @pytest.mark.integration
     def test_derive_customize_element_classification(self):
         """Test customizing element classification for XML formatter."""
         base = XmlFormatter(
@@ -243,18 +211,7 @@ class TestXmlFormatterDerive:
             inline_when=any_of(base.inline_when, tag_in("bold", "code")),
         )
 
-        xml = cleandoc("""
-            <root>
-                <section>sec</section>
-                <chapter>chap</chapter>
-                <paragraph>para</paragraph>
-                <emphasis>emph</emphasis>
-                <bold>bold</bold>
-                <code>code</code>
-            </root>
-        """)
-
-        result = derived.format_str(xml)
+        result = derived.format_str(MIXED_CLASSIFICATION_XML)
 
         # Block elements should be formatted as blocks
         assert "<section>" in result
@@ -274,16 +231,9 @@ class TestXmlFormatterDerive:
         # This assertion might need adjustment based on actual formatting behavior
         # The main point is that inline elements are treated differently from blocks
 
-    def test_derive_returns_xml_formatter(self):
-        """Test that XmlFormatter.derive() returns an XmlFormatter instance."""
-        base = XmlFormatter()
-        derived = base.derive()
-        assert type(derived) is XmlFormatter
-        assert isinstance(derived, XmlFormatter)
-
-    def test_derive_with_no_initial_predicates(self):
+    def test_derive_with_no_initial_predicates(self, default_xml_formatter):
         """Test deriving from an XmlFormatter with no initial predicates."""
-        base = XmlFormatter()  # No predicates specified
+        base = default_xml_formatter  # No predicates specified
 
         derived = base.derive(
             block_when=tag_in("data", "record"),
@@ -298,44 +248,82 @@ class TestXmlFormatterDerive:
         assert "<record>" in result
 
 
+FORMATTER_CLASSES = [
+    pytest.param(Formatter, id="formatter"),
+    pytest.param(Html5Formatter, id="html5"),
+    pytest.param(XmlFormatter, id="xml"),
+]
+
+# Formatter classes with the strategy types they always use, in the order
+# escaping, parsing, doctype, attribute
+ENCAPSULATED_STRATEGY_CASES = [
+    pytest.param(
+        Html5Formatter,
+        (HtmlEscapingStrategy, HtmlParsingStrategy, Html5DoctypeStrategy, Html5AttributeStrategy),
+        id="html5",
+    ),
+    pytest.param(
+        XmlFormatter,
+        (XmlEscapingStrategy, XmlParsingStrategy, XmlDoctypeStrategy, XmlAttributeStrategy),
+        id="xml",
+    ),
+]
+
+
+class TestDeriveForEachFormatter:
+    """Tests for derive() behaviour shared by Formatter, Html5Formatter and XmlFormatter."""
+
+    @pytest.mark.parametrize("formatter_cls", FORMATTER_CLASSES)
+    def test_derive_returns_same_type(self, formatter_cls):
+        """Test that derive() returns an instance of the same class."""
+        base = formatter_cls()
+        derived = base.derive()
+        assert type(derived) is formatter_cls
+
+    @pytest.mark.parametrize("formatter_cls, expected_strategies", ENCAPSULATED_STRATEGY_CASES)
+    def test_derive_preserves_encapsulated_strategies(self, formatter_cls, expected_strategies):
+        """Test that format-specific strategies are always preserved."""
+        base = formatter_cls()
+        derived = base.derive(indent_size=8)
+
+        # These strategies are encapsulated by the formatter class
+        escaping, parsing, doctype, attribute = expected_strategies
+        assert isinstance(derived._formatter.escaping_strategy, escaping)
+        assert isinstance(derived._formatter.parsing_strategy, parsing)
+        assert isinstance(derived._formatter.doctype_strategy, doctype)
+        assert isinstance(derived._formatter.attribute_strategy, attribute)
+        assert derived.indent_size == 8
+
+
+# Formatter constructor arguments, each expected back from the same-named property
+ACCESSOR_ARGUMENTS = {
+    "block_when": tag_in("div"),
+    "inline_when": tag_in("span"),
+    "normalize_whitespace_when": tag_equals("p"),
+    "strip_whitespace_when": tag_equals("section"),
+    "preserve_whitespace_when": tag_equals("pre"),
+    "wrap_attributes_when": tag_equals("table"),
+    "reformat_text_when": {tag_equals("code"): lambda x: x.upper()},
+    "reformat_attribute_when": {lambda e, n, v: n == "style": lambda x: x.lower()},
+    "indent_size": 3,
+    "default_type": ElementType.INLINE,
+}
+
+
+@pytest.fixture(scope="module")
+def accessor_formatter():
+    """A Formatter built from ACCESSOR_ARGUMENTS."""
+    return Formatter(**ACCESSOR_ARGUMENTS)
+
+
+@pytest.mark.fast
 class TestPropertyAccessors:
     """Test that all property accessors work correctly."""
 
-    def test_formatter_property_accessors(self):
-        """Test all property accessors on base Formatter."""
-        block_pred = tag_in("div")
-        inline_pred = tag_in("span")
-        normalize_pred = tag_equals("p")
-        strip_pred = tag_equals("section")
-        preserve_pred = tag_equals("pre")
-        wrap_pred = tag_equals("table")
-        text_formatters = {tag_equals("code"): lambda x: x.upper()}
-        attr_formatters = {lambda e, n, v: n == "style": lambda x: x.lower()}
-
-        formatter = Formatter(
-            block_when=block_pred,
-            inline_when=inline_pred,
-            normalize_whitespace_when=normalize_pred,
-            strip_whitespace_when=strip_pred,
-            preserve_whitespace_when=preserve_pred,
-            wrap_attributes_when=wrap_pred,
-            reformat_text_when=text_formatters,
-            reformat_attribute_when=attr_formatters,
-            indent_size=3,
-            default_type=ElementType.INLINE,
-        )
-
-        # Test all property accessors
-        assert formatter.block_when is block_pred
-        assert formatter.inline_when is inline_pred
-        assert formatter.normalize_whitespace_when is normalize_pred
-        assert formatter.strip_whitespace_when is strip_pred
-        assert formatter.preserve_whitespace_when is preserve_pred
-        assert formatter.wrap_attributes_when is wrap_pred
-        assert formatter.reformat_text_when is text_formatters
-        assert formatter.reformat_attribute_when is attr_formatters
-        assert formatter.indent_size == 3
-        assert formatter.default_type == ElementType.INLINE
+    @pytest.mark.parametrize("name", ACCESSOR_ARGUMENTS)
+    def test_formatter_property_accessors(self, accessor_formatter, name):
+        """Test that each property accessor on base Formatter returns its constructor argument."""
+        assert getattr(accessor_formatter, name) is ACCESSOR_ARGUMENTS[name]
 
     def test_html5_formatter_property_delegation(self):
         """Test that Html5Formatter properties delegate to internal formatter."""
@@ -1,68 +1,66 @@
 from inspect import cleandoc
 
+import pytest
+
 from helpers.predicates import is_inline, is_block_or_root
 from markuplift import DocumentFormatter
 
 
-def test_no_doctype():
-    example = cleandoc("""
-        <root>
-            <block><inline>Mixed content</inline></block>
-        </root>
-    """)
-    formatter = DocumentFormatter(
-        block_predicate=is_block_or_root,
-        inline_predicate=is_inline,
-    )
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <block><inline>Mixed content</inline></block>
-        </root>
-    """)
-    assert actual == expected
+XHTML_STRICT_DOCTYPE = (
+    '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">'
+)
 
+WITHOUT_DOCTYPE = cleandoc("""
+    <root>
+        <block><inline>Mixed content</inline></block>
+    </root>
+""")
 
-def test_with_doctype_from_string():
-    example = "\n" + cleandoc("""
-        <!DOCTYPE root>
-        <root>
-            <block><inline>Mixed content</inline></block>
-        </root>
-    """)
-    formatter = DocumentFormatter(
-        block_predicate=is_block_or_root,
-        inline_predicate=is_inline,
-    )
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <!DOCTYPE root>
-        <root>
-          <block><inline>Mixed content</inline></block>
-        </root>
-    """)
-    assert actual == expected
+WITHOUT_DOCTYPE_FORMATTED = cleandoc("""
+    <root>
+      <block><inline>Mixed content</inline></block>
+    </root>
+""")
+
+WITH_DOCTYPE = "\n" + cleandoc("""
+    <!DOCTYPE root>
+    <root>
+        <block><inline>Mixed content</inline></block>
+    </root>
+""")
+
+WITH_DOCTYPE_FORMATTED = cleandoc("""
+    <!DOCTYPE root>
+    <root>
+      <block><inline>Mixed content</inline></block>
+    </root>
+""")
+
+WITH_OVERRIDDEN_DOCTYPE_FORMATTED = cleandoc(f"""
+    {XHTML_STRICT_DOCTYPE}
+    <root>
+      <block><inline>Mixed content</inline></block>
+    </root>
+""")
 
+DOCTYPE_CASES = [
+    pytest.param(WITHOUT_DOCTYPE, {}, WITHOUT_DOCTYPE_FORMATTED, id="no-doctype"),
+    pytest.param(WITH_DOCTYPE, {}, WITH_DOCTYPE_FORMATTED, id="doctype-from-string"),
+    pytest.param(
+        WITH_DOCTYPE, {"doctype": XHTML_STRICT_DOCTYPE}, WITH_OVERRIDDEN_DOCTYPE_FORMATTED, id="override-doctype"
+    ),
+]
 
-def test_override_doctype():
-    example = "\n" + cleandoc("""
-        <!DOCTYPE root>
-        <root>
-            <block><inline>Mixed content</inline></block>
-        </root>
-    """)
-    formatter = DocumentFormatter(
+
+@pytest.fixture(scope="module")
+def formatter():
+    return DocumentFormatter(
         block_predicate=is_block_or_root,
         inline_predicate=is_inline,
     )
-    actual = formatter.format_str(
-        example,
-        doctype='<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">',
-    )
-    expected = cleandoc("""
-        <!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">
-        <root>
-          <block><inline>Mixed content</inline></block>
-        </root>
-    """)
+
+
+@pytest.mark.parametrize("example, format_options, expected", DOCTYPE_CASES)
+def test_doctype(formatter, example, format_options, expected):
+    actual = formatter.format_str(example, **format_options)
     assert actual == expected
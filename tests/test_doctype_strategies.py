@@ -5,11 +5,10 @@ and when integrated with formatters to provide appropriate DOCTYPE handling
 for different document formats.
 """
 
+import pytest
 from lxml import etree
 from markuplift import (
     Formatter,
-    Html5Formatter,
-    XmlFormatter,
     DoctypeStrategy,
     Html5DoctypeStrategy,
     XmlDoctypeStrategy,
@@ -17,60 +16,76 @@ from markuplift import (
 )
 
 
-class TestDoctypeStrategyBehaviors:
-    """Test DOCTYPE strategy behaviors in isolation."""
+# Strategies are stateless, so each is built once at import
+DOCTYPE_STRATEGY_CASES = [
+    # HTML5 supplies its DOCTYPE and ensures it is present
+    pytest.param(Html5DoctypeStrategy(), "<!DOCTYPE html>", True, id="html5"),
+    # XML and null strategies neither supply nor ensure a DOCTYPE
+    pytest.param(XmlDoctypeStrategy(), None, False, id="xml"),
+    pytest.param(NullDoctypeStrategy(), None, False, id="null"),
+]
 
-    def test_html5_doctype_strategy(self):
-        """Test Html5DoctypeStrategy behavior."""
-        strategy = Html5DoctypeStrategy()
+TEST_DTD_DOCTYPE = '<!DOCTYPE root SYSTEM "test.dtd">'
 
-        # Should return HTML5 DOCTYPE
-        assert strategy.get_default_doctype() == "<!DOCTYPE html>"
+BARE_DOCTYPE = "<!DOCTYPE root>"
 
-        # Should ensure DOCTYPE presence
-        assert strategy.should_ensure_doctype() is True
 
-    def test_xml_doctype_strategy(self):
-        """Test XmlDoctypeStrategy behavior."""
-        strategy = XmlDoctypeStrategy()
+@pytest.fixture(scope="module")
+def root_tree():
+    """A parsed XML document without a DOCTYPE, shared because formatting never modifies it."""
+    return etree.fromstring(b"<root>content</root>").getroottree()
 
-        # Should return None (no default DOCTYPE)
-        assert strategy.get_default_doctype() is None
 
-        # Should not ensure DOCTYPE presence
-        assert strategy.should_ensure_doctype() is False
+@pytest.fixture(scope="module")
+def root_tree_with_doctype():
+    """A parsed XML document with a SYSTEM DOCTYPE, shared because formatting never modifies it."""
+    return etree.fromstring(TEST_DTD_DOCTYPE.encode() + b"\n<root>content</root>").getroottree()
 
-    def test_null_doctype_strategy(self):
-        """Test NullDoctypeStrategy behavior."""
-        strategy = NullDoctypeStrategy()
 
-        # Should return None (no default DOCTYPE)
-        assert strategy.get_default_doctype() is None
+@pytest.fixture(scope="module")
+def root_tree_with_bare_doctype():
+    """A parsed XML document with a bare DOCTYPE, shared because formatting never modifies it."""
+    return etree.fromstring(BARE_DOCTYPE.encode() + b"\n<root>content</root>").getroottree()
 
-        # Should not ensure DOCTYPE presence
-        assert strategy.should_ensure_doctype() is False
+
+@pytest.fixture(scope="module")
+def div_tree():
+    """A programmatically built <div>content</div> tree, shared because formatting never modifies it."""
+    root = etree.Element("div")
+    root.text = "content"
+    return etree.ElementTree(root)
+
+
+class TestDoctypeStrategyBehaviors:
+    """Test DOCTYPE strategy behaviors in isolation."""
+
+    @pytest.mark.parametrize("strategy, default_doctype, ensures_doctype", DOCTYPE_STRATEGY_CASES)
+    def test_doctype_strategy(self, strategy, default_doctype, ensures_doctype):
+        """Test each strategy's default DOCTYPE and whether it ensures one is present."""
+        assert strategy.get_default_doctype() == default_doctype
+        assert strategy.should_ensure_doctype() is ensures_doctype
 
 
 class TestFormatterDoctypeIntegration:
     """Test DOCTYPE strategies when integrated with formatters."""
 
-    def test_regular_formatter_uses_null_strategy_by_default(self):
+    def test_regular_formatter_uses_null_strategy_by_default(
+        self, default_formatter, root_tree, root_tree_with_bare_doctype
+    ):
         """Test that regular Formatter uses NullDoctypeStrategy by default."""
-        formatter = Formatter()
+        formatter = default_formatter
 
         # Should not automatically add DOCTYPE to complete documents
-        xml = "<root>content</root>"
-        result = formatter.format_str(xml)
+        result = formatter.format_tree(root_tree)
         assert "DOCTYPE" not in result
 
         # Should preserve existing DOCTYPE
-        xml_with_doctype = "<!DOCTYPE root>\n<root>content</root>"
-        result = formatter.format_str(xml_with_doctype)
+        result = formatter.format_tree(root_tree_with_bare_doctype)
         assert "<!DOCTYPE root>" in result
 
-    def test_html5_formatter_uses_html5_strategy_by_default(self):
+    def test_html5_formatter_uses_html5_strategy_by_default(self, default_html5_formatter):
         """Test that Html5Formatter uses Html5DoctypeStrategy by default."""
-        formatter = Html5Formatter()
+        formatter = default_html5_formatter
 
         # HTML parser adds DOCTYPE automatically, but our strategy ensures HTML5 DOCTYPE
         # when formatting complete documents
@@ -82,24 +97,22 @@ class TestFormatterDoctypeIntegration:
         # NOTE: This test may need adjustment based on actual lxml behavior vs strategy behavior
         assert "DOCTYPE" in result
 
-    def test_xml_formatter_preserves_existing_doctype(self):
+    def test_xml_formatter_preserves_existing_doctype(self, default_xml_formatter, root_tree, root_tree_with_doctype):
         """Test that XmlFormatter preserves existing DOCTYPEs."""
-        formatter = XmlFormatter()
+        formatter = default_xml_formatter
 
         # Should not add DOCTYPE to documents without one
-        xml = "<root>content</root>"
-        result = formatter.format_str(xml)
+        result = formatter.format_tree(root_tree)
         assert "DOCTYPE" not in result
 
         # Should preserve existing DOCTYPE
-        xml_with_doctype = '<!DOCTYPE root SYSTEM "test.dtd">\n<root>content</root>'
-        result = formatter.format_str(xml_with_doctype)
-        assert '<!DOCTYPE root SYSTEM "test.dtd">' in result
+        result = formatter.format_tree(root_tree_with_doctype)
+        assert TEST_DTD_DOCTYPE in result
 
-    def test_explicit_doctype_parameter_overrides_strategy(self):
+    def test_explicit_doctype_parameter_overrides_strategy(self, default_html5_formatter, default_xml_formatter):
         """Test that explicit doctype parameter always overrides strategy."""
-        html_formatter = Html5Formatter()
-        xml_formatter = XmlFormatter()
+        html_formatter = default_html5_formatter
+        xml_formatter = default_xml_formatter
 
         test_xml = "<root>content</root>"
         custom_doctype = '<!DOCTYPE root SYSTEM "custom.dtd">'
@@ -117,17 +130,15 @@ class TestFormatterDoctypeIntegration:
         # The strategy doesn't apply when explicitly overridden
         html_formatter.format_str(test_xml, doctype=None)
 
-    def test_subtree_formatting_never_adds_doctype(self):
+    def test_subtree_formatting_never_adds_doctype(self, div_tree):
         """Test that subtree formatting never adds DOCTYPE automatically."""
-        # Create elements programmatically to test subtree formatting
-
-        # Create a standalone element (subtree)
-        element = etree.Element("div")
-        element.text = "content"
+        # Even a strategy that ensures a DOCTYPE must not add one to a subtree
+        formatter = Formatter(doctype_strategy=Html5DoctypeStrategy())
 
         # Format as element (subtree) - should never add DOCTYPE
-        # Note: Element formatting typically doesn't go through tree formatting
-        # This tests the format_element path which should not add DOCTYPEs
+        result = formatter.format_element(div_tree.getroot())
+        assert "DOCTYPE" not in result
+        assert "<div>content</div>" in result
 
     def test_custom_doctype_strategy_injection(self):
         """Test that custom DOCTYPE strategies can be injected."""
@@ -152,25 +163,24 @@ class TestFormatterDoctypeIntegration:
 class TestDoctypeResolutionLogic:
     """Test the DOCTYPE resolution logic in different scenarios."""
 
-    def test_doctype_resolution_precedence(self):
+    def test_doctype_resolution_precedence(self, default_html5_formatter, default_xml_formatter):
         """Test the precedence order of DOCTYPE resolution."""
         # Test with XML that has existing DOCTYPE
         xml_with_doctype = '<!DOCTYPE root SYSTEM "existing.dtd">\n<root>content</root>'
 
         # HTML5 formatter should enforce HTML5 DOCTYPE (should_ensure_doctype=True)
-        html_formatter = Html5Formatter()
-        html_formatter.format_str(xml_with_doctype)
-        # Strategy should enforce HTML5 DOCTYPE even when existing DOCTYPE present
-        # NOTE: Actual behavior depends on implementation details
+        # even when the document already declares a different DOCTYPE
+        result = default_html5_formatter.format_str(xml_with_doctype)
+        assert result.startswith("<!DOCTYPE html>\n")
+        assert "existing.dtd" not in result
 
         # XML formatter should preserve existing DOCTYPE (should_ensure_doctype=False)
-        xml_formatter = XmlFormatter()
-        xml_formatter.format_str(xml_with_doctype)
-        # Should preserve the existing DOCTYPE
+        result = default_xml_formatter.format_str(xml_with_doctype)
+        assert '<!DOCTYPE root SYSTEM "existing.dtd">' in result
 
-    def test_html5_ensures_doctype_behavior(self):
+    def test_html5_ensures_doctype_behavior(self, default_html5_formatter):
         """Test HTML5 strategy ensures DOCTYPE behavior."""
-        formatter = Html5Formatter()
+        formatter = default_html5_formatter
 
         # Document without DOCTYPE should get HTML5 DOCTYPE
         html = "<div>content</div>"
@@ -185,43 +195,40 @@ class TestDoctypeResolutionLogic:
         assert "DOCTYPE" in result
         assert "DOCTYPE" in result2
 
-    def test_xml_preserves_doctype_behavior(self):
+    def test_xml_preserves_doctype_behavior(self, default_xml_formatter, root_tree, root_tree_with_doctype):
         """Test XML strategy preserves DOCTYPE behavior."""
-        formatter = XmlFormatter()
+        formatter = default_xml_formatter
 
         # Document without DOCTYPE should remain without DOCTYPE
-        xml = "<root>content</root>"
-        result = formatter.format_str(xml)
+        result = formatter.format_tree(root_tree)
         assert "DOCTYPE" not in result
 
         # Document with DOCTYPE should preserve it
-        xml_with_doctype = '<!DOCTYPE root SYSTEM "test.dtd">\n<root>content</root>'
-        result2 = formatter.format_str(xml_with_doctype)
-        assert '<!DOCTYPE root SYSTEM "test.dtd">' in result2
+        result2 = formatter.format_tree(root_tree_with_doctype)
+        assert TEST_DTD_DOCTYPE in result2
 
 
 class TestBackwardCompatibility:
     """Test that DOCTYPE strategies maintain backward compatibility."""
 
-    def test_regular_formatter_backward_compatibility(self):
+    def test_regular_formatter_backward_compatibility(self, default_formatter):
         """Test that regular Formatter behavior is unchanged."""
-        formatter = Formatter()
+        formatter = default_formatter
 
-        # Should behave exactly as before (uses NullDoctypeStrategy)
-        test_cases = [
-            "<root>content</root>",
-            "<!DOCTYPE root>\n<root>content</root>",
-            "<!DOCTYPE html>\n<html><body>test</body></html>",
-        ]
+        # Should behave exactly as before (uses NullDoctypeStrategy), so DOCTYPE
+        # handling is decided by the strategy without formatting anything
+        strategy = formatter.doctype_strategy
+        assert isinstance(strategy, NullDoctypeStrategy)
+        assert strategy.get_default_doctype() is None
+        assert strategy.should_ensure_doctype() is False
 
-        for xml in test_cases:
-            result = formatter.format_str(xml)
-            # Should format successfully and preserve/omit DOCTYPE as before
-            assert "<root>" in result or "<html>" in result
+        # One end-to-end check that formatting succeeds and preserves the DOCTYPE
+        result = formatter.format_str("<!DOCTYPE html>\n<html><body>test</body></html>")
+        assert result == "<!DOCTYPE html>\n<html>\n  <body>test</body>\n</html>"
 
-    def test_existing_doctype_parameter_still_works(self):
+    def test_existing_doctype_parameter_still_works(self, default_formatter):
         """Test that existing doctype parameter behavior is preserved."""
-        formatter = Formatter()
+        formatter = default_formatter
 
         xml = "<root>content</root>"
         custom_doctype = '<!DOCTYPE root PUBLIC "test">'
@@ -251,15 +258,10 @@ class TestBackwardCompatibility:
         assert "DOCTYPE" not in result
         assert "<root>content</root>" in result
 
-    def test_tree_formatting_compatibility(self):
+    def test_tree_formatting_compatibility(self, default_html5_formatter, div_tree):
         """Test that tree formatting works with DOCTYPE strategies."""
-        formatter = Html5Formatter()
-
-        # Create tree programmatically
-        root = etree.Element("div")
-        root.text = "content"
-        tree = etree.ElementTree(root)
+        formatter = default_html5_formatter
 
         # Should format successfully
-        result = formatter.format_tree(tree)
+        result = formatter.format_tree(div_tree)
         assert "<div>content</div>" in result
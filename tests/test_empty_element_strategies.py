@@ -12,9 +12,31 @@ from markuplift.empty_element import (
     EmptyElementTagStyle,
     XmlEmptyElementStrategy,
     Html5EmptyElementStrategy,
+    _html5_tag_style,
 )
 
 
+# All 13 HTML5 void elements as per WHATWG spec
+HTML5_VOID_ELEMENTS = (
+    "area", "base", "br", "col", "embed", "hr", "img",
+    "input", "link", "meta", "source", "track", "wbr"
+)
+HTML5_VOID_SET = frozenset(HTML5_VOID_ELEMENTS)
+
+# Common non-void elements that might be empty
+NON_VOID_ELEMENTS = (
+    "script", "style", "div", "span", "p", "title",
+    "textarea", "iframe", "section", "article", "main"
+)
+
+CUSTOM_ELEMENTS = ("my-component", "custom-widget", "x-button")
+
+
+@pytest.fixture(scope="module")
+def html5_strategy():
+    return Html5EmptyElementStrategy()
+
+
 class TestEmptyElementTagStyleEnum:
     """Tests for the EmptyElementTagStyle enum."""
 
@@ -74,83 +96,51 @@ class TestXmlEmptyElementStrategy:
 class TestHtml5EmptyElementStrategy:
     """Tests for HTML5 empty element strategy."""
 
-    # All 13 HTML5 void elements as per WHATWG spec
-    HTML5_VOID_ELEMENTS = [
-        "area", "base", "br", "col", "embed", "hr", "img",
-        "input", "link", "meta", "source", "track", "wbr"
-    ]
-
-    # Common non-void elements that might be empty
-    NON_VOID_ELEMENTS = [
-        "script", "style", "div", "span", "p", "title",
-        "textarea", "iframe", "section", "article", "main"
-    ]
-
-    def test_void_elements_return_void_tag(self):
+    @pytest.mark.parametrize("tag_name", HTML5_VOID_ELEMENTS)
+    def test_void_elements_return_void_tag(self, html5_strategy, tag_name):
         """All 13 HTML5 void elements return VOID_TAG."""
-        strategy = Html5EmptyElementStrategy()
+        assert html5_strategy.tag_style(etree.Element(tag_name)) == EmptyElementTagStyle.VOID_TAG
 
-        for tag_name in self.HTML5_VOID_ELEMENTS:
-            elem = etree.Element(tag_name)
-            result = strategy.tag_style(elem)
-            assert result == EmptyElementTagStyle.VOID_TAG, \
-                f"Expected VOID_TAG for <{tag_name}>, got {result}"
-
-    def test_non_void_elements_return_explicit_tags(self):
+    @pytest.mark.parametrize("tag_name", NON_VOID_ELEMENTS)
+    def test_non_void_elements_return_explicit_tags(self, html5_strategy, tag_name):
         """Common non-void elements return EXPLICIT_TAGS."""
-        strategy = Html5EmptyElementStrategy()
-
-        for tag_name in self.NON_VOID_ELEMENTS:
-            elem = etree.Element(tag_name)
-            result = strategy.tag_style(elem)
-            assert result == EmptyElementTagStyle.EXPLICIT_TAGS, \
-                f"Expected EXPLICIT_TAGS for <{tag_name}>, got {result}"
+        assert html5_strategy.tag_style(etree.Element(tag_name)) == EmptyElementTagStyle.EXPLICIT_TAGS
 
-    def test_custom_elements_return_explicit_tags(self):
+    @pytest.mark.parametrize("tag_name", CUSTOM_ELEMENTS)
+    def test_custom_elements_return_explicit_tags(self, html5_strategy, tag_name):
         """Custom/web component elements return EXPLICIT_TAGS."""
-        strategy = Html5EmptyElementStrategy()
-
-        custom_tags = ["my-component", "custom-widget", "x-button"]
-        for tag_name in custom_tags:
-            elem = etree.Element(tag_name)
-            assert strategy.tag_style(elem) == EmptyElementTagStyle.EXPLICIT_TAGS
+        assert html5_strategy.tag_style(etree.Element(tag_name)) == EmptyElementTagStyle.EXPLICIT_TAGS
 
-    def test_void_elements_with_attributes(self):
+    def test_void_elements_with_attributes(self, html5_strategy):
         """Void elements with attributes still return VOID_TAG."""
-        strategy = Html5EmptyElementStrategy()
-
         img = etree.Element("img")
         img.set("src", "test.jpg")
         img.set("alt", "Test image")
-        assert strategy.tag_style(img) == EmptyElementTagStyle.VOID_TAG
+        assert html5_strategy.tag_style(img) == EmptyElementTagStyle.VOID_TAG
 
         br = etree.Element("br")
         br.set("class", "clearfix")
-        assert strategy.tag_style(br) == EmptyElementTagStyle.VOID_TAG
+        assert html5_strategy.tag_style(br) == EmptyElementTagStyle.VOID_TAG
 
-    def test_case_sensitivity(self):
+    def test_case_sensitivity(self, html5_strategy):
         """HTML5 tags should be lowercase (case-sensitive check)."""
-        strategy = Html5EmptyElementStrategy()
-
         # Lowercase should be void
         br_lower = etree.Element("br")
-        assert strategy.tag_style(br_lower) == EmptyElementTagStyle.VOID_TAG
+        assert html5_strategy.tag_style(br_lower) == EmptyElementTagStyle.VOID_TAG
 
         # Uppercase BR is not in the void set (HTML is case-sensitive in lxml)
         br_upper = etree.Element("BR")
-        assert strategy.tag_style(br_upper) == EmptyElementTagStyle.EXPLICIT_TAGS
+        assert html5_strategy.tag_style(br_upper) == EmptyElementTagStyle.EXPLICIT_TAGS
 
     def test_void_element_count(self):
         """Verify exactly 13 void elements in HTML5."""
-        assert len(self.HTML5_VOID_ELEMENTS) == 13
+        assert len(HTML5_VOID_SET) == 13
 
-    def test_param_not_in_void_elements(self):
+    def test_param_not_in_void_elements(self, html5_strategy):
         """Verify obsolete 'param' element is not in void elements."""
-        strategy = Html5EmptyElementStrategy()
-
         param = etree.Element("param")
         # param is obsolete and should not be treated as void
-        assert strategy.tag_style(param) == EmptyElementTagStyle.EXPLICIT_TAGS
+        assert html5_strategy.tag_style(param) == EmptyElementTagStyle.EXPLICIT_TAGS
 
     def test_all_void_elements_defined(self):
         """Verify all WHATWG-specified void elements are present."""
@@ -158,7 +148,15 @@ class TestHtml5EmptyElementStrategy:
             "area", "base", "br", "col", "embed", "hr", "img",
             "input", "link", "meta", "source", "track", "wbr"
         }
-        assert set(self.HTML5_VOID_ELEMENTS) == expected_void
+        assert HTML5_VOID_SET == expected_void
+
+    def test_tag_style_is_cached_by_tag_name(self, html5_strategy):
+        """Distinct elements with the same tag share one cached lookup."""
+        html5_strategy.tag_style(etree.Element("img"))
+        hits_before = _html5_tag_style.cache_info().hits
+
+        assert html5_strategy.tag_style(etree.Element("img")) == EmptyElementTagStyle.VOID_TAG
+        assert _html5_tag_style.cache_info().hits == hits_before + 1
 
 
 class TestStrategyAbstractBase:
@@ -5,12 +5,46 @@ behave correctly and produce the expected output differences for various
 attribute value scenarios.
 """
 
+from xml.sax.saxutils import escape
+
 import pytest
+from lxml import etree
+
 from markuplift import Formatter, Html5Formatter, XmlFormatter
-from markuplift.escaping import HtmlEscapingStrategy, XmlEscapingStrategy
+from markuplift.escaping import HtmlEscapingStrategy, XmlEscapingStrategy, _quote_attr_xml
 from markuplift.predicates import tag_in
 
 
+JSON_CONFIG_DOCUMENT = """<div data-config='{"theme": "dark", "options": ["a", "b"]}'>content</div>"""
+
+# Pre-escaped attribute values, since the parser expects valid XML
+MIXED_QUOTE_CASES = [
+    ("Simple &quot;double&quot; quotes", 'Simple "double" quotes', "Contains double quotes"),
+    ("Simple 'single' quotes", "Simple 'single' quotes", "Contains single quotes"),
+    ("Both &quot;double&quot; and 'single'", "Both \"double\" and 'single'", "Contains both quote types"),
+    ("No quotes at all", "No quotes at all", "No quotes"),
+]
+
+AMPERSAND_CASES = [
+    ("Tom &amp; Jerry", "Tom & Jerry"),
+    ("A &amp; B &amp; C", "A & B & C"),
+    ("URL with ?param=1&amp;other=2", "URL with ?param=1&other=2"),
+]
+
+
+def _div_document(attribute: str, value: str) -> str:
+    return f'<div {attribute}="{value}">content</div>'
+
+
+@pytest.fixture(scope="module")
+def parsed_documents():
+    """Parse each canonical input document once, keyed by its source text."""
+    sources = [JSON_CONFIG_DOCUMENT]
+    sources += [_div_document("title", input_value) for input_value, _, _ in MIXED_QUOTE_CASES]
+    sources += [_div_document("data-value", input_value) for input_value, _ in AMPERSAND_CASES]
+    return {source: etree.ElementTree(etree.fromstring(source)) for source in sources}
+
+
 class TestEscapingStrategyBehaviors:
     """Test escaping strategy behaviors in isolation."""
 
@@ -60,6 +94,20 @@ class TestEscapingStrategyBehaviors:
         result = strategy.quote_attribute(value_with_newlines)
         assert "&#10;" in result
 
+    def test_xml_quote_attribute_caches_short_values_only(self):
+        """Test that short attribute values are memoized and long ones bypass the cache."""
+        strategy = XmlEscapingStrategy()
+        strategy.quote_attribute("cached value")
+        hits_before = _quote_attr_xml.cache_info().hits
+
+        assert strategy.quote_attribute("cached value") == '"cached value"'
+        assert _quote_attr_xml.cache_info().hits == hits_before + 1
+
+        long_value = "x" * 1000
+        misses_before = _quote_attr_xml.cache_info().misses
+        assert strategy.quote_attribute(long_value) == f'"{long_value}"'
+        assert _quote_attr_xml.cache_info().misses == misses_before
+
     def test_text_escaping_consistency(self):
         """Test that both strategies handle text content escaping consistently."""
         html_strategy = HtmlEscapingStrategy()
@@ -76,6 +124,15 @@ class TestEscapingStrategyBehaviors:
         assert "&lt;" in html_result
         assert "&gt;" in html_result
 
+    @pytest.mark.parametrize(
+        "text",
+        ["plain text", "Tom & Jerry < 5 > 3", "&amp; already escaped", "<<>>&&", ""],
+    )
+    def test_text_escaping_matches_saxutils(self, text):
+        """Test that text escaping is identical to xml.sax.saxutils.escape."""
+        assert XmlEscapingStrategy().escape_text(text) == escape(text)
+        assert HtmlEscapingStrategy().escape_text(text) == escape(text)
+
     def test_comment_escaping_consistency(self):
         """Test comment text escaping behavior."""
         html_strategy = HtmlEscapingStrategy()
@@ -127,20 +184,12 @@ class TestFormatterEscapingDifferences:
         assert "&#10;" in xml_result
         assert "\ncolor: red" not in xml_result
 
-    def test_json_attribute_escaping(self):
+    def test_json_attribute_escaping(self, default_formatter, default_html5_formatter, parsed_documents):
         """Test JSON-like attributes with different escaping strategies."""
-        json_value = '{"theme": "dark", "options": ["a", "b"]}'
-
-        # Regular formatter (XML strategy)
-        xml_formatter = Formatter()
+        tree = parsed_documents[JSON_CONFIG_DOCUMENT]
 
-        # HTML5 formatter
-        html_formatter = Html5Formatter()
-
-        test_xml = f"<div data-config='{json_value}'>content</div>"
-
-        xml_result = xml_formatter.format_str(test_xml)
-        html_result = html_formatter.format_str(test_xml)
+        xml_result = default_formatter.format_tree(tree)
+        html_result = default_html5_formatter.format_tree(tree)
 
         # XML formatter uses smart quoting (single quotes around, preserves double quotes inside)
         assert "data-config='" in xml_result
@@ -149,25 +198,14 @@ class TestFormatterEscapingDifferences:
         # HTML formatter should escape quotes
         assert "&quot;theme&quot;" in html_result
 
-    def test_mixed_quote_scenarios(self):
+    def test_mixed_quote_scenarios(self, default_formatter, default_html5_formatter, parsed_documents):
         """Test various combinations of quotes in attribute values."""
-        # Test cases with pre-escaped XML input since parsers expect valid XML
-        test_cases = [
-            ("Simple &quot;double&quot; quotes", 'Simple "double" quotes', "Contains double quotes"),
-            ("Simple 'single' quotes", "Simple 'single' quotes", "Contains single quotes"),
-            ("Both &quot;double&quot; and 'single'", "Both \"double\" and 'single'", "Contains both quote types"),
-            ("No quotes at all", "No quotes at all", "No quotes"),
-        ]
-
-        xml_formatter = Formatter()  # Uses XML strategy
-        html_formatter = Html5Formatter()
-
-        for input_value, expected_value, description in test_cases:
-            test_xml = f'<div title="{input_value}">content</div>'
+        for input_value, expected_value, description in MIXED_QUOTE_CASES:
+            tree = parsed_documents[_div_document("title", input_value)]
 
             try:
-                xml_result = xml_formatter.format_str(test_xml)
-                html_result = html_formatter.format_str(test_xml)
+                xml_result = default_formatter.format_tree(tree)
+                html_result = default_html5_formatter.format_tree(tree)
 
                 # Both should produce valid, parseable XML/HTML
                 assert "<div" in xml_result
@@ -179,23 +217,18 @@ class TestFormatterEscapingDifferences:
             except Exception as e:
                 pytest.fail(f"Failed to format {description} ('{input_value}'): {e}")
 
-    def test_newline_in_attributes_scenarios(self):
+    def test_newline_in_attributes_scenarios(self, default_formatter, default_html5_formatter):
         """Test handling of newlines in attribute values during output formatting."""
         # We need to test the output formatting, not input parsing
         # Create elements programmatically to test escaping strategies
 
-        from lxml import etree
-
-        xml_formatter = Formatter()  # XML strategy
-        html_formatter = Html5Formatter()  # HTML strategy
-
         # Create element with newline in attribute programmatically
         root = etree.Element("div")
         root.set("style", "line1\nline2")
         tree = etree.ElementTree(root)
 
-        xml_result = xml_formatter.format_tree(tree)
-        html_result = html_formatter.format_tree(tree)
+        xml_result = default_formatter.format_tree(tree)
+        html_result = default_html5_formatter.format_tree(tree)
 
         # XML strategy should escape newlines in output
         assert "&#10;" in xml_result
@@ -203,23 +236,13 @@ class TestFormatterEscapingDifferences:
         # HTML strategy should preserve literal newlines in output
         assert "\n" in html_result or "DOCTYPE" in html_result  # HTML parser might add DOCTYPE
 
-    def test_ampersand_escaping_consistency(self):
+    def test_ampersand_escaping_consistency(self, default_formatter, default_html5_formatter, parsed_documents):
         """Test that ampersands are handled consistently."""
-        # Use properly escaped XML as input since parsers expect valid XML
-        test_cases = [
-            ("Tom &amp; Jerry", "Tom & Jerry"),
-            ("A &amp; B &amp; C", "A & B & C"),
-            ("URL with ?param=1&amp;other=2", "URL with ?param=1&other=2"),
-        ]
+        for input_value, expected_content in AMPERSAND_CASES:
+            tree = parsed_documents[_div_document("data-value", input_value)]
 
-        xml_formatter = Formatter()
-        html_formatter = Html5Formatter()
-
-        for input_value, expected_content in test_cases:
-            test_xml = f'<div data-value="{input_value}">content</div>'
-
-            xml_result = xml_formatter.format_str(test_xml)
-            html_result = html_formatter.format_str(test_xml)
+            xml_result = default_formatter.format_tree(tree)
+            html_result = default_html5_formatter.format_tree(tree)
 
             # Both should handle the ampersands properly
             assert "<div" in xml_result
@@ -232,24 +255,19 @@ class TestFormatterEscapingDifferences:
 class TestBackwardCompatibility:
     """Test that escaping changes maintain backward compatibility where expected."""
 
-    def test_regular_formatter_unchanged_behavior(self):
+    def test_regular_formatter_unchanged_behavior(self, default_formatter):
         """Test that regular Formatter behavior is unchanged for simple cases."""
-        formatter = Formatter()
-
         # Simple XML that should format the same way
         simple_xml = '<root><child attr="simple value">text</child></root>'
-        result = formatter.format_str(simple_xml)
+        result = default_formatter.format_str(simple_xml)
 
         # Should be well-formed and contain expected elements
         assert "<root>" in result
         assert '<child attr="simple value">' in result
         assert "text" in result
 
-    def test_xml_formatter_matches_regular_formatter(self):
+    def test_xml_formatter_matches_regular_formatter(self, default_formatter, default_xml_formatter):
         """Test that XmlFormatter produces identical output to regular Formatter."""
-        regular_formatter = Formatter()
-        xml_formatter = XmlFormatter()
-
         test_cases = [
             "<root>simple</root>",
             '<root attr="value">content</root>',
@@ -258,8 +276,8 @@ class TestBackwardCompatibility:
         ]
 
         for xml in test_cases:
-            regular_result = regular_formatter.format_str(xml)
-            xml_result = xml_formatter.format_str(xml)
+            regular_result = default_formatter.format_str(xml)
+            xml_result = default_xml_formatter.format_str(xml)
 
             # Should produce identical output
             assert regular_result == xml_result
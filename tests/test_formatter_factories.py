@@ -6,142 +6,215 @@ from markuplift.formatter import Formatter
 from markuplift.types import ElementType
 
 
-def test_formatter_with_block_factory():
-    """Test Formatter using a block predicate factory."""
-    example = "<root><div>content</div></root>"
+ROOT_WITH_DIV = "<root><div>content</div></root>"
 
-    def block_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag in ("root", "div")
+ROOT_WITH_DIV_FORMATTED = cleandoc("""
+    <root>
+      <div>content</div>
+    </root>
+""")
 
-    formatter = Formatter(block_when=block_factory)
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <div>content</div>
-        </root>
-    """)
-    assert actual == expected
+HTML_DOCUMENT = "<html><body><div>HTML content</div></body></html>"
 
+HTML_DOCUMENT_FORMATTED = cleandoc("""
+    <html>
+      <body>
+        <div>HTML content</div>
+      </body>
+    </html>
+""")
 
-def test_formatter_with_inline_factory():
-    """Test Formatter using an inline predicate factory."""
-    example = "<root><span>content</span></root>"
+XML_DOCUMENT = "<root><container><item>XML content</item></container></root>"
 
-    def block_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag == "root"
+XML_DOCUMENT_FORMATTED = cleandoc("""
+    <root>
+      <container>
+        <item>XML content</item>
+      </container>
+    </root>
+""")
 
-    def inline_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag == "span"
+# XPath expressions used by the factories below, compiled once per module
+_HAS_CLASS = etree.XPath("//*[@class]")
+_JS_CODE = etree.XPath("//code[@type='javascript']")
+_NS_ELEMENTS = etree.XPath("//ns:*", namespaces={"ns": "http://example.com/ns"})
+_IMPORTANT = etree.XPath("//*[@important='true']")
 
-    formatter = Formatter(block_when=block_factory, inline_when=inline_factory)
-    actual = formatter.format_str(example)
-    expected = "<root><span>content</span></root>"
-    assert actual == expected
 
+# None of the recurring inputs use xml:id or entities, so skip that parser work
+_PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False)
 
-def test_formatter_with_normalize_whitespace_factory():
-    """Test Formatter using a normalize whitespace predicate factory."""
-    example = cleandoc("""
-        <root>
-            <p>Text with    extra   spaces
-            and newlines</p>
-        </root>
-    """)
 
-    def block_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag in ("root", "p")
-
-    def normalize_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag == "p"
-
-    formatter = Formatter(block_when=block_factory, normalize_whitespace_when=normalize_factory)
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <p>Text with extra spaces and newlines</p>
-        </root>
-    """)
-    assert actual == expected
+@pytest.fixture(scope="module")
+def parsed_documents():
+    """Parse each recurring input document once, keyed by its source text."""
+    return {
+        source: etree.ElementTree(etree.fromstring(source, _PARSER))
+        for source in (ROOT_WITH_DIV, HTML_DOCUMENT, XML_DOCUMENT)
+    }
 
 
-def test_formatter_with_preserve_whitespace_factory():
-    """Test Formatter using a preserve whitespace predicate factory."""
-    example = cleandoc("""
-        <root>
-            <pre>  preserved  whitespace  </pre>
-        </root>
-    """)
+def root_factory(root: etree._Element) -> callable:
+    return lambda e: e.tag == "root"
 
-    def block_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag in ("root", "pre")
-
-    def preserve_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag == "pre"
-
-    formatter = Formatter(block_when=block_factory, preserve_whitespace_when=preserve_factory)
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <pre>  preserved  whitespace  </pre>
-        </root>
-    """)
-    assert actual == expected
 
+def div_factory(root: etree._Element) -> callable:
+    return lambda e: e.tag == "div"
 
-def test_formatter_with_strip_whitespace_factory():
-    """Test Formatter using a strip whitespace predicate factory."""
-    example = cleandoc("""
-        <root>
-            <div>   text with spaces   </div>
-        </root>
-    """)
 
-    def block_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag in ("root", "div")
-
-    def strip_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag == "div"
-
-    formatter = Formatter(block_when=block_factory, strip_whitespace_when=strip_factory)
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <div>text with spaces</div>
-        </root>
-    """)
-    assert actual == expected
+def p_factory(root: etree._Element) -> callable:
+    return lambda e: e.tag == "p"
 
 
-def test_formatter_with_wrap_attributes_factory():
-    """Test Formatter using a wrap attributes predicate factory."""
-    example = '<root><div class="test" id="example" data-value="123">content</div></root>'
+def span_factory(root: etree._Element) -> callable:
+    return lambda e: e.tag == "span"
 
-    def block_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag in ("root", "div")
-
-    def wrap_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag == "div"
-
-    formatter = Formatter(block_when=block_factory, wrap_attributes_when=wrap_factory)
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <div
-            class="test"
-            id="example"
-            data-value="123"
-          >content</div>
-        </root>
-    """)
+
+def pre_factory(root: etree._Element) -> callable:
+    return lambda e: e.tag == "pre"
+
+
+def root_and_div_block_factory(root: etree._Element) -> callable:
+    return lambda e: e.tag in {"root", "div"}
+
+
+def root_and_p_block_factory(root: etree._Element) -> callable:
+    return lambda e: e.tag in {"root", "p"}
+
+
+def root_and_pre_block_factory(root: etree._Element) -> callable:
+    return lambda e: e.tag in {"root", "pre"}
+
+
+def root_and_code_block_factory(root: etree._Element) -> callable:
+    return lambda e: e.tag in {"root", "code"}
+
+
+def root_div_and_p_block_factory(root: etree._Element) -> callable:
+    return lambda e: e.tag in {"root", "div", "p"}
+
+
+@pytest.fixture(scope="module")
+def root_and_div_formatter():
+    """A Formatter built once from the stateless root/div block factory."""
+    return Formatter(block_when=root_and_div_block_factory)
+
+
+@pytest.fixture(scope="module")
+def root_with_div_element():
+    """The ROOT_WITH_DIV document built directly as an element, without parsing."""
+    root = etree.Element("root")
+    div = etree.SubElement(root, "div")
+    div.text = "content"
+    return root
+
+
+def test_formatter_with_block_factory_element(root_and_div_formatter, root_with_div_element):
+    """Test Formatter using a block predicate factory on a pre-built element."""
+    actual = root_and_div_formatter.format_element(root_with_div_element)
+    assert actual == ROOT_WITH_DIV_FORMATTED
+
+
+INLINE = "<root><span>content</span></root>"
+
+NORMALIZE_WHITESPACE = cleandoc("""
+    <root>
+        <p>Text with    extra   spaces
+        and newlines</p>
+    </root>
+""")
+
+NORMALIZE_WHITESPACE_FORMATTED = cleandoc("""
+    <root>
+      <p>Text with extra spaces and newlines</p>
+    </root>
+""")
+
+PRESERVE_WHITESPACE = cleandoc("""
+    <root>
+        <pre>  preserved  whitespace  </pre>
+    </root>
+""")
+
+PRESERVE_WHITESPACE_FORMATTED = cleandoc("""
+    <root>
+      <pre>  preserved  whitespace  </pre>
+    </root>
+""")
+
+STRIP_WHITESPACE = cleandoc("""
+    <root>
+        <div>   text with spaces   </div>
+    </root>
+""")
+
+STRIP_WHITESPACE_FORMATTED = cleandoc("""
+    <root>
+      <div>text with spaces</div>
+    </root>
+""")
+
+WRAP_ATTRIBUTES = '<root><div class="test" id="example" data-value="123">content</div></root>'
+
+WRAP_ATTRIBUTES_FORMATTED = cleandoc("""
+    <root>
+      <div
+        class="test"
+        id="example"
+        data-value="123"
+      >content</div>
+    </root>
+""")
+
+SINGLE_FACTORY_CASES = [
+    pytest.param({"block_when": root_and_div_block_factory}, ROOT_WITH_DIV, ROOT_WITH_DIV_FORMATTED, id="block"),
+    pytest.param({"block_when": root_factory, "inline_when": span_factory}, INLINE, INLINE, id="inline"),
+    pytest.param(
+        {"block_when": root_and_p_block_factory, "normalize_whitespace_when": p_factory},
+        NORMALIZE_WHITESPACE,
+        NORMALIZE_WHITESPACE_FORMATTED,
+        id="normalize-whitespace",
+    ),
+    pytest.param(
+        {"block_when": root_and_pre_block_factory, "preserve_whitespace_when": pre_factory},
+        PRESERVE_WHITESPACE,
+        PRESERVE_WHITESPACE_FORMATTED,
+        id="preserve-whitespace",
+    ),
+    pytest.param(
+        {"block_when": root_and_div_block_factory, "strip_whitespace_when": div_factory},
+        STRIP_WHITESPACE,
+        STRIP_WHITESPACE_FORMATTED,
+        id="strip-whitespace",
+    ),
+    pytest.param(
+        {"block_when": root_and_div_block_factory, "wrap_attributes_when": div_factory},
+        WRAP_ATTRIBUTES,
+        WRAP_ATTRIBUTES_FORMATTED,
+        id="wrap-attributes",
+    ),
+]
+
+
+@pytest.mark.parametrize("factories, source, expected", SINGLE_FACTORY_CASES)
+def test_formatter_with_predicate_factory(factories, source, expected):
+    """Test Formatter using each kind of predicate factory."""
+    formatter = Formatter(**factories)
+    actual = formatter.format_str(source)
     assert actual == expected
 
 
+TEXT_FORMATTERS = "<root><code>function(){return true;}</code></root>"
+
+TEXT_FORMATTERS_FORMATTED = cleandoc("""
+    <root>
+      <code>function() { return true; } </code>
+    </root>
+""")
+
+
 def test_formatter_with_text_formatters():
     """Test Formatter using text content formatters with factories."""
-    example = "<root><code>function(){return true;}</code></root>"
-
-    def block_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag in ("root", "code")
 
     def code_factory(root: etree._Element) -> callable:
         return lambda e: e.tag == "code"
@@ -150,57 +223,45 @@ def test_formatter_with_text_formatters():
         # Simple mock formatter that adds spaces around braces
         return text.replace("{", " { ").replace("}", " } ")
 
-    formatter = Formatter(block_when=block_factory, reformat_text_when={code_factory: simple_js_formatter})
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <code>function() { return true; } </code>
-        </root>
-    """)
-    assert actual == expected
+    formatter = Formatter(
+        block_when=root_and_code_block_factory, reformat_text_when={code_factory: simple_js_formatter}
+    )
+    actual = formatter.format_str(TEXT_FORMATTERS)
+    assert actual == TEXT_FORMATTERS_FORMATTED
+
+
+MULTIPLE_FACTORIES = cleandoc("""
+    <root>
+        <div class="container">
+            <p>Text with    spaces</p>
+            <span>inline content</span>
+        </div>
+    </root>
+""")
+
+MULTIPLE_FACTORIES_FORMATTED = cleandoc("""
+    <root>
+      <div
+        class="container"
+      >
+        <p>Text with spaces</p>
+            <span>inline content</span>
+        </div>
+    </root>
+""")
 
 
 def test_formatter_with_multiple_factories():
     """Test Formatter using multiple predicate factories together."""
-    example = cleandoc("""
-        <root>
-            <div class="container">
-                <p>Text with    spaces</p>
-                <span>inline content</span>
-            </div>
-        </root>
-    """)
-
-    def block_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag in ("root", "div", "p")
-
-    def inline_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag == "span"
-
-    def normalize_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag == "p"
-
-    def wrap_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag == "div"
 
     formatter = Formatter(
-        block_when=block_factory,
-        inline_when=inline_factory,
-        normalize_whitespace_when=normalize_factory,
-        wrap_attributes_when=wrap_factory,
+        block_when=root_div_and_p_block_factory,
+        inline_when=span_factory,
+        normalize_whitespace_when=p_factory,
+        wrap_attributes_when=div_factory,
     )
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <div
-            class="container"
-          >
-            <p>Text with spaces</p>
-                <span>inline content</span>
-            </div>
-        </root>
-    """)
-    assert actual == expected
+    actual = formatter.format_str(MULTIPLE_FACTORIES)
+    assert actual == MULTIPLE_FACTORIES_FORMATTED
 
 
 def test_formatter_factory_receives_correct_root():
@@ -211,7 +272,7 @@ def test_formatter_factory_receives_correct_root():
 
     def block_factory(root: etree._Element) -> callable:
         received_roots.append(root.tag)
-        return lambda e: e.tag in ("document", "item")
+        return lambda e: e.tag in {"document", "item"}
 
     formatter = Formatter(block_when=block_factory)
     formatter.format_str(example)
@@ -221,10 +282,8 @@ def test_formatter_factory_receives_correct_root():
     assert received_roots[0] == "document"
 
 
-def test_formatter_with_none_factories():
+def test_formatter_with_none_factories(parsed_documents):
     """Test Formatter with None factory values (should use defaults)."""
-    example = "<root><div>content</div></root>"
-
     formatter = Formatter(
         block_when=None,
         inline_when=None,
@@ -234,15 +293,10 @@ def test_formatter_with_none_factories():
         wrap_attributes_when=None,
         reformat_text_when=None,
     )
-    actual = formatter.format_str(example)
+    actual = formatter.format_tree(parsed_documents[ROOT_WITH_DIV])
 
     # With no predicates, should default to block behavior
-    expected = cleandoc("""
-        <root>
-          <div>content</div>
-        </root>
-    """)
-    assert actual == expected
+    assert actual == ROOT_WITH_DIV_FORMATTED
 
 
 def test_formatter_factory_caching():
@@ -254,7 +308,7 @@ def test_formatter_factory_caching():
     def block_factory(root: etree._Element) -> callable:
         nonlocal call_count
         call_count += 1
-        return lambda e: e.tag in ("root", "div")
+        return lambda e: e.tag in {"root", "div"}
 
     formatter = Formatter(block_when=block_factory)
     formatter.format_str(example)
@@ -263,57 +317,41 @@ def test_formatter_factory_caching():
     assert call_count == 1
 
 
+CUSTOM_DEFAULTS = "<root><unknown>content</unknown></root>"
+
+CUSTOM_DEFAULTS_FORMATTED = cleandoc("""
+    <root>
+        <unknown>content</unknown>
+    </root>
+""")
+
+
 def test_formatter_with_custom_defaults():
     """Test Formatter with custom default settings."""
-    example = "<root><unknown>content</unknown></root>"
-
-    def block_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag == "root"  # Only root is block
 
-    formatter = Formatter(block_when=block_factory, default_type=ElementType.INLINE, indent_size=4)
-    actual = formatter.format_str(example)
+    formatter = Formatter(block_when=root_factory, default_type=ElementType.INLINE, indent_size=4)
+    actual = formatter.format_str(CUSTOM_DEFAULTS)
 
     # Unknown element should be treated as block with 4-space indentation
-    expected = cleandoc("""
-        <root>
-            <unknown>content</unknown>
-        </root>
-    """)
-    assert actual == expected
+    assert actual == CUSTOM_DEFAULTS_FORMATTED
 
 
-def test_formatter_reuse_across_different_documents():
+def test_formatter_reuse_across_different_documents(parsed_documents):
     """Test that a single Formatter instance can efficiently handle multiple different documents."""
 
     def block_factory(root: etree._Element) -> callable:
         # Factory that adapts to different document structures
-        return lambda e: e.tag in ("html", "body", "div", "p", "root", "container", "item")
+        return lambda e: e.tag in {"html", "body", "div", "p", "root", "container", "item"}
 
     formatter = Formatter(block_when=block_factory)
 
     # Test with HTML-like structure
-    html_doc = "<html><body><div>HTML content</div></body></html>"
-    html_result = formatter.format_str(html_doc)
-    expected_html = cleandoc("""
-        <html>
-          <body>
-            <div>HTML content</div>
-          </body>
-        </html>
-    """)
-    assert html_result == expected_html
+    html_result = formatter.format_tree(parsed_documents[HTML_DOCUMENT])
+    assert html_result == HTML_DOCUMENT_FORMATTED
 
     # Test with different XML structure
-    xml_doc = "<root><container><item>XML content</item></container></root>"
-    xml_result = formatter.format_str(xml_doc)
-    expected_xml = cleandoc("""
-        <root>
-          <container>
-            <item>XML content</item>
-          </container>
-        </root>
-    """)
-    assert xml_result == expected_xml
+    xml_result = formatter.format_tree(parsed_documents[XML_DOCUMENT])
+    assert xml_result == XML_DOCUMENT_FORMATTED
 
 
 def test_formatter_factory_called_once_per_document_multi_use():
@@ -325,7 +363,7 @@ def test_formatter_factory_called_once_per_document_multi_use():
         nonlocal call_count
         call_count += 1
         documents_seen.append(root.tag)
-        return lambda e: e.tag in ("root", "div", "html", "body")
+        return lambda e: e.tag in {"root", "div", "html", "body"}
 
     formatter = Formatter(block_when=tracking_block_factory)
 
@@ -345,33 +383,30 @@ def test_formatter_factory_called_once_per_document_multi_use():
     assert documents_seen == ["root", "html", "root"]
 
 
+XPATH_LIKE = '<root><div class="styled">content</div><p>no class</p></root>'
+
+XPATH_LIKE_FORMATTED = cleandoc("""
+    <root>
+      <div
+        class="styled"
+      >content</div>
+      <p>no class</p>
+    </root>
+""")
+
+
 def test_formatter_with_xpath_like_factory():
-    """Test Formatter with factory that simulates XPath-based predicate creation."""
+    """Test Formatter with factory that uses XPath-based predicate creation."""
 
     def xpath_like_factory(root: etree._Element) -> callable:
-        # Simulate XPath evaluation: find all elements with specific attributes
-        elements_with_class = set()
-        for elem in root.iter():
-            if "class" in elem.attrib:
-                elements_with_class.add(elem)
-
+        # Evaluate XPath once per document: find all elements with specific attributes
+        elements_with_class = set(_HAS_CLASS(root))
         return lambda e: e in elements_with_class
 
-    formatter = Formatter(
-        block_when=lambda root: lambda e: e.tag in ("root", "div", "p"), wrap_attributes_when=xpath_like_factory
-    )
+    formatter = Formatter(block_when=root_div_and_p_block_factory, wrap_attributes_when=xpath_like_factory)
 
-    example = '<root><div class="styled">content</div><p>no class</p></root>'
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <div
-            class="styled"
-          >content</div>
-          <p>no class</p>
-        </root>
-    """)
-    assert actual == expected
+    actual = formatter.format_str(XPATH_LIKE)
+    assert actual == XPATH_LIKE_FORMATTED
 
 
 def test_formatter_factory_exception_handling():
@@ -380,7 +415,7 @@ def test_formatter_factory_exception_handling():
     def failing_factory(root: etree._Element) -> callable:
         raise ValueError("Factory failed")
 
-    formatter = Formatter(block_when=lambda root: lambda e: e.tag == "root", normalize_whitespace_when=failing_factory)
+    formatter = Formatter(block_when=root_factory, normalize_whitespace_when=failing_factory)
 
     example = "<root><p>text</p></root>"
 
@@ -389,6 +424,27 @@ def test_formatter_factory_exception_handling():
         formatter.format_str(example)
 
 
+DOCUMENT_SPECIFIC_HTML = "<html><body><div>content</div></body></html>"
+
+DOCUMENT_SPECIFIC_HTML_FORMATTED = cleandoc("""
+    <html>
+      <body>
+        <div>content</div>
+      </body>
+    </html>
+""")
+
+DOCUMENT_SPECIFIC_XML = "<root><container><item>content</item></container></root>"
+
+DOCUMENT_SPECIFIC_XML_FORMATTED = cleandoc("""
+    <root>
+      <container>
+        <item>content</item>
+      </container>
+    </root>
+""")
+
+
 def test_formatter_with_document_specific_predicates():
     """Test that factory predicates can make document-specific decisions."""
 
@@ -396,36 +452,29 @@ def test_formatter_with_document_specific_predicates():
         # Different behavior based on document type
         if root.tag == "html":
             # HTML mode: treat divs and ps as blocks
-            return lambda e: e.tag in ("html", "body", "div", "p")
+            return lambda e: e.tag in {"html", "body", "div", "p"}
         else:
             # XML mode: treat containers and items as blocks
-            return lambda e: e.tag in ("root", "container", "item")
+            return lambda e: e.tag in {"root", "container", "item"}
 
     formatter = Formatter(block_when=document_aware_factory)
 
     # Test HTML document
-    html_doc = "<html><body><div>content</div></body></html>"
-    html_result = formatter.format_str(html_doc)
-    expected_html = cleandoc("""
-        <html>
-          <body>
-            <div>content</div>
-          </body>
-        </html>
-    """)
-    assert html_result == expected_html
+    html_result = formatter.format_str(DOCUMENT_SPECIFIC_HTML)
+    assert html_result == DOCUMENT_SPECIFIC_HTML_FORMATTED
 
     # Test XML document with different structure
-    xml_doc = "<root><container><item>content</item></container></root>"
-    xml_result = formatter.format_str(xml_doc)
-    expected_xml = cleandoc("""
-        <root>
-          <container>
-            <item>content</item>
-          </container>
-        </root>
-    """)
-    assert xml_result == expected_xml
+    xml_result = formatter.format_str(DOCUMENT_SPECIFIC_XML)
+    assert xml_result == DOCUMENT_SPECIFIC_XML_FORMATTED
+
+
+COMPLEX_TEXT_FORMATTERS = cleandoc("""
+    <root>
+        <code type="javascript">var x=1;var y=2;</code>
+        <code type="python">print("hello")</code>
+        <style>body{color:red}div{margin:0}</style>
+    </root>
+""")
 
 
 def test_formatter_complex_text_formatter_factories():
@@ -433,10 +482,7 @@ def test_formatter_complex_text_formatter_factories():
 
     def code_factory(root: etree._Element) -> callable:
         # Find code elements with specific type attributes
-        code_elements = set()
-        for elem in root.iter("code"):
-            if elem.get("type") == "javascript":
-                code_elements.add(elem)
+        code_elements = set(_JS_CODE(root))
         return lambda e: e in code_elements
 
     def css_factory(root: etree._Element) -> callable:
@@ -449,19 +495,11 @@ def test_formatter_complex_text_formatter_factories():
         return text.replace("}", "}\n" + "  " * physical_level)
 
     formatter = Formatter(
-        block_when=lambda root: lambda e: e.tag in ("root", "code", "style"),
+        block_when=lambda root: lambda e: e.tag in {"root", "code", "style"},
         reformat_text_when={code_factory: js_formatter, css_factory: css_formatter},
     )
 
-    example = cleandoc("""
-        <root>
-            <code type="javascript">var x=1;var y=2;</code>
-            <code type="python">print("hello")</code>
-            <style>body{color:red}div{margin:0}</style>
-        </root>
-    """)
-
-    result = formatter.format_str(example)
+    result = formatter.format_str(COMPLEX_TEXT_FORMATTERS)
 
     # Should format JavaScript but not Python code, and should format CSS
     assert "var x=1;\n  var y=2;" in result
@@ -474,14 +512,11 @@ def test_formatter_with_namespace_aware_factory():
 
     def namespace_factory(root: etree._Element) -> callable:
         # Find elements in specific namespaces
-        ns_elements = set()
-        for elem in root.iter():
-            if elem.tag.startswith("{http://example.com/ns}"):
-                ns_elements.add(elem)
+        ns_elements = set(_NS_ELEMENTS(root))
         return lambda e: e in ns_elements
 
     formatter = Formatter(
-        block_when=lambda root: lambda e: e.tag in ("root", "{http://example.com/ns}block"),
+        block_when=lambda root: lambda e: e.tag in {"root", "{http://example.com/ns}block"},
         wrap_attributes_when=namespace_factory,
     )
 
@@ -493,27 +528,26 @@ def test_formatter_with_namespace_aware_factory():
     assert result.count("\n") > 1  # Should have line breaks from attribute wrapping
 
 
+UNFORMATTED_TEXT = "<root><code>unchanged text</code></root>"
+
+UNFORMATTED_TEXT_FORMATTED = cleandoc("""
+    <root>
+      <code>unchanged text</code>
+    </root>
+""")
+
+
 def test_formatter_empty_and_none_text_formatters():
     """Test Formatter behavior with empty and None text formatter dictionaries."""
 
-    def block_factory(root: etree._Element) -> callable:
-        return lambda e: e.tag in ("root", "code")
-
     # Test with empty dict
-    formatter1 = Formatter(block_when=block_factory, reformat_text_when={})
+    formatter1 = Formatter(block_when=root_and_code_block_factory, reformat_text_when={})
 
     # Test with None
-    formatter2 = Formatter(block_when=block_factory, reformat_text_when=None)
-
-    example = "<root><code>unchanged text</code></root>"
-    expected = cleandoc("""
-        <root>
-          <code>unchanged text</code>
-        </root>
-    """)
+    formatter2 = Formatter(block_when=root_and_code_block_factory, reformat_text_when=None)
 
-    assert formatter1.format_str(example) == expected
-    assert formatter2.format_str(example) == expected
+    assert formatter1.format_str(UNFORMATTED_TEXT) == UNFORMATTED_TEXT_FORMATTED
+    assert formatter2.format_str(UNFORMATTED_TEXT) == UNFORMATTED_TEXT_FORMATTED
 
 
 def test_formatter_factory_predicate_consistency():
@@ -521,7 +555,7 @@ def test_formatter_factory_predicate_consistency():
     evaluation_log = []
 
     def logging_factory(root: etree._Element) -> callable:
-        target_elements = {elem for elem in root.iter() if elem.get("important") == "true"}
+        target_elements = set(_IMPORTANT(root))
 
         def predicate(element):
             evaluation_log.append(element.tag)
@@ -529,9 +563,7 @@ def test_formatter_factory_predicate_consistency():
 
         return predicate
 
-    formatter = Formatter(
-        block_when=lambda root: lambda e: e.tag in ("root", "div"), wrap_attributes_when=logging_factory
-    )
+    formatter = Formatter(block_when=root_and_div_block_factory, wrap_attributes_when=logging_factory)
 
     example = '<root><div important="true" class="test">content</div><div>other</div></root>'
     result = formatter.format_str(example)
@@ -1,173 +1,199 @@
 from inspect import cleandoc
 
-
 from helpers.predicates import is_inline, is_block_or_root
 from markuplift import DocumentFormatter
 
 
-def test_formatter_from_indented():
-    example = cleandoc("""
-        <root>
+NESTED_BLOCKS = cleandoc("""
+    <root>
+        <block>
             <block>
-                <block>
-                    text
-                </block>
+                text
             </block>
-        </root>
-    """)
+        </block>
+    </root>
+""")
+
+NESTED_BLOCKS_FORMATTED = cleandoc("""
+    <root>
+      <block>
+        <block>
+                text
+            </block>
+      </block>
+    </root>
+""")
+
+
+def test_formatter_from_indented():
     formatter = DocumentFormatter(block_predicate=is_block_or_root)
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <block>
-            <block>
-                    text
-                </block>
-          </block>
-        </root>
-    """)
-    assert actual == expected
+    actual = formatter.format_str(NESTED_BLOCKS)
+    assert actual == NESTED_BLOCKS_FORMATTED
+
+
+NESTED_INLINES = cleandoc("""
+    <root>
+        <inline><inline>content</inline></inline>
+    </root>
+""")
+
+NESTED_INLINES_FORMATTED = cleandoc("""
+    <root>
+        <inline><inline>content</inline></inline>
+    </root>
+""")
 
 
 def test_formatter_with_inline_from_indented():
-    example = cleandoc("""
-        <root>
-            <inline><inline>content</inline></inline>
-        </root>
-    """)
     formatter = DocumentFormatter(
         block_predicate=is_block_or_root,
         inline_predicate=is_inline,
     )
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-            <inline><inline>content</inline></inline>
-        </root>
-    """)
-    assert actual == expected
+    actual = formatter.format_str(NESTED_INLINES)
+    assert actual == NESTED_INLINES_FORMATTED
+
+
+BLOCK_AND_INLINE = cleandoc("""
+    <root>
+      <block>
+        <inline>text</inline>
+      </block>
+    </root>
+""")
+
+BLOCK_AND_INLINE_FORMATTED = cleandoc("""
+    <root>
+      <block>
+        <inline>text</inline>
+      </block>
+    </root>
+""")
 
 
 def test_formatter_block_and_inline_from_indented():
-    example = cleandoc("""
-        <root>
-          <block>
-            <inline>text</inline>
-          </block>
-        </root>
-    """)
     formatter = DocumentFormatter(block_predicate=is_block_or_root)
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <block>
-            <inline>text</inline>
-          </block>
-        </root>
-    """)
-    assert actual == expected
+    actual = formatter.format_str(BLOCK_AND_INLINE)
+    assert actual == BLOCK_AND_INLINE_FORMATTED
+
+
+INLINE_AND_BLOCK = cleandoc("""
+    <root>
+        <inline><block>text</block></inline>
+    </root>
+""")
+
+INLINE_AND_BLOCK_FORMATTED = cleandoc("""
+    <root>
+        <inline>
+      <block>text</block>
+      </inline>
+    </root>
+""")
 
 
 def test_formatter_inline_and_block_from_indented():
-    example = cleandoc("""
-        <root>
-            <inline><block>text</block></inline>
-        </root>
-    """)
     formatter = DocumentFormatter(
         block_predicate=is_block_or_root,
         inline_predicate=is_inline,
     )
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-            <inline>
-          <block>text</block>
-          </inline>
-        </root>
-    """)
-    assert actual == expected
+    actual = formatter.format_str(INLINE_AND_BLOCK)
+    assert actual == INLINE_AND_BLOCK_FORMATTED
+
+
+MIXED = cleandoc("""
+    <root>
+        <block>before inline <inline>inline content</inline> after inline</block>
+    </root>
+""")
+
+MIXED_FORMATTED = cleandoc("""
+    <root>
+      <block>before inline <inline>inline content</inline> after inline</block>
+    </root>
+""")
 
 
 def test_formatter_mixed_from_indented():
-    example = cleandoc("""
-        <root>
-            <block>before inline <inline>inline content</inline> after inline</block>
-        </root>
-    """)
     formatter = DocumentFormatter(block_predicate=is_block_or_root)
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <block>before inline <inline>inline content</inline> after inline</block>
-        </root>
-    """)
-    assert actual == expected
+    actual = formatter.format_str(MIXED)
+    assert actual == MIXED_FORMATTED
+
+
+MIXED_MULTIPLE = cleandoc("""
+    <root>
+        <block>before inline <inline>inline content</inline> after inline <inline>more inline content</inline> end</block>
+    </root>
+""")
+
+MIXED_MULTIPLE_FORMATTED = cleandoc("""
+    <root>
+      <block>before inline <inline>inline content</inline> after inline <inline>more inline content</inline> end</block>
+    </root>
+""")
 
 
 def test_formatter_mixed_multiple_from_indented():
-    example = cleandoc("""
-        <root>
-            <block>before inline <inline>inline content</inline> after inline <inline>more inline content</inline> end</block>
-        </root>
-    """)
     formatter = DocumentFormatter(block_predicate=is_block_or_root)
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <block>before inline <inline>inline content</inline> after inline <inline>more inline content</inline> end</block>
-        </root>
-    """)
-    assert actual == expected
+    actual = formatter.format_str(MIXED_MULTIPLE)
+    assert actual == MIXED_MULTIPLE_FORMATTED
+
+
+MIXED_MULTIPLE_BLOCKS_AND_INLINES = cleandoc("""
+    <root>
+        <block>before inline <inline>inline content</inline> after inline <inline>more inline content</inline> end</block>
+        <block>second block with <inline>inline content</inline></block>
+    </root>
+""")
+
+MIXED_MULTIPLE_BLOCKS_AND_INLINES_FORMATTED = cleandoc("""
+    <root>
+      <block>before inline <inline>inline content</inline> after inline <inline>more inline content</inline> end</block>
+      <block>second block with <inline>inline content</inline></block>
+    </root>
+""")
 
 
 def test_formatter_mixed_multiple_blocks_and_inlines_from_indented():
-    example = cleandoc("""
-        <root>
-            <block>before inline <inline>inline content</inline> after inline <inline>more inline content</inline> end</block>
-            <block>second block with <inline>inline content</inline></block>
-        </root>
-    """)
     formatter = DocumentFormatter(block_predicate=is_block_or_root)
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <block>before inline <inline>inline content</inline> after inline <inline>more inline content</inline> end</block>
-          <block>second block with <inline>inline content</inline></block>
-        </root>
-    """)
-    assert actual == expected
+    actual = formatter.format_str(MIXED_MULTIPLE_BLOCKS_AND_INLINES)
+    assert actual == MIXED_MULTIPLE_BLOCKS_AND_INLINES_FORMATTED
+
+
+BLOCK_WITH_TAIL_TEXT = cleandoc("""
+    <root>
+        <block>first block</block>some text
+        <block>second block</block>
+    </root>
+""")
+
+BLOCK_WITH_TAIL_TEXT_FORMATTED = cleandoc("""
+    <root>
+      <block>first block</block>
+    some text
+      <block>second block</block>
+    </root>
+""")
 
 
 def test_block_tail_text():
-    example = cleandoc("""
-        <root>
-            <block>first block</block>some text
-            <block>second block</block>
-        </root>
-    """)
     formatter = DocumentFormatter(
         block_predicate=is_block_or_root,
         inline_predicate=is_inline,
     )
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <root>
-          <block>first block</block>
-        some text
-          <block>second block</block>
-        </root>
-    """)
-    assert actual == expected
+    actual = formatter.format_str(BLOCK_WITH_TAIL_TEXT)
+    assert actual == BLOCK_WITH_TAIL_TEXT_FORMATTED
+
+
+INLINE_ROOT = cleandoc("""
+    <inline>some inline content</inline>
+""")
+
+INLINE_ROOT_FORMATTED = cleandoc("""
+    <inline>some inline content</inline>
+""")
 
 
 def test_inline_root_from_indented():
-    example = cleandoc("""
-        <inline>some inline content</inline>
-    """)
     formatter = DocumentFormatter(block_predicate=is_block_or_root)
-    actual = formatter.format_str(example)
-    expected = cleandoc("""
-        <inline>some inline content</inline>
-    """)
-    assert actual == expected
+    actual = formatter.format_str(INLINE_ROOT)
+    assert actual == INLINE_ROOT_FORMATTED
@@ -204,6 +204,17 @@ class TestHtml5Formatter:
         assert "DOCTYPE html" in result
         assert "\n  <p>" in result  # p formatted as block
 
+    def test_html5_formatter_default_predicates_are_shared(self):
+        """Test that formatters built with defaults share the same default predicate factories."""
+        first = Html5Formatter()
+        second = Html5Formatter()
+
+        assert first.block_when is second.block_when
+        assert first.inline_when is second.inline_when
+        assert first.normalize_whitespace_when is second.normalize_whitespace_when
+        assert first.preserve_whitespace_when is second.preserve_whitespace_when
+        assert first.strip_whitespace_when is second.strip_whitespace_when
+
     def test_html5_formatter_whitespace_defaults(self):
         """Test that Html5Formatter uses sensible whitespace defaults."""
         formatter = Html5Formatter()
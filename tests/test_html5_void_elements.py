@@ -5,10 +5,8 @@ elements (single tag, no slash) versus non-void empty elements (explicit tags).
 """
 
 from inspect import cleandoc
-import pytest
 
 from markuplift import Html5Formatter
-from markuplift.predicates import html_block_elements
 
 
 class TestHtml5VoidElements:
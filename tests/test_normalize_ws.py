@@ -0,0 +1,29 @@
+import pytest
+
+from markuplift.utilities import normalize_ws, split_whitespace
+
+
+def test_normalize_ws_collapses_runs_to_single_space():
+    assert normalize_ws("Text with    extra   spaces\n    and newlines") == "Text with extra spaces and newlines"
+
+
+def test_normalize_ws_keeps_one_leading_and_trailing_space():
+    assert normalize_ws("\n    padded\t\t") == " padded "
+
+
+def test_normalize_ws_whitespace_only():
+    assert normalize_ws("\n            ") == " "
+
+
+def test_normalize_ws_empty():
+    assert normalize_ws("") == ""
+
+
+@pytest.mark.parametrize("text", ["a\xa0 b", "a b\u3000", "\x1c\x1d\x1e\x1fa", "a\u2003\u2009b"])
+def test_normalize_ws_treats_unicode_whitespace_like_str_isspace(text):
+    assert normalize_ws(text) == "".join(split_whitespace(text))
+
+
+def test_normalize_ws_long_text():
+    text = "word   " * 100
+    assert normalize_ws(text) == "word " * 100
@@ -1,6 +1,5 @@
 """Tests for SimpleTagScanner source location functionality."""
 
-import pytest
 from markuplift.source_locator import SimpleTagScanner
 
 
@@ -4,7 +4,6 @@ Tests that Html5Formatter with parse_as_xml_when can preserve case-sensitive
 SVG elements like <textPath>, <linearGradient>, etc.
 """
 
-import pytest
 from lxml import etree
 from markuplift import Html5Formatter, tag_in
 
@@ -89,6 +89,10 @@ class TestXmlFormatter:
         tree_result = formatter.format_tree(tree)
         assert "<div>" in tree_result
 
+        # format_element
+        element_result = formatter.format_element(tree.getroot())
+        assert "<div>" in element_result
+
     def test_xml_formatter_vs_regular_formatter(self):
         """Test that XmlFormatter behaves identically to regular Formatter."""
         xml_formatter = XmlFormatter(